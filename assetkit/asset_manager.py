@@ -1,77 +1,965 @@
+import asyncio
+import gc
+import io
+import mimetypes
+import mmap as _mmap
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import IO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 from importlib.resources import files as pkg_files
 
+from assetkit.cache import ContentCache, decompress_to_cache, extract_to_cache
+from assetkit.compression import CODEC_SUFFIXES, CompressedEntry, decompress, load_compressed_manifest, open_decompressed
+from assetkit.index import (
+    DEFAULT_SCAN_WORKERS, AssetIndex, CompactAssetIndex, glob_literal_prefix, scan_dir, scan_tree,
+)
+from assetkit.internal.generators.generate_asset_digests import DIGESTS_FILENAME, hash_stream, load_asset_digests
+from assetkit.internal.generators.generate_asset_index import load_asset_index
+from assetkit.pack import AssetPack
+from assetkit.shared_index import SharedIndex
+from assetkit.verify import VerifyCache, VerifyResult, verify_assets
+from assetkit.ziparchive import ZipArchive
+
+# Marks lazily loaded attributes as not loaded yet (None is a valid loaded value)
+_MISSING = object()
+
+
+def _value_size(value: Union[bytes, str]) -> int:
+    # Cache budgets are in bytes: text counts as its UTF-8 encoding, not its length in characters
+    return len(value.encode("utf-8")) if isinstance(value, str) else len(value)
+
+
+class AssetMetadata(NamedTuple):
+    size: int
+    mtime: Optional[float]
+    suffix: str
+    mime_type: Optional[str]
+
+
+class IndexChanges(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    # Files whose size or mtime changed in place
+    modified: List[str]
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
 
 class AssetFile:
-    def __init__(self, path_obj: Path):
+    __slots__ = ("_path", "_meta", "_metadata", "_cache", "_validate", "_extracted", "_codec", "_digest",
+                 "_extracted_paths")
+
+    def __init__(self, path_obj: Path, meta: Optional[Sequence] = None, cache: Optional[ContentCache] = None,
+                 validate: bool = True, codec: Optional[str] = None,
+                 digest: Optional[Callable[[], Optional[str]]] = None, extracted: Optional[Dict[str, Path]] = None):
+        """
+        :param path_obj: Path (or importlib.resources Traversable) of the asset
+        :param meta: Optional (size, mtime_ns) pair taken from a prebuilt index
+        :param cache: Optional ContentCache shared with the owning AssetManager
+        :param validate: Check size/mtime with a stat before serving cached contents
+        :param codec: Compression codec of the stored file ("gzip", "lzma" or "zlib"); contents are
+                      decompressed on read and meta must describe the decompressed asset
+        :param digest: Returns the recorded digest of the asset (e.g. from the package's digest manifest)
+        :param extracted: {resource: extracted path} shared with the owning AssetManager, so a
+                          non-filesystem asset is extracted once per manager rather than once per AssetFile
+        """
         self._path = path_obj
+        self._meta = meta
+        self._metadata = None
+        self._cache = cache
+        self._validate = validate
+        self._extracted = None
+        self._codec = codec
+        self._digest = digest
+        self._extracted_paths = extracted if extracted is not None else {}
+
+    def metadata(self) -> AssetMetadata:
+        """
+        Return size, mtime, suffix and MIME type without reading the file contents.
+        Filled from the prebuilt index when available, otherwise from a single stat.
+        """
+        if self._metadata is None:
+            name = self.name
+            if self._meta is not None:
+                size, mtime = self._meta[0], self._meta[1] / 1e9
+            elif hasattr(self._path, "stat"):
+                st = self._path.stat()
+                size, mtime = st.st_size, st.st_mtime
+            else:
+                # Traversables without stat() (e.g. zip members) only expose their contents
+                size, mtime = len(self._path.read_bytes()), None
+            self._metadata = AssetMetadata(
+                size=size,
+                mtime=mtime,
+                suffix=Path(name).suffix,
+                mime_type=mimetypes.guess_type(name)[0],
+            )
+        return self._metadata
+
+    @property
+    def name(self) -> str:
+        """File name of the asset (without the suffix added by build-time compression)."""
+        name = self._path.name
+        if self._codec is not None:
+            name = name[:-len(CODEC_SUFFIXES[self._codec])]
+        return name
+
+    @property
+    def size(self) -> int:
+        return self.metadata().size
+
+    @property
+    def mtime(self) -> Optional[float]:
+        return self.metadata().mtime
+
+    @property
+    def suffix(self) -> str:
+        return self.metadata().suffix
+
+    @property
+    def mime_type(self) -> Optional[str]:
+        return self.metadata().mime_type
+
+    def _version(self):
+        if not self._validate:
+            return None
+        st = self._path.stat()
+        return st.st_size, st.st_mtime_ns
+
+    def _cached_read(self, kind: str, reader):
+        if self._cache is None:
+            return reader()
+        key = (str(self._path), kind)
+        version = self._version()
+        value = self._cache.get(key, version)
+        if value is None:
+            value = reader()
+            self._cache.put(key, value, _value_size(value), version)
+        return value
+
+    def open(self, mode: str = "rb", encoding: str = "utf-8", buffering: int = -1) -> IO:
+        """
+        Open the asset as a buffered binary ("rb") or text ("r") stream.
+        Works for filesystem paths and importlib.resources Traversables alike.
+        """
+        if mode not in ("r", "rb"):
+            raise ValueError(f"AssetFile.open: unsupported mode '{mode}' (use 'r' or 'rb')")
+        if isinstance(self._path, Path) and self._codec is None:
+            if mode == "rb":
+                return open(self._path, "rb", buffering=buffering)
+            return open(self._path, "r", encoding=encoding, buffering=buffering)
+
+        stream = self._path.open("rb")
+        if not isinstance(stream, io.BufferedIOBase):
+            stream = io.BufferedReader(stream)
+        if self._codec is not None:
+            # Decompressed incrementally, so large assets are never held in memory whole
+            stream = open_decompressed(stream, self._codec)
+        if mode == "rb":
+            return stream
+        return io.TextIOWrapper(stream, encoding=encoding)
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Yield the asset contents in chunks of at most chunk_size bytes, keeping memory use constant.
+        """
+        if chunk_size <= 0:
+            raise ValueError("AssetFile.iter_chunks: chunk_size must be positive")
+        with self.open("rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        """
+        Read up to length bytes starting at offset. Filesystem assets use positional reads (pread),
+        so concurrent callers never share a file position.
+        """
+        if offset < 0 or length < 0:
+            raise ValueError("AssetFile.read_range: offset and length must be non-negative")
+        if self._codec is not None:
+            # Compressed streams cannot seek: decompress and discard up to offset
+            with self.open("rb") as f:
+                while offset > 0:
+                    skipped = len(f.read(min(offset, 1024 * 1024)))
+                    if not skipped:
+                        return b""
+                    offset -= skipped
+                return f.read(length)
+        if hasattr(self._path, "read_range"):
+            # Pack and zip members read straight from their archive
+            return self._path.read_range(offset, length)
+        if isinstance(self._path, Path) and hasattr(os, "pread"):
+            fd = os.open(self._path, os.O_RDONLY)
+            try:
+                parts = []
+                while length > 0:
+                    chunk = os.pread(fd, length, offset)
+                    if not chunk:
+                        break
+                    parts.append(chunk)
+                    offset += len(chunk)
+                    length -= len(chunk)
+                return b"".join(parts)
+            finally:
+                os.close(fd)
+        with self.open("rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _read_bytes(self) -> bytes:
+        data = self._path.read_bytes()
+        return data if self._codec is None else decompress(data, self._codec)
 
     def text(self) -> str:
-        return self._path.read_text(encoding="utf-8")
+        if self._codec is not None:
+            return self._cached_read("text", lambda: self._read_bytes().decode("utf-8"))
+        return self._cached_read("text", lambda: self._path.read_text(encoding="utf-8"))
 
     def bytes(self) -> bytes:
-        return self._path.read_bytes()
+        return self._cached_read("bytes", self._read_bytes)
+
+    def digest(self) -> str:
+        """
+        BLAKE2b-256 hex digest of the (decompressed) contents. Taken from the package's digest manifest
+        when it lists this asset, without touching the file; otherwise computed with a streaming read.
+        """
+        digest = self._digest() if self._digest is not None else None
+        return digest or hash_stream(lambda: self.open("rb"))
 
     def path(self) -> str:
-        return str(self._path.resolve())
+        """Real filesystem path of the asset; non-filesystem and compressed assets are extracted to the cache dir first."""
+        if isinstance(self._path, Path) and self._codec is None:
+            return str(self._path.resolve())
+        return str(self._local_path())
+
+    def _local_path(self) -> Path:
+        """
+        Filesystem path of the asset, extracting it to the cache dir for zip-installed packages and
+        decompressing it into the size-bounded decompressed cache for compressed assets.
+        """
+        if self._codec is not None:
+            if self._extracted is None or not self._extracted.exists():
+                version = (str(self._path), self._version() or self._meta)
+                self._extracted = decompress_to_cache(lambda: self.open("rb"), self.name, version)
+            return self._extracted
+        if isinstance(self._path, Path):
+            return self._path
+        key = str(self._path)
+        extracted = self._extracted_paths.get(key)
+        if extracted is None or not extracted.exists():
+            # Zip members are named by their identity, so an earlier extraction is found without reading
+            identity = self._path.identity() if hasattr(self._path, "identity") else None
+            extracted = self._extracted_paths[key] = extract_to_cache(self._path, identity=identity)
+        return extracted
+
+    def mmap(self) -> _mmap.mmap:
+        """
+        Return a read-only memory map of the asset. Use it as a context manager to close it:
+
+            with assets["weights.bin"].mmap() as mm:
+                header = mm[:16]
+        """
+        with open(self._local_path(), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Cannot memory-map empty asset: {self._path}")
+            return _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+
+    @contextmanager
+    def memoryview(self) -> Iterator[memoryview]:
+        """
+        Context manager yielding a read-only, zero-copy memoryview of the asset contents.
+        The view and the underlying map are released on exit.
+        """
+        if self._codec is None and hasattr(self._path, "view"):
+            # Pack members are already slices of the pack's map
+            view = self._path.view()
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+        if os.path.getsize(self._local_path()) == 0:
+            yield memoryview(b"")
+            return
+        with self.mmap() as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
 
     def __repr__(self):
-        return f"<AssetFile path='{self.path()}' size={len(self.bytes())} bytes>"
+        # Avoid extracting non-filesystem assets just to print them
+        path = self.path() if isinstance(self._path, Path) and self._codec is None else self._path
+        return f"<AssetFile path='{path}' size={self.size} bytes>"
 
 
 class AssetManager:
-    def __init__(self, package_root: Union[str, Path], resource_dir: str = "resources/assets"):
+    # Shared instances handed out by get(), keyed on (package, resource_dir, backend options)
+    _instances: Dict[tuple, "AssetManager"] = {}
+    _instances_lock = threading.Lock()
+    _instance_locks: Dict[tuple, threading.Lock] = {}
+
+    def __init__(self, package_root: Union[str, Path], resource_dir: str = "resources/assets", lazy: bool = False,
+                 use_index: bool = True, cache: Union[int, ContentCache, None] = None, compact: bool = False,
+                 scan_workers: int = DEFAULT_SCAN_WORKERS, use_pack: Optional[bool] = None):
         """
         Initialize asset manager.
 
         :param package_root: A package name (str) OR filesystem path (Path or str)
         :param resource_dir: Relative resource path (default: "resources/assets")
+        :param lazy: Resolve keys on demand instead of walking the whole tree up front.
+                     Only the directories touched by list()/find() are walked (and memoized).
+        :param use_index: Load the prebuilt assetkit_index.json shipped with the package when it is present
+                          and fresh, instead of walking the tree.
+        :param cache: Opt-in content cache for bytes()/text(): a size limit in bytes or a ContentCache
+                      (which may be shared between managers). Entries are revalidated by size/mtime
+                      in filesystem mode.
+        :param compact: Keep the full index in the array-backed CompactAssetIndex layout (much smaller
+                        for huge packages; lookups become a binary search). Lazy indexes stay growable.
+        :param scan_workers: Threads used to scan filesystem trees with os.scandir (1 scans sequentially)
+        :param use_pack: Serve assets from the package's assetkit_pack.bin. By default the pack is used only
+                         when resource_dir is not a directory on disk, whether the package was opened by
+                         path or by name (so a development tree or editable install keeps serving its
+                         editable files).
         """
+        self._setup(package_root, resource_dir, lazy, cache, compact, scan_workers, use_pack)
+
+        index_type = CompactAssetIndex if compact else AssetIndex
+        if self._archive is not None:
+            index = self._archive.index(self._archive_prefix)
+        else:
+            index = self._load_prebuilt_index() if use_index else None
+        if index is not None:
+            self._index = index_type(self._logical_entries(index))
+            self._walked.add("")
+        elif lazy:
+            self._index = AssetIndex()
+        else:
+            self._index = index_type(self._build_index())
+
+    def _setup(self, package_root, resource_dir: str, lazy: bool, cache, compact: bool, scan_workers: int,
+               use_pack: Optional[bool]):
+        """Open the package and its backend; everything __init__ does except building the index."""
+        # Kept so the manager can be pickled as its arguments instead of its state (see __reduce__)
+        self._options = {"lazy": lazy, "compact": compact, "scan_workers": scan_workers, "use_pack": use_pack}
+        if isinstance(cache, int):
+            cache = ContentCache(max_bytes=cache)
+        self.cache: Optional[ContentCache] = cache
+
+        self._resource_dir = resource_dir.replace("\\", "/").strip("/")
         if isinstance(package_root, (str, Path)) and Path(package_root).exists():
             # Filesystem path mode
-            self._base = Path(package_root).resolve() / resource_dir
-            if not self._base.exists():
-                raise FileNotFoundError(f"AssetManager: Resource directory not found at path: {self._base}")
+            self._filesystem = True
+            self._root = Path(package_root).resolve()
+            self._base = self._root / resource_dir
+            self._package = str(self._root)
         else:
             # Installed package mode
+            self._filesystem = False
+            self._package = getattr(package_root, "__name__", package_root)
             try:
-                self._base = pkg_files(package_root) / resource_dir
+                self._root = pkg_files(package_root)
+                self._base = self._root / resource_dir
             except ModuleNotFoundError:
                 raise RuntimeError(f"AssetManager: Package '{package_root}' is not installed or discoverable")
-            if not self._base.exists():
-                raise FileNotFoundError(f"AssetManager: Resource directory not found in package: {self._base}")
+        # Single-file backends: an asset pack, or the zip a package was imported from
+        self._archive, self._archive_prefix = self._load_pack(use_pack), self._resource_dir
+        if self._archive is None and not self._filesystem:
+            found = ZipArchive.from_traversable(self._base)
+            if found is not None and found[0].is_dir(found[1]):
+                self._archive, self._archive_prefix = found
+        if self._archive is None and not self._base.exists():
+            where = "at path" if self._filesystem else "in package"
+            raise FileNotFoundError(f"AssetManager: Resource directory not found {where}: {self._base}")
+
+        self._lazy = lazy
+        self._scan_workers = scan_workers
+        # Relative directories already walked in lazy mode ("" means the whole tree)
+        self._walked = set()
+        # mtime_ns of every scanned filesystem directory, compared by refresh()
+        self._dir_mtimes: Dict[str, int] = {}
+        # (size, mtime_ns) of files as of the last refresh, which tells in-place edits apart
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+        self._refresh_lock = threading.Lock()
+        self._load_compressed()
+        self._digests = _MISSING
+        self._shared_index: Optional[SharedIndex] = None
+        # {resource: path} of non-filesystem assets already extracted by AssetFile.path()
+        self._extracted: Dict[str, Path] = {}
+
+    @classmethod
+    def get(cls, package_root: Union[str, Path], resource_dir: str = "resources/assets", **kwargs) -> "AssetManager":
+        """
+        Return the process-wide shared manager for a package, building it on first use.
+
+        Every call with the same package, resource_dir and options returns the same instance, so
+        modules that each need the package's assets share one index instead of walking the tree
+        once per import. Construction is serialized per key; different packages build in parallel.
+
+        :param package_root: A package name (str) OR filesystem path (Path or str), as for AssetManager()
+        :param resource_dir: Relative resource path (default: "resources/assets")
+        :param kwargs: Other AssetManager options (lazy, compact, use_pack, ...); part of the key
+        """
+        # Mirror __init__'s mode detection so "pkg", "./pkg" and Path("pkg") share an instance
+        if isinstance(package_root, (str, Path)) and Path(package_root).exists():
+            package = ("path", str(Path(package_root).resolve()))
+        else:
+            package = ("package", str(package_root))
+        key = (package, resource_dir.replace("\\", "/").strip("/"), tuple(sorted(kwargs.items())))
+
+        manager = cls._instances.get(key)
+        if manager is not None:
+            return manager
+        with cls._instances_lock:
+            key_lock = cls._instance_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            manager = cls._instances.get(key)
+            if manager is None:
+                manager = cls(package_root, resource_dir=resource_dir, **kwargs)
+                cls._instances[key] = manager
+        return manager
+
+    @classmethod
+    def clear_instances(cls):
+        """Forget every manager handed out by get(); the next get() builds a fresh one."""
+        with cls._instances_lock:
+            cls._instances.clear()
+            cls._instance_locks.clear()
+
+    def _load_compressed(self):
+        """Read assetkit_compressed.json: which stored files are build-time compressed copies of which keys."""
+        prefix = self._resource_dir + "/"
+        # stored key -> logical key, and logical key -> (stored key, entry)
+        self._compressed: Dict[str, str] = {}
+        self._stored: Dict[str, Tuple[str, CompressedEntry]] = {}
+        for key, entry in load_compressed_manifest(self._root).items():
+            if key.startswith(prefix) and entry.stored.startswith(prefix):
+                logical, stored = key[len(prefix):], entry.stored[len(prefix):]
+                self._compressed[stored] = logical
+                self._stored[logical] = (stored, entry)
+
+    def _logical_entries(self, entries: Dict[str, Optional[Sequence]]) -> Dict[str, Optional[Sequence]]:
+        """Replace stored names of compressed assets by their keys, with the decompressed size as metadata."""
+        if not self._compressed:
+            return entries
+        if len(self._compressed) < len(entries):
+            stored_keys = [k for k in self._compressed if k in entries]
+        else:
+            stored_keys = [k for k in entries if k in self._compressed]
+        for stored in stored_keys:
+            del entries[stored]
+            logical = self._compressed[stored]
+            entry = self._stored[logical][1]
+            entries[logical] = (entry.size, entry.mtime_ns)
+        return entries
+
+    def _load_pack(self, use_pack: Optional[bool]) -> Optional[AssetPack]:
+        # A loose tree on disk (a path, or an editable install opened by name) is the one being edited
+        if use_pack is False or (use_pack is None and isinstance(self._base, Path) and self._base.is_dir()):
+            return None
+        pack = AssetPack.load(self._root)
+        if pack is not None and (self._resource_dir == pack.root or self._resource_dir.startswith(pack.root + "/")):
+            return pack
+        if use_pack:
+            raise FileNotFoundError(f"AssetManager: No asset pack covering '{self._resource_dir}' in: {self._root}")
+        return None
+
+    def _load_prebuilt_index(self) -> Optional[Dict[str, list]]:
+        """
+        Build the index from assetkit_index.json. Returns None when the file is missing, does not
+        cover resource_dir, or (for a resource tree on disk) no longer matches the directory listings.
+
+        For a tree on disk only the keys are taken from the index: a file edited in place keeps its
+        directory listing, so its recorded size and mtime cannot be trusted and come from a stat instead.
+        That holds however the package was opened: a path, or a name whose package lives in a real
+        directory (an editable install, site-packages).
+        """
+        data = load_asset_index(self._root)
+        if data is None:
+            return None
+        root = data.get("root", "")
+        if self._resource_dir != root and not self._resource_dir.startswith(root + "/"):
+            return None
+
+        prefix = self._resource_dir + "/"
+        dirs = [d[len(prefix):] for d in data.get("dirs", []) if d.startswith(prefix)]
+        files = {k[len(prefix):]: v for k, v in data.get("files", {}).items() if k.startswith(prefix)}
+        if isinstance(self._base, Path):
+            if not self._index_is_fresh(dirs, files):
+                return None
+            # The recorded stats are still the baseline refresh() detects in-place edits against
+            self._file_stats = {self._compressed.get(key, key): (v[0], v[1]) for key, v in files.items()}
+            return dict.fromkeys(files)
+        return files
+
+    def _index_is_fresh(self, dirs: List[str], files: Dict[str, list]) -> bool:
+        # Listing each directory costs one readdir per directory and no per-file stat.
+        expected = {"": set()}
+        expected.update((d, set()) for d in dirs)
+        for rel in list(files) + dirs:
+            parent, _, name = rel.rpartition("/")
+            if parent not in expected:
+                return False
+            expected[parent].add(name)
+        for rel_dir, names in expected.items():
+            try:
+                actual = os.listdir(self._base.joinpath(*rel_dir.split("/")) if rel_dir else self._base)
+            except OSError:
+                return False
+            if set(actual) != names:
+                return False
+        return True
+
+    def _make_file(self, key: str, path_obj, meta: Optional[Sequence] = None, codec: Optional[str] = None) -> AssetFile:
+        # Installed package contents are treated as immutable, so only filesystem mode revalidates
+        return AssetFile(path_obj, meta, cache=self.cache, validate=self._filesystem and hasattr(path_obj, "stat"),
+                         codec=codec, digest=partial(self._recorded_digest, key), extracted=self._extracted)
 
-        self._index = self._build_index()
+    def _expected_digests(self) -> Optional[Dict[str, list]]:
+        """{key: [size, digest]} from assetkit_digests.json, loaded on first use (None without a manifest)."""
+        if self._digests is _MISSING:
+            files = load_asset_digests(self._root)
+            prefix = self._resource_dir + "/"
+            self._digests = None if files is None else {
+                k[len(prefix):]: v for k, v in files.items() if k.startswith(prefix)
+            }
+        return self._digests
 
-    def _build_index(self) -> Dict[str, AssetFile]:
+    def _recorded_digest(self, key: str) -> Optional[str]:
+        entry = (self._expected_digests() or {}).get(key)
+        return entry[1] if entry else None
+
+    def _walk(self, path_obj, prefix: str, index: Dict[str, Optional[list]]):
+        if isinstance(path_obj, Path):
+            files, dirs = scan_tree(path_obj, prefix, max_workers=self._scan_workers, mtimes=self._dir_mtimes)
+            self._walked.update(dirs)
+            index.update(dict.fromkeys(files))
+            return
+        # importlib.resources Traversables (e.g. zip members) have no scandir
+        for item in path_obj.iterdir():
+            rel = os.path.join(prefix, item.name).replace("\\", "/")
+            if item.is_dir():
+                self._walked.add(rel)
+                self._walk(item, rel, index)
+            else:
+                index[rel] = None
+
+    def _build_index(self) -> Dict[str, Optional[list]]:
         index = {}
+        self._walk(self._base, "", index)
+        self._walked.add("")
+        return self._logical_entries(index)
+
+    @staticmethod
+    def _split_key(key: str) -> Optional[List[str]]:
+        parts = key.replace("\\", "/").strip("/").split("/")
+        if not key or any(part in ("", ".", "..") for part in parts):
+            return None
+        return parts
+
+    def _is_walked(self, rel_dir: str) -> bool:
+        if "" in self._walked:
+            return True
+        parts = rel_dir.split("/") if rel_dir else []
+        return any("/".join(parts[:i]) in self._walked for i in range(1, len(parts) + 1))
+
+    def _ensure_walked(self, rel_dir: str = ""):
+        """Walk and memoize the subtree under rel_dir (lazy mode only)."""
+        rel_dir = rel_dir.replace("\\", "/").strip("/")
+        if not self._lazy or self._is_walked(rel_dir):
+            return
+        if rel_dir:
+            parts = self._split_key(rel_dir)
+            path_obj = self._base.joinpath(*parts) if parts else None
+            if path_obj is None or not path_obj.is_dir():
+                return
+        else:
+            path_obj = self._base
+        found = {}
+        self._walk(path_obj, rel_dir, found)
+        self._index.update(self._logical_entries(found))
+        self._walked.add(rel_dir)
+
+    def _dir_path(self, rel_dir: str) -> Path:
+        return self._base.joinpath(*rel_dir.split("/")) if rel_dir else self._base
+
+    def refresh(self, stat_files: bool = False, touched: Iterable[str] = ()) -> IndexChanges:
+        """
+        Bring the index up to date with the filesystem and return the keys added, removed and modified.
+
+        Only directories whose mtime changed since they were scanned are listed again (creating,
+        deleting or renaming an entry updates its parent directory's mtime); new subdirectories are
+        scanned in full. The new index is built on the side and swapped in with a single assignment,
+        so concurrent readers see either the old or the new index, never a partial one.
 
-        def walk(path_obj, prefix=""):
-            for item in path_obj.iterdir():
-                rel = os.path.join(prefix, item.name).replace("\\", "/")
-                if item.is_dir():
-                    walk(item, rel)
-                else:
-                    index[rel] = AssetFile(item)
+        Editing a file in place touches neither its directory nor the key set, so files are compared
+        with their (size, mtime_ns) at the previous refresh (or in the prebuilt index): those in
+        rescanned directories, the touched keys, and with stat_files=True every indexed file.
+
+        Installed-package, asset-pack and zip managers are treated as immutable and never change.
+        Lazy managers that have not walked the whole tree simply forget what they memoized and
+        resolve on demand again.
+
+        :param stat_files: Also stat every indexed file (one stat per file) to find in-place edits
+        :param touched: Keys (or stored names) known to have been written, e.g. from inotify events
+        """
+        if not self._filesystem or self._archive is not None:
+            return IndexChanges([], [], [])
+        with self._refresh_lock:
+            self._load_compressed()
+            touched = {self._compressed.get(key, key) for key in touched}
+            if self._lazy and "" not in self._walked:
+                self._index = AssetIndex()
+                self._walked = set()
+                self._dir_mtimes = {}
+                self._file_stats = {}
+                return IndexChanges([], [], [])
+            if "" not in self._dir_mtimes:
+                # Loaded from a prebuilt index: nothing to compare against, so rescan once
+                return self._rescan_all()
+            return self._rescan_changed(stat_files, touched)
+
+    def _swap_index(self, entries: Dict[str, Optional[Sequence]], mtimes: Dict[str, int]):
+        index_type = CompactAssetIndex if isinstance(self._index, CompactAssetIndex) else AssetIndex
+        index = index_type(entries)
+        self._dir_mtimes = mtimes
+        self._walked = set(mtimes)
+        self._index = index
+
+    def _restat(self, keys: Iterable[str]) -> List[str]:
+        """Stat files, record their (size, mtime_ns) and return the keys that differ from the last record."""
+        modified = []
+        for key in keys:
+            stored = self._stored[key][0] if key in self._stored else key
+            try:
+                st = os.stat(self._dir_path(stored))
+            except OSError:
+                continue
+            signature = (st.st_size, st.st_mtime_ns)
+            previous = self._file_stats.get(key)
+            self._file_stats[key] = signature
+            if previous is not None and previous != signature:
+                modified.append(key)
+        return sorted(modified)
+
+    def _file_changes(self, added: List[str], removed: List[str], candidates: Iterable[str]) -> IndexChanges:
+        for key in removed:
+            self._file_stats.pop(key, None)
+        new = set(added)
+        # Added files are stat'ed too, as the baseline for the next refresh
+        modified = [key for key in self._restat(new.union(candidates)) if key not in new]
+        return IndexChanges(sorted(added), sorted(removed), modified)
+
+    def _rescan_all(self) -> IndexChanges:
+        mtimes = {}
+        files, _ = scan_tree(self._base, "", max_workers=self._scan_workers, mtimes=mtimes)
+        old = self._index
+        entries = self._logical_entries(dict.fromkeys(files))
+        added = [key for key in entries if key not in old]
+        removed = [key for key in old if key not in entries]
+        self._swap_index(entries, mtimes)
+        return self._file_changes(added, removed, entries)
+
+    def _rescan_changed(self, stat_files: bool, touched: Iterable[str]) -> IndexChanges:
+        changed = []
+        for rel_dir, mtime in self._dir_mtimes.items():
+            try:
+                current = os.stat(self._dir_path(rel_dir)).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                changed.append(rel_dir)
+        added, removed, rescanned = self._rescan_dirs(changed) if changed else ([], [], [])
 
-        walk(self._base)
-        return index
+        index = self._index
+        candidates = set(rescanned)
+        candidates.update(key for key in touched if index.get(key, _MISSING) is not _MISSING)
+        if stat_files:
+            candidates.update(index.keys())
+        return self._file_changes(added, removed, candidates)
+
+    def _rescan_dirs(self, changed: List[str]) -> Tuple[List[str], List[str], List[str]]:
+        """List the changed directories again; return the keys added, removed, and kept in them."""
+        old = self._index
+        entries = dict(old.items())
+        mtimes = dict(self._dir_mtimes)
+        added, removed, kept = [], [], []
+
+        def drop_subtree(rel_dir):
+            for key in list(old.iter_prefix(rel_dir + "/")):
+                if entries.pop(key, _MISSING) is not _MISSING:
+                    removed.append(key)
+            for d in [d for d in mtimes if d == rel_dir or d.startswith(rel_dir + "/")]:
+                del mtimes[d]
+
+        # Parents first, so subtrees dropped or rescanned by a parent are skipped
+        for rel_dir in sorted(changed, key=lambda d: (d.count("/"), d)):
+            if rel_dir not in mtimes:
+                continue
+            try:
+                files, subdirs, mtimes[rel_dir] = scan_dir(os.fspath(self._dir_path(rel_dir)), rel_dir, True)
+            except OSError:
+                drop_subtree(rel_dir)
+                continue
+            prefix = rel_dir + "/" if rel_dir else ""
+            old_files = {prefix + name for name in old.listdir(rel_dir) if not name.endswith("/")}
+            scanned = self._logical_entries(dict.fromkeys(files))
+            for key in old_files - scanned.keys():
+                del entries[key]
+                removed.append(key)
+            for key in scanned.keys() - old_files:
+                entries[key] = scanned[key]
+                added.append(key)
+            # Replaced by a rename, or edited while the directory changed for another reason
+            kept.extend(old_files & scanned.keys())
+
+            old_dirs = {d for d in mtimes if d and d != rel_dir and d.rpartition("/")[0] == rel_dir}
+            new_dirs = {sub_rel for _, sub_rel in subdirs}
+            for d in old_dirs - new_dirs:
+                drop_subtree(d)
+            for path, sub_rel in subdirs:
+                if sub_rel not in old_dirs:
+                    found, _ = scan_tree(path, sub_rel, max_workers=self._scan_workers, mtimes=mtimes)
+                    found = self._logical_entries(dict.fromkeys(found))
+                    entries.update(found)
+                    added.extend(found)
+
+        self._swap_index(entries, mtimes)
+        return added, removed, kept
+
+    def __reduce__(self):
+        """
+        Pickle as the constructor arguments plus the packed index, never as AssetFile handles, paths or
+        locks. A process-pool worker unpickling the manager opens the package again but does not walk
+        or re-index it; after share_index() only the name of the shared memory block is sent.
+        """
+        index, fully_indexed = self._index, "" in self._walked
+        shared = self._shared_index
+        if shared is not None and shared.index is index:
+            payload = shared.name
+        else:
+            payload = (index if isinstance(index, CompactAssetIndex) else CompactAssetIndex(dict(index.items()))).to_bytes()
+        cache = self.cache.max_bytes if self.cache is not None else None
+        state = (self._package, self._resource_dir, self._options, cache, payload, fully_indexed,
+                 sorted(self._walked), self._dir_mtimes)
+        return AssetManager._from_state, (state,)
+
+    @classmethod
+    def _from_state(cls, state) -> "AssetManager":
+        package, resource_dir, options, cache, payload, fully_indexed, walked, dir_mtimes = state
+        manager = cls.__new__(cls)
+        manager._setup(package, resource_dir, options["lazy"], cache, options["compact"], options["scan_workers"],
+                       options["use_pack"])
+        if isinstance(payload, str):
+            index = SharedIndex.attach(payload)
+        else:
+            index = CompactAssetIndex.from_buffer(payload)
+        # A partially walked lazy index must stay growable
+        manager._index = index if fully_indexed else AssetIndex(dict(index.items()))
+        manager._walked = set(walked)
+        manager._dir_mtimes = dict(dir_mtimes)
+        return manager
+
+    def share_index(self) -> SharedIndex:
+        """
+        Export the index to a shared memory block. Until the index changes (refresh()), pickling this
+        manager sends only the block's name, and workers attach to the parent's tables in place
+        instead of each holding a copy. The caller owns the block: call unlink() (or use the handle as
+        a context manager) once the workers are done.
+        """
+        index = self._index
+        if self._lazy and "" not in self._walked:
+            raise RuntimeError("AssetManager: share_index() needs a fully indexed manager (call list() first)")
+        shared = self._shared_index
+        if shared is None or shared.index is not index or shared.closed:
+            shared = self._shared_index = SharedIndex(index)
+        return shared
+
+    def preload(self, keys: Optional[Iterable[str]] = None, pattern: Optional[str] = None, text: bool = False,
+                max_workers: int = 8, freeze: bool = False) -> int:
+        """
+        Read hot assets into the content cache before forking worker processes, so every forked
+        worker starts with them in memory and shares the pages copy-on-write. Returns the number of
+        bytes loaded.
+
+        :param keys: Asset keys to load
+        :param pattern: Glob pattern of further keys to load (e.g. "models/**")
+        :param text: Cache decoded text (served by text()) instead of bytes
+        :param max_workers: Upper bound on concurrent reads
+        :param freeze: Call gc.freeze() afterwards, so collections in the workers do not touch (and
+                       copy) the pages of the preloaded objects. This freezes every object in the
+                       process, so only opt in from the parent right before it forks
+        """
+        selected = list(keys or [])
+        if pattern is not None:
+            selected.extend(self.iglob(pattern))
+        selected = list(dict.fromkeys(selected))
+        total = sum(self[key].size for key in selected)
+        if self.cache is None:
+            # Files created after this see the cache through _make_file()
+            self.cache = ContentCache(max_bytes=max(total, 1))
+        contents = self.read_many(selected, text=text, max_workers=max_workers)
+        if freeze:
+            gc.freeze()
+        return sum(_value_size(value) for value in contents.values())
+
+    def watch(self, callback=None, interval: float = 1.0, use_inotify: Optional[bool] = None):
+        """
+        Start an AssetWatcher that keeps this manager's index current (see assetkit.watch).
+        callback(changes) is called with the IndexChanges of every refresh that changed something.
+        """
+        from assetkit.watch import AssetWatcher
+        return AssetWatcher(self, callback=callback, interval=interval, use_inotify=use_inotify).start()
+
+    def _resolve(self, key: str) -> Optional[AssetFile]:
+        # The index only holds keys and metadata; AssetFile handles are created on access
+        meta = self._index.get(key, _MISSING)
+        stored, entry = self._stored.get(key, (key, None))
+        codec = entry.codec if entry is not None else None
+        if meta is not _MISSING:
+            if self._archive is not None:
+                return self._make_file(key, self._archive.member(f"{self._archive_prefix}/{stored}"), meta, codec)
+            return self._make_file(key, self._base.joinpath(*stored.split("/")), meta, codec)
+        if not self._lazy or key in self._compressed:
+            return None
+
+        parts = self._split_key(key)
+        if parts is None or self._is_walked("/".join(parts[:-1])):
+            return None
+        path_obj = self._base.joinpath(*stored.split("/"))
+        if not path_obj.is_file():
+            return None
+        meta = (entry.size, entry.mtime_ns) if entry is not None else None
+        self._index.add(key, meta)
+        return self._make_file(key, path_obj, meta, codec)
 
     def __getitem__(self, key: str) -> AssetFile:
-        if key not in self._index:
+        asset = self._resolve(key)
+        if asset is None:
             raise KeyError(f"Asset not found: {key}")
-        return self._index[key]
+        return asset
+
+    def list(self, subdir: str = "") -> List[str]:
+        """
+        List asset keys in sorted order, optionally restricted to those below subdir.
+        """
+        self._ensure_walked(subdir)
+        prefix = subdir.replace("\\", "/").strip("/")
+        if not prefix:
+            return self._index.keys()
+        return list(self._index.iter_prefix(prefix + "/"))
+
+    def find(self, suffix: str, subdir: str = "") -> List[str]:
+        self._ensure_walked(subdir)
+        prefix = subdir.replace("\\", "/").strip("/")
+        keys = self._index.iter_suffix(suffix)
+        if prefix:
+            keys = (k for k in keys if k.startswith(prefix + "/"))
+        return list(keys)
+
+    def iglob(self, pattern: str, after: Optional[str] = None) -> Iterator[str]:
+        """
+        Iterate over keys matching a glob pattern (e.g. "configs/**/*.yaml") in sorted order.
+
+        :param after: Resume after this key (cursor from the previous page)
+        """
+        self._ensure_walked(glob_literal_prefix(pattern))
+        return self._index.iter_glob(pattern, after=after)
+
+    def glob(self, pattern: str, limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """
+        Keys matching a glob pattern. Pass limit/after to page through large result sets.
+        """
+        return list(islice(self.iglob(pattern, after=after), limit))
+
+    def iprefix(self, prefix: str, after: Optional[str] = None) -> Iterator[str]:
+        """
+        Iterate over keys starting with prefix (e.g. "models/") in sorted order.
+        """
+        self._ensure_walked(prefix.rpartition("/")[0])
+        return self._index.iter_prefix(prefix, after=after)
 
-    def list(self) -> List[str]:
-        return list(self._index.keys())
+    def prefix(self, prefix: str, limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """
+        Keys starting with prefix. Pass limit/after to page through large result sets.
+        """
+        return list(islice(self.iprefix(prefix, after=after), limit))
 
-    def find(self, suffix: str) -> List[str]:
-        return [k for k in self._index if k.endswith(suffix)]
+    def listdir(self, rel_dir: str = "") -> List[str]:
+        """
+        Immediate children of a directory; subdirectories are returned with a trailing "/".
+        """
+        self._ensure_walked(rel_dir)
+        return self._index.listdir(rel_dir.replace("\\", "/"))
 
     def __contains__(self, key: str) -> bool:
-        return key in self._index
+        return self._resolve(key) is not None
+
+    def verify(self, max_workers: int = 8, use_cache: bool = True) -> VerifyResult:
+        """
+        Check every asset against the package's digest manifest (assetkit_digests.json).
+
+        Files are hashed in parallel with streaming reads. Results for filesystem files are cached
+        on (device, inode, size, mtime), so re-verifying an unchanged package does no hashing.
+
+        :param max_workers: Files hashed concurrently
+        :param use_cache: Reuse and update the on-disk verification cache
+        :return: VerifyResult (truthy when nothing is missing or mismatched)
+        """
+        expected = self._expected_digests()
+        if expected is None:
+            raise FileNotFoundError(f"AssetManager: No {DIGESTS_FILENAME} in package: {self._root}")
+        cache = VerifyCache() if use_cache else None
+        return verify_assets(self, expected, max_workers=max_workers, cache=cache)
+
+    def read_many(self, keys: Iterable[str], text: bool = False, max_workers: int = 8) -> Dict[str, Union[bytes, str]]:
+        """
+        Read several assets concurrently on a thread pool and return {key: contents}.
+
+        :param keys: Asset keys to read; all must exist (KeyError is raised before any I/O otherwise)
+        :param text: Return decoded text instead of bytes
+        :param max_workers: Upper bound on concurrent reads
+        """
+        assets = {key: self[key] for key in keys}
+        read = (lambda asset: asset.text()) if text else (lambda asset: asset.bytes())
+        if len(assets) <= 1 or max_workers <= 1:
+            return {key: read(asset) for key, asset in assets.items()}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(assets)), thread_name_prefix="assetkit-read") as pool:
+            return dict(zip(assets, pool.map(read, assets.values())))
+
+    async def aread(self, key: str, text: bool = False) -> Union[bytes, str]:
+        """
+        Read one asset without blocking the event loop (file I/O runs in the loop's default executor).
+        """
+        asset = self[key]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, asset.text if text else asset.bytes)
+
+    async def aread_many(self, keys: Iterable[str], text: bool = False) -> Dict[str, Union[bytes, str]]:
+        """
+        Read several assets concurrently from a coroutine and return {key: contents}.
+        """
+        assets = {key: self[key] for key in keys}
+        loop = asyncio.get_running_loop()
+        contents = await asyncio.gather(
+            *(loop.run_in_executor(None, asset.text if text else asset.bytes) for asset in assets.values())
+        )
+        return dict(zip(assets, contents))
 
     def __repr__(self):
+        if self._archive is not None:
+            kind = "packed" if isinstance(self._archive, AssetPack) else "zipped"
+            return f"<AssetManager {len(self._index)} assets, {kind}>"
+        if self._lazy and "" not in self._walked:
+            return f"<AssetManager lazy, {len(self._index)} assets indexed>"
         return f"<AssetManager {len(self._index)} assets>"
@@ -0,0 +1,200 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, NamedTuple, Optional, Union
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory for on-disk AssetKit caches: $ASSETKIT_CACHE_DIR, else $XDG_CACHE_HOME/assetkit,
+    else ~/.cache/assetkit.
+    """
+    override = os.environ.get("ASSETKIT_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "assetkit"
+
+
+def extract_to_cache(path_obj, cache_dir: Union[str, Path, None] = None, chunk_size: int = 1024 * 1024,
+                     identity: Optional[Hashable] = None) -> Path:
+    """
+    Copy a non-filesystem resource (e.g. a zip member Traversable) into a file under
+    cache_dir/extracted and return its path, so every process maps the same page-cache copy.
+
+    With identity (e.g. ZipMember.identity()), the file is named after it and an existing copy is
+    returned without reading the resource. Otherwise the file is content-addressed, which means
+    reading and hashing the whole resource on every call.
+    """
+    root = Path(cache_dir) if cache_dir else default_cache_dir()
+    extracted = root / "extracted"
+    extracted.mkdir(parents=True, exist_ok=True)
+    suffix = Path(path_obj.name).suffix
+
+    target = None
+    if identity is not None:
+        target = extracted / (hashlib.blake2b(repr(identity).encode("utf-8"), digest_size=16).hexdigest() + suffix)
+        if target.exists():
+            return target
+
+    digest = hashlib.blake2b(digest_size=32) if target is None else None
+    fd, tmp_name = tempfile.mkstemp(dir=extracted, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as dst, path_obj.open("rb") as src:
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                if digest is not None:
+                    digest.update(chunk)
+                dst.write(chunk)
+        if target is None:
+            target = extracted / (digest.hexdigest() + suffix)
+        if target.exists():
+            os.unlink(tmp_name)
+        else:
+            os.replace(tmp_name, target)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return target
+
+
+DEFAULT_DECOMPRESSED_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def prune_cache_dir(directory: Union[str, Path], max_bytes: int, keep: Optional[Path] = None):
+    """
+    Delete the least recently used files (by mtime) in directory until it holds at most max_bytes.
+    keep is never deleted, even when it alone exceeds the budget.
+    """
+    entries = []
+    total = 0
+    with os.scandir(directory) as items:
+        for item in items:
+            if item.name.startswith(".tmp-") or not item.is_file():
+                continue
+            st = item.stat()
+            entries.append((st.st_mtime_ns, st.st_size, item.path))
+            total += st.st_size
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.samefile(path, keep):
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def decompress_to_cache(open_stream, name: str, version: Hashable, cache_dir: Union[str, Path, None] = None,
+                        max_bytes: int = DEFAULT_DECOMPRESSED_CACHE_BYTES, chunk_size: int = 1024 * 1024) -> Path:
+    """
+    Return the path of a decompressed copy of an asset under cache_dir/decompressed, writing it on
+    first use. open_stream() must return a decompressing binary stream; version identifies the
+    stored file (e.g. its path, size and mtime) so a rebuilt asset gets a new entry.
+    The directory is kept under max_bytes by evicting the least recently used copies.
+    """
+    root = Path(cache_dir) if cache_dir else default_cache_dir()
+    decompressed = root / "decompressed"
+    decompressed.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.blake2b(repr(version).encode("utf-8"), digest_size=16).hexdigest()
+    target = decompressed / (digest + Path(name).suffix)
+    if target.exists():
+        # Mark as recently used for the LRU eviction in prune_cache_dir()
+        os.utime(target)
+        return target
+
+    fd, tmp_name = tempfile.mkstemp(dir=decompressed, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as dst, open_stream() as src:
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                dst.write(chunk)
+        os.replace(tmp_name, target)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    prune_cache_dir(decompressed, max_bytes, keep=target)
+    return target
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class ContentCache:
+    """
+    Thread-safe LRU cache for asset contents, bounded by the total size of the cached values.
+
+    Entries carry a version token (e.g. (size, mtime_ns) from a stat); a lookup with a
+    different version is treated as a miss and drops the stale entry.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError("ContentCache: max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, version: Any = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, size: int, version: Any = None):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (version, value, size)
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                old_key = next(iter(self._entries))
+                self._remove(old_key)
+                self._evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self._current_bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def __repr__(self):
+        return f"<ContentCache {self._current_bytes}/{self.max_bytes} bytes, {len(self._entries)} entries>"
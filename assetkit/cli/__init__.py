@@ -8,6 +8,10 @@ def main():
     from assetkit.internal.cli.load_docker_image import register_load_docker_image_command
     from assetkit.internal.cli.export_package import register_export_package_command
     from assetkit.internal.cli.combine_packages import register_combine_command  # ✅ NEW
+    from assetkit.internal.cli.discover import register_discover_command
+    from assetkit.internal.cli.compress import register_compress_command
+    from assetkit.internal.cli.verify import register_verify_command
+    from assetkit.internal.cli.apply_delta import register_apply_command
 
     parser = argparse.ArgumentParser(prog="assetkit", description="AssetKit CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -18,6 +22,10 @@ def main():
     register_load_docker_image_command(subparsers)
     register_export_package_command(subparsers)
     register_combine_command(subparsers)  # ✅ NEW LINE
+    register_discover_command(subparsers)
+    register_compress_command(subparsers)
+    register_verify_command(subparsers)
+    register_apply_command(subparsers)
 
     args = parser.parse_args()
     if hasattr(args, "func"):
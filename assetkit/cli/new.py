@@ -4,6 +4,9 @@ from pathlib import Path
 import sys
 
 from assetkit.internal.generators.generate_asset_map import generate_asset_mapping  # ✅ Updated
+from assetkit.internal.generators.generate_asset_digests import generate_asset_digests
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+from assetkit.internal.generators.generate_asset_pack import generate_asset_pack
 
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "asset_package"
 
@@ -27,6 +30,11 @@ def register_new_command(subparsers):
         action="store_true",
         help="Generate a reusable Python asset mapping file (assets.py)"
     )
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Ship assets as a single assetkit_pack.bin instead of individual package-data files"
+    )
     parser.add_argument(
         "--target-dir",
         type=str,
@@ -36,6 +44,24 @@ def register_new_command(subparsers):
     parser.set_defaults(func=create_new_project)
 
 
+def ship_pack_only(target_path: Path, project_name: str):
+    """
+    Drop the individual resources/ files from the package data, so wheels only carry the pack.
+    The loose files stay in the source tree for editing; rerun the pack generator after changes.
+    """
+    setup_cfg = target_path / "setup.cfg"
+    if setup_cfg.exists():
+        lines = setup_cfg.read_text().splitlines(keepends=True)
+        setup_cfg.write_text("".join(line for line in lines if not line.strip().startswith("resources/")))
+    pyproject = target_path / "pyproject.toml"
+    if pyproject.exists():
+        pyproject.write_text(pyproject.read_text().replace(', "resources/**/*"', ""))
+    manifest = target_path / "MANIFEST.in"
+    if manifest.exists():
+        lines = manifest.read_text().splitlines(keepends=True)
+        manifest.write_text("".join(line for line in lines if f"{project_name}/resources" not in line))
+
+
 def create_new_project(args):
     project_name = args.name
     asset_files = args.add
@@ -97,6 +123,25 @@ def create_new_project(args):
                 copied_assets.append(dest_dir)
                 print(f"[AssetKit DEBUG] Added directory asset: {src_path} -> {dest_dir}")
 
+    # Prebuilt index so AssetManager can start without walking resources/
+    try:
+        generate_asset_index(package_path=new_package_dir, resource_root="resources")
+    except Exception as e:
+        print(f"[AssetKit ERROR] Failed to generate asset index: {e}")
+
+    # Digest manifest for 'assetkit verify' and AssetFile.digest()
+    try:
+        generate_asset_digests(package_path=new_package_dir, resource_root="resources")
+    except Exception as e:
+        print(f"[AssetKit ERROR] Failed to generate asset digests: {e}")
+
+    if getattr(args, "pack", False):
+        try:
+            generate_asset_pack(package_path=new_package_dir, resource_root="resources")
+            ship_pack_only(target_path, project_name)
+        except Exception as e:
+            print(f"[AssetKit ERROR] Failed to generate asset pack: {e}")
+
     # ✅ Generate asset map after copying assets
     if gen_assets_py_flag:
         output_path = new_package_dir / "assets.py"
@@ -0,0 +1,263 @@
+import gzip
+import io
+import json
+import lzma
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Deque, Dict, NamedTuple, Optional
+
+COMPRESSED_MANIFEST = "assetkit_compressed.json"
+COMPRESSED_MANIFEST_VERSION = 1
+
+# codec name -> suffix appended to the stored file
+CODEC_SUFFIXES = {"gzip": ".gz", "lzma": ".xz", "zlib": ".zz"}
+
+# Formats that are already compressed; recompressing them only costs CPU
+COMPRESSED_SUFFIXES = {
+    ".gz", ".tgz", ".xz", ".txz", ".bz2", ".lz4", ".zst", ".zip", ".7z", ".rar", ".whl", ".jar", ".npz",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".heic", ".mp3", ".mp4", ".m4a", ".ogg", ".opus",
+    ".webm", ".mkv", ".mov", ".flac", ".pdf", ".woff", ".woff2", ".docx", ".xlsx", ".pptx", ".parquet",
+}
+_COMPRESSED_MAGIC = (
+    b"\x1f\x8b",                # gzip
+    b"\xfd7zXZ\x00",            # xz
+    b"BZh",                     # bzip2
+    b"PK\x03\x04",              # zip (and docx/jar/whl/npz)
+    b"\x28\xb5\x2f\xfd",        # zstd
+    b"\x89PNG",                 # png
+    b"\xff\xd8\xff",            # jpeg
+    b"GIF8",                    # gif
+    b"7z\xbc\xaf\x27\x1c",      # 7z
+)
+
+
+class CompressedEntry(NamedTuple):
+    codec: str
+    stored: str
+    size: int
+    compressed_size: int
+    mtime_ns: int
+
+
+def is_compressed_format(name: str, head: bytes = b"") -> bool:
+    """True if a file is already compressed, judged by its suffix or its leading magic bytes."""
+    suffix = name[name.rfind("."):].lower() if "." in name else ""
+    return suffix in COMPRESSED_SUFFIXES or head.startswith(_COMPRESSED_MAGIC)
+
+
+def load_compressed_manifest(package_root) -> Dict[str, CompressedEntry]:
+    """
+    Load {package-relative key: CompressedEntry} from a package root (Path or Traversable).
+    Returns an empty mapping when the package has no compressed assets.
+    """
+    manifest = package_root / COMPRESSED_MANIFEST
+    try:
+        if not manifest.is_file():
+            return {}
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != COMPRESSED_MANIFEST_VERSION:
+        return {}
+    return {key: CompressedEntry(**entry) for key, entry in data.get("assets", {}).items()}
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+class _ZlibReader(io.RawIOBase):
+    """Streaming reader for raw zlib data, which (unlike gzip/lzma) has no file object in the stdlib."""
+
+    def __init__(self, raw: IO[bytes], chunk_size: int = 64 * 1024):
+        self._raw = raw
+        self._decompressor = zlib.decompressobj()
+        self._pending = b""
+        self._chunk_size = chunk_size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending:
+            if self._decompressor.eof:
+                return 0
+            # Input held back by max_length goes first, so output stays bounded and in order
+            data = self._decompressor.unconsumed_tail or self._raw.read(self._chunk_size)
+            if not data:
+                raise EOFError("Compressed zlib stream ended before the end-of-stream marker")
+            self._pending = self._decompressor.decompress(data, self._chunk_size)
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+
+class _ClosingReader(io.RawIOBase):
+    """Reads from a decompressing stream and closes the underlying raw stream with it."""
+
+    def __init__(self, stream: IO[bytes], raw: IO[bytes]):
+        self._stream = stream
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        return self._stream.readinto(b)
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                self._raw.close()
+        super().close()
+
+
+def open_decompressed(raw: IO[bytes], codec: str) -> IO[bytes]:
+    """
+    Wrap a binary stream of compressed data in a streaming, buffered decompressing reader.
+    Closing the reader closes raw.
+    """
+    if codec == "gzip":
+        return io.BufferedReader(_ClosingReader(gzip.GzipFile(fileobj=raw, mode="rb"), raw))
+    if codec == "lzma":
+        return io.BufferedReader(_ClosingReader(lzma.LZMAFile(raw, mode="rb"), raw))
+    if codec == "zlib":
+        return io.BufferedReader(_ZlibReader(raw))
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def open_compressor(dst: IO[bytes], codec: str, level: Optional[int] = None) -> IO[bytes]:
+    """Writable stream that compresses into dst; closing it finishes the stream but leaves dst open."""
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=9 if level is None else level, mtime=0)
+    if codec == "lzma":
+        return lzma.LZMAFile(dst, mode="wb", preset=level)
+    if codec == "zlib":
+        return _ZlibWriter(dst, -1 if level is None else level)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+class _ZlibWriter(io.RawIOBase):
+    def __init__(self, dst: IO[bytes], level: int):
+        self._dst = dst
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._dst.write(self._compressor.compress(b))
+        return len(b)
+
+    def close(self):
+        if not self.closed:
+            self._dst.write(self._compressor.flush())
+        super().close()
+
+
+# Uncompressed input per deflate block of ParallelGzipWriter, and the window primed from the previous block
+PARALLEL_GZIP_BLOCK_SIZE = 1024 * 1024
+_DEFLATE_WINDOW = 32 * 1024
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    Writable gzip stream compressed on a thread pool, in the style of pigz.
+
+    Input is cut into fixed-size blocks that are deflated concurrently (zlib releases the GIL), each
+    primed with the last 32 KiB of the block before it so the ratio stays close to single-stream gzip.
+    Blocks end on a sync flush and are written in order behind one gzip header, so the result is a
+    single ordinary gzip member that gzip, tar and Python's gzip module read as usual. Closing the
+    writer finishes the stream but leaves dst open.
+    """
+
+    def __init__(self, dst: IO[bytes], level: int = 6, jobs: Optional[int] = None,
+                 block_size: int = PARALLEL_GZIP_BLOCK_SIZE):
+        """
+        :param dst: Binary stream the gzip data is written to
+        :param level: zlib compression level (1-9)
+        :param jobs: Compression threads (default: one per CPU); 1 compresses inline
+        :param block_size: Uncompressed bytes per block
+        """
+        if not 0 <= level <= 9:
+            raise ValueError(f"gzip compression level must be between 0 and 9, not {level}")
+        self._dst = dst
+        self._level = level
+        self._jobs = max(1, jobs or os.cpu_count() or 1)
+        self._block_size = block_size
+        self._pool = ThreadPoolExecutor(max_workers=self._jobs, thread_name_prefix="assetkit-gzip") if self._jobs > 1 else None
+        self._pending: Deque[Future] = deque()
+        self._buffer = bytearray()
+        self._window = b""
+        self._crc = 0
+        self._size = 0
+        # No file name, mtime 0 (reproducible), XFL by level, OS unknown
+        xfl = 2 if level == 9 else 4 if level == 1 else 0
+        self._dst.write(b"\x1f\x8b\x08\x00" + struct.pack("<I", 0) + bytes([xfl, 255]))
+
+    def writable(self) -> bool:
+        return True
+
+    def _deflate(self, block: bytes, window: bytes) -> bytes:
+        compressor = zlib.compressobj(self._level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=window) if window else \
+            zlib.compressobj(self._level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def _submit(self, block: bytes):
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        window, self._window = self._window, block[-_DEFLATE_WINDOW:]
+        if self._pool is None:
+            self._dst.write(self._deflate(block, window))
+            return
+        # Bounded read-ahead: at most two blocks per thread are held in memory
+        while len(self._pending) >= 2 * self._jobs:
+            self._dst.write(self._pending.popleft().result())
+        self._pending.append(self._pool.submit(self._deflate, block, window))
+
+    def write(self, b) -> int:
+        if self.closed:
+            raise ValueError("write to closed ParallelGzipWriter")
+        self._buffer += b
+        if len(self._buffer) >= self._block_size:
+            view = memoryview(self._buffer)
+            full = len(self._buffer) - len(self._buffer) % self._block_size
+            for start in range(0, full, self._block_size):
+                self._submit(bytes(view[start:start + self._block_size]))
+            view.release()
+            del self._buffer[:full]
+        return len(b)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._dst.write(self._pending.popleft().result())
+            # An empty final block (BFINAL set) ends the deflate stream, then the gzip trailer
+            self._dst.write(zlib.compressobj(self._level, zlib.DEFLATED, -zlib.MAX_WBITS).flush(zlib.Z_FINISH))
+            self._dst.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+            super().close()
@@ -1,16 +1,302 @@
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
 from assetkit.asset_manager import AssetManager
+from assetkit.cache import default_cache_dir
+
+REGISTRY_FILENAME = "discovery.json"
+REGISTRY_VERSION = 1
+_METADATA_SUFFIXES = (".dist-info", ".egg-info", ".egg-link", ".pth")
+
+
+class LoadFailure(NamedTuple):
+    package: str
+    module: str
+    error: Exception
+
+
+class DiscoveredManagers(Mapping):
+    """
+    Read-only mapping of asset package name -> AssetManager, built on first access.
+
+    A lookup constructs (and indexes) only the manager asked for; names() lists the registered
+    packages without building any. Like the plain dict discovery used to return, iteration and
+    len() cover only the packages that load, so they build every manager first (use warm() to do
+    that concurrently). Packages that fail to load are reported in .errors instead of being printed.
+
+    targets maps package names to module names, which are what the managers are built from; roots
+    holds optional package directories (e.g. from the discovery registry) that root() uses as hints.
+    """
+
+    def __init__(self, targets: Dict[str, str], resource_dir: str = "resources",
+                 roots: Optional[Dict[str, Optional[str]]] = None, **manager_kwargs):
+        self._targets = dict(targets)
+        self._roots = dict(roots or {})
+        self._resource_dir = resource_dir
+        self._manager_kwargs = manager_kwargs
+        self._managers: Dict[str, AssetManager] = {}
+        self._failures: Dict[str, LoadFailure] = {}
+        self._lock = threading.Lock()
+        self._package_locks: Dict[str, threading.Lock] = {}
+
+    def _load(self, name: str) -> AssetManager:
+        manager = self._managers.get(name)
+        if manager is not None:
+            return manager
+        if name not in self._targets:
+            raise KeyError(f"Asset package not found: {name}")
+
+        with self._lock:
+            package_lock = self._package_locks.setdefault(name, threading.Lock())
+        with package_lock:
+            if name in self._managers:
+                return self._managers[name]
+            if name in self._failures:
+                raise KeyError(f"Asset package failed to load: {name} ({self._failures[name].error})")
+            try:
+                manager = AssetManager(package_root=self._targets[name], resource_dir=self._resource_dir,
+                                       **self._manager_kwargs)
+            except Exception as e:
+                self._failures[name] = LoadFailure(package=name, module=self._targets[name], error=e)
+                raise KeyError(f"Asset package failed to load: {name} ({e})") from e
+            self._managers[name] = manager
+            return manager
+
+    def __getitem__(self, name: str) -> AssetManager:
+        return self._load(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaded())
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def names(self) -> List[str]:
+        """Every registered package name, including ones not loaded yet or failing to load."""
+        return list(self._targets)
+
+    def root(self, name: str) -> Optional[str]:
+        """
+        Package directory of a registered package, found without importing it. A cached root is
+        trusted while it is still a directory (the registry is already rebuilt when distributions
+        change); otherwise the module is resolved again with importlib.util.find_spec().
+        """
+        if name not in self._targets:
+            raise KeyError(f"Asset package not found: {name}")
+        target = self._targets[name]
+        if os.path.exists(target):
+            # Filesystem path target, opened as such by AssetManager
+            return str(Path(target).resolve())
+        hint = self._roots.get(name)
+        if hint is not None and os.path.isdir(hint):
+            return hint
+        root = _resource_root(target)
+        self._roots[name] = root
+        return root
+
+    @property
+    def resource_dir(self) -> str:
+        return self._resource_dir
+
+    def _loaded(self) -> Dict[str, AssetManager]:
+        managers = {}
+        for name in self._targets:
+            try:
+                managers[name] = self._load(name)
+            except KeyError:
+                continue
+        return managers
+
+    def keys(self):
+        return self._loaded().keys()
+
+    def items(self):
+        return self._loaded().items()
+
+    def values(self):
+        return self._loaded().values()
+
+    def warm(self, max_workers: int = 8) -> List[LoadFailure]:
+        """
+        Build every manager concurrently on a thread pool. Returns the failures (also in .errors).
+        """
+        pending = [name for name in self._targets if name not in self._managers and name not in self._failures]
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))),
+                                    thread_name_prefix="assetkit-discover") as pool:
+                list(pool.map(self._try_load, pending))
+        return self.errors
+
+    def _try_load(self, name: str):
+        try:
+            self._load(name)
+        except KeyError:
+            pass
 
-def discover_asset_managers(group="assetkit.assets") -> dict:
-    managers = {}
+    @property
+    def errors(self) -> List[LoadFailure]:
+        return list(self._failures.values())
+
+    def loaded(self) -> List[str]:
+        """Names of the packages whose managers have been built so far."""
+        return list(self._managers)
+
+    def __repr__(self):
+        return f"<DiscoveredManagers {len(self._targets)} packages, {len(self._managers)} loaded>"
+
+
+def _select_entry_points(group: str):
     eps = entry_points()
-    selected = eps.select(group=group) if hasattr(eps, "select") else eps.get(group, [])
+    return eps.select(group=group) if hasattr(eps, "select") else eps.get(group, [])
+
+
+def environment_fingerprint(paths: Optional[List[str]] = None) -> str:
+    """
+    Fingerprint of the installed distributions: every sys.path entry with its mtime, plus the
+    name and mtime of each *.dist-info / *.egg-info / *.egg-link / *.pth inside it.
+    Installing, upgrading or removing a package changes the fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sys.path if paths is None else paths:
+        location = entry or os.getcwd()
+        try:
+            digest.update(f"{location}:{os.stat(location).st_mtime_ns}\n".encode())
+            if not os.path.isdir(location):
+                continue
+            with os.scandir(location) as items:
+                names = sorted(
+                    (item.name, item.stat().st_mtime_ns) for item in items if item.name.endswith(_METADATA_SUFFIXES)
+                )
+        except OSError:
+            continue
+        for name, mtime in names:
+            digest.update(f"  {name}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+def resource_tree_fingerprint(managers: DiscoveredManagers) -> str:
+    """
+    Fingerprint of the discovered packages' resource trees: the path and mtime of every directory
+    under each package's resource dir. Adding or removing an asset, e.g. in an editable install,
+    changes it. Only directories are stat'ed; no package is imported or indexed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(managers.names()):
+        root = managers.root(name)
+        digest.update(f"{name}:{root}\n".encode())
+        if root is None:
+            continue
+        pending = [os.path.join(root, managers.resource_dir)]
+        while pending:
+            location = pending.pop()
+            try:
+                digest.update(f"  {location}:{os.stat(location).st_mtime_ns}\n".encode())
+                with os.scandir(location) as items:
+                    pending.extend(sorted(item.path for item in items if item.is_dir(follow_symlinks=False)))
+            except OSError:
+                continue
+    return digest.hexdigest()
+
+
+def registry_cache_path() -> Path:
+    return default_cache_dir() / REGISTRY_FILENAME
+
 
-    for ep in selected:
-        pkg_name = ep.name
-        mod = ep.value
+def _resource_root(module: str) -> Optional[str]:
+    # Resolve the package directory without importing it, so managers can open it as a filesystem path
+    if ":" in module or "." in module:
+        return None
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    locations = list(spec.submodule_search_locations or []) if spec else []
+    if len(locations) == 1 and os.path.isdir(locations[0]):
+        return locations[0]
+    return None
+
+
+def _resolve_group(group: str) -> Dict[str, Dict[str, Optional[str]]]:
+    return {
+        ep.name: {"module": ep.value, "root": _resource_root(ep.value)}
+        for ep in _select_entry_points(group)
+    }
+
+
+def load_discovery_registry(group: str = "assetkit.assets", refresh: bool = False,
+                            cache_path: Optional[Path] = None) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Return {package name: {"module": ..., "root": ...}} for an entry point group.
+
+    Results are cached on disk (see registry_cache_path()) under a fingerprint of the installed
+    distributions, so the entry point scan only reruns after packages are installed or removed,
+    or when refresh=True.
+    """
+    cache_path = Path(cache_path) if cache_path else registry_cache_path()
+    fingerprint = environment_fingerprint()
+
+    data = None
+    if not refresh:
         try:
-            managers[pkg_name] = AssetManager(package_root=mod, resource_dir="resources")
-        except Exception as e:
-            print(f"Failed to load assets for {pkg_name}: {e}")
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+    if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION or data.get("fingerprint") != fingerprint:
+        data = {"version": REGISTRY_VERSION, "fingerprint": fingerprint, "groups": {}}
+
+    groups = data["groups"]
+    if group in groups:
+        return groups[group]
+
+    groups[group] = _resolve_group(group)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=".tmp-discovery-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # A read-only cache dir only costs us the speedup
+        pass
+    return groups[group]
+
+
+def discover_asset_managers(group="assetkit.assets", warm: bool = False, max_workers: int = 8,
+                            use_cache: bool = True, **manager_kwargs) -> DiscoveredManagers:
+    """
+    Discover installed asset packages registered under the given entry point group.
+
+    :param group: Entry point group to scan (default: "assetkit.assets")
+    :param warm: Build all managers up front, concurrently on a thread pool
+    :param max_workers: Thread pool size used when warming
+    :param use_cache: Reuse the on-disk discovery registry while the installed distributions are unchanged
+    :param manager_kwargs: Extra AssetManager options (e.g. lazy=True, cache=...)
+    :return: A lazy mapping of package name -> AssetManager; load failures are listed in .errors
+    """
+    if use_cache:
+        registry = load_discovery_registry(group)
+        # Managers are always built from the module name, so installed packages keep going through
+        # importlib.resources; the cached root only spares root() a find_spec() call
+        targets = {name: entry["module"] for name, entry in registry.items()}
+        roots = {name: entry["root"] for name, entry in registry.items()}
+    else:
+        targets = {ep.name: ep.value for ep in _select_entry_points(group)}
+        roots = None
+    managers = DiscoveredManagers(targets, roots=roots, **manager_kwargs)
+    if warm:
+        managers.warm(max_workers=max_workers)
     return managers
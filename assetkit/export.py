@@ -0,0 +1,259 @@
+import contextlib
+import io
+import lzma
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from assetkit.compression import ParallelGzipWriter, is_compressed_format
+from assetkit.ignore import IgnoreRules, IgnoreStats
+
+DEFAULT_EXPORT_LEVEL = 6
+DEFAULT_EXPORT_FORMAT = "gztar"
+# Archive format (shutil.make_archive names) -> file extension
+ARCHIVE_EXTENSIONS = {"tar": ".tar", "gztar": ".tar.gz", "xztar": ".tar.xz", "zip": ".zip"}
+FORMAT_ALIASES = {"gz": "gztar", "tgz": "gztar", "xz": "xztar"}
+
+# Read-ahead: threads, largest file read whole, and total bytes held (which bounds the window)
+DEFAULT_READ_AHEAD_JOBS = 4
+READ_AHEAD_FILE_BYTES = 1024 * 1024
+READ_AHEAD_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_export_files(project_root: Path, skip_dir: Optional[Path] = None, rules: Optional[IgnoreRules] = None,
+                      stats: Optional[IgnoreStats] = None) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield (path, archive name) of every file to export. Ignored directories (rules defaults to the
+    project's IgnoreRules.for_project()) are pruned while walking rather than filtered file by file;
+    stats, if given, counts what each rule skipped.
+    """
+    if rules is None:
+        rules = IgnoreRules.for_project(project_root)
+    top = str(project_root)
+    prefix = project_root.name + "/"
+    for root, dirs, files in os.walk(project_root):
+        root_path = Path(root)
+        rel_root = root[len(top) + 1:].replace(os.sep, "/")
+        rel_root = rel_root + "/" if rel_root else ""
+        kept = []
+        for d in dirs:
+            if skip_dir is not None and root_path / d == skip_dir:
+                continue
+            rule = rules.match(rel_root + d, is_dir=True)
+            if rule is None:
+                kept.append(d)
+            elif stats is not None:
+                stats.add_tree(rule, root_path / d)
+        dirs[:] = kept
+        for file in files:
+            rule = rules.match(rel_root + file)
+            if rule is None:
+                yield root_path / file, prefix + rel_root + file
+            elif stats is not None:
+                stats.add_file(rule, root_path / file)
+
+
+class PrefetchedFile(NamedTuple):
+    path: Path
+    arcname: str
+    # Whole contents of a small file, or None for a file the writer streams from disk itself
+    data: Optional[bytes]
+
+
+def read_ahead(files: Iterable[Tuple[Path, str]], jobs: int = DEFAULT_READ_AHEAD_JOBS,
+               max_file_bytes: int = READ_AHEAD_FILE_BYTES, max_bytes: int = READ_AHEAD_BYTES) -> Iterator[PrefetchedFile]:
+    """
+    Yield files in order while a small thread pool opens and reads the next ones, so a writer
+    compressing the current file never waits on open()/read() latency for the small files after it.
+    Files larger than max_file_bytes are left to the writer, which streams them in chunks; at most
+    max_bytes // max_file_bytes files are held at once, so memory stays bounded.
+    """
+    if jobs <= 0:
+        for path, arcname in files:
+            yield PrefetchedFile(path, arcname, None)
+        return
+
+    def load(path):
+        if os.path.getsize(path) > max_file_bytes:
+            return None
+        with open(path, "rb") as f:
+            data = f.read(max_file_bytes + 1)
+        return data if len(data) <= max_file_bytes else None
+
+    window = max(1, max_bytes // max_file_bytes)
+    pending = deque()
+    remaining = iter(files)
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="assetkit-read") as pool:
+        while True:
+            for path, arcname in remaining:
+                pending.append((path, arcname, pool.submit(load, path)))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            path, arcname, future = pending.popleft()
+            yield PrefetchedFile(path, arcname, future.result())
+
+
+def _zip_compress_type(name: str, head: bytes) -> int:
+    """ZIP_STORED for members that are already compressed (by extension or magic bytes), else ZIP_DEFLATED."""
+    return zipfile.ZIP_STORED if is_compressed_format(name, head) else zipfile.ZIP_DEFLATED
+
+
+def _write_zip(out: IO[bytes], files: Iterator[PrefetchedFile], level: int, members: Dict[str, bytes]):
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+        for arcname, data in members.items():
+            zf.writestr(arcname, data)
+        for item in files:
+            if item.data is None:
+                with open(item.path, "rb") as f:
+                    head = f.read(8)
+                zf.write(item.path, item.arcname, compress_type=_zip_compress_type(item.path.name, head))
+            else:
+                info = zipfile.ZipInfo.from_file(item.path, item.arcname)
+                zf.writestr(info, item.data, compress_type=_zip_compress_type(item.path.name, item.data[:8]),
+                            compresslevel=level)
+
+
+def _write_tar(out: IO[bytes], files: Iterator[PrefetchedFile], members: Dict[str, bytes]):
+    # Stream mode: the tar is written strictly front to back, so out may be a pipe
+    with tarfile.open(fileobj=out, mode="w|") as tar:
+        for arcname, data in members.items():
+            info = tarfile.TarInfo(arcname)
+            info.size, info.mtime, info.mode = len(data), int(time.time()), 0o644
+            tar.addfile(info, io.BytesIO(data))
+        for item in files:
+            info = tar.gettarinfo(item.path, arcname=item.arcname) if item.data is not None else None
+            if info is not None and info.isreg() and info.size == len(item.data):
+                tar.addfile(info, io.BytesIO(item.data))
+            else:
+                # Large files, links, and files that changed size since they were read
+                tar.add(item.path, arcname=item.arcname)
+
+
+def write_archive(target: Union[str, Path, IO[bytes]], files: Iterable[Tuple[Path, str]],
+                  archive_format: str = DEFAULT_EXPORT_FORMAT, level: int = DEFAULT_EXPORT_LEVEL,
+                  jobs: Optional[int] = None, members: Optional[Dict[str, bytes]] = None,
+                  read_ahead_jobs: int = DEFAULT_READ_AHEAD_JOBS):
+    """
+    Write files ((path, archive name) pairs) as a "tar", "gztar", "xztar" or "zip" archive to target,
+    a path or a writable binary stream (which may be a pipe; it is left open).
+
+    gztar is gzipped on a thread pool (ParallelGzipWriter) and is still one ordinary .tar.gz;
+    level is the gzip/zip compression level or the xz preset. zip stores members that are already
+    compressed instead of deflating them again. members ({archive name: contents}) are written
+    first, from memory. Small files are read ahead on read_ahead_jobs threads (0 disables it).
+    """
+    if archive_format not in ARCHIVE_EXTENSIONS:
+        raise ValueError(f"Unknown archive format: {archive_format}")
+    members = members or {}
+    prefetched = read_ahead(files, jobs=read_ahead_jobs)
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(open(target, "wb")) if isinstance(target, (str, Path)) else target
+        if archive_format == "zip":
+            _write_zip(out, prefetched, level, members)
+            return
+        if archive_format == "gztar":
+            out = stack.enter_context(ParallelGzipWriter(out, level=level, jobs=jobs))
+        elif archive_format == "xztar":
+            out = stack.enter_context(lzma.LZMAFile(out, "wb", preset=level))
+        _write_tar(out, prefetched, members)
+
+
+class _StreamCancelled(Exception):
+    pass
+
+
+class _QueueWriter(io.RawIOBase):
+    """Write end of stream_archive(): coalesces writes into chunks and hands them over a bounded queue."""
+
+    def __init__(self, chunks: "queue.Queue", chunk_size: int):
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self.cancelled = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        if self.cancelled:
+            raise _StreamCancelled()
+        self._buffer += b
+        if len(self._buffer) >= self._chunk_size:
+            self.flush_chunk()
+        return len(b)
+
+    def flush_chunk(self):
+        if self._buffer:
+            self._chunks.put(bytes(self._buffer))
+            self._buffer.clear()
+
+
+_END = object()
+
+
+def stream_archive(files: Iterable[Tuple[Path, str]], archive_format: str = DEFAULT_EXPORT_FORMAT,
+                   level: int = DEFAULT_EXPORT_LEVEL, jobs: Optional[int] = None,
+                   members: Optional[Dict[str, bytes]] = None, chunk_size: int = STREAM_CHUNK_SIZE,
+                   max_chunks: int = 8) -> Iterator[bytes]:
+    """
+    Yield an archive (see write_archive) as a stream of byte chunks, e.g. to upload it or pipe it into
+    another process without writing it to disk first.
+
+    The archive is written on a background thread into a queue of at most max_chunks chunks of about
+    chunk_size bytes, so memory stays bounded however large the project is. Closing the generator
+    early stops the writer.
+    """
+    chunks: "queue.Queue" = queue.Queue(maxsize=max_chunks)
+    sink = _QueueWriter(chunks, chunk_size)
+
+    def produce():
+        try:
+            write_archive(sink, files, archive_format, level=level, jobs=jobs, members=members)
+            sink.flush_chunk()
+            chunks.put(_END)
+        except _StreamCancelled:
+            pass
+        except BaseException as e:
+            chunks.put(e)
+
+    writer = threading.Thread(target=produce, name="assetkit-export", daemon=True)
+    writer.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is _END:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        sink.cancelled = True
+        # Unblock a writer waiting on the full queue, then let it unwind
+        while writer.is_alive():
+            try:
+                chunks.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        writer.join()
+
+
+def stream_export(project_root: Union[str, Path], archive_format: str = DEFAULT_EXPORT_FORMAT,
+                  level: int = DEFAULT_EXPORT_LEVEL, jobs: Optional[int] = None,
+                  chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the archive of a project directory (the same files as 'assetkit export') as byte chunks.
+    Unlike the CLI, nothing is regenerated: the index, digests and pack are exported as they are.
+    """
+    project_root = Path(project_root).resolve()
+    return stream_archive(iter_export_files(project_root), archive_format, level=level, jobs=jobs,
+                          chunk_size=chunk_size)
@@ -0,0 +1,129 @@
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from assetkit.index import glob_to_regex
+
+IGNORE_FILENAME = ".assetkitignore"
+# Applied before the project's .assetkitignore, which can re-include them with "!"
+DEFAULT_IGNORE_PATTERNS = ("__pycache__", "build", "dist", "*.egg-info", "*.pyc", "*.pyo")
+
+
+class IgnoreRule(NamedTuple):
+    pattern: str
+    # Where the rule comes from: "default" or ".assetkitignore:<line>"
+    source: str
+    negated: bool
+    dir_only: bool
+    regex: str
+
+
+def parse_ignore_pattern(line: str, source: str) -> Optional[IgnoreRule]:
+    """
+    Parse one gitignore-style line; None for blank lines and comments.
+
+    "!" re-includes, a trailing "/" matches directories only, a pattern without an inner "/" matches
+    a name at any depth, and one with a "/" is anchored at the project root. "*", "?", "[...]" and
+    "**" work as in gitignore.
+    """
+    text = line.rstrip("\n").rstrip("\r")
+    if not text.endswith("\\ "):
+        text = text.rstrip(" ")
+    if not text or text.startswith("#"):
+        return None
+    negated = text.startswith("!")
+    body = text[1:] if negated else text
+    if body.startswith(("\\#", "\\!")):
+        body = body[1:]
+    body = body.replace("\\ ", " ")
+    dir_only = body.endswith("/")
+    body = body.rstrip("/")
+    if not body:
+        return None
+    if "/" not in body:
+        body = "**/" + body
+    return IgnoreRule(pattern=text, source=source, negated=negated, dir_only=dir_only,
+                      regex=glob_to_regex(body.lstrip("/")).pattern)
+
+
+class IgnoreRules:
+    """
+    Ordered gitignore-style rules compiled once; the last matching rule decides.
+
+    Paths are "/"-separated and relative to the project root. Paths matched by no rule (the common
+    case) are answered by a single regex call over the union of all patterns.
+    """
+
+    def __init__(self, rules: Sequence[IgnoreRule]):
+        self.rules = list(rules)
+        self._dir_rules = [(re.compile(rule.regex), rule) for rule in self.rules]
+        self._file_rules = [(regex, rule) for regex, rule in self._dir_rules if not rule.dir_only]
+        self._any_dir = self._union(self._dir_rules)
+        self._any_file = self._union(self._file_rules)
+
+    @staticmethod
+    def _union(compiled) -> Optional["re.Pattern"]:
+        if not compiled:
+            return None
+        return re.compile("|".join(f"(?:{rule.regex})" for _, rule in compiled))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], source: str = IGNORE_FILENAME) -> "IgnoreRules":
+        parsed = (parse_ignore_pattern(line, f"{source}:{i}") for i, line in enumerate(lines, start=1))
+        return cls([rule for rule in parsed if rule is not None])
+
+    @classmethod
+    def for_project(cls, project_root: Union[str, Path],
+                    defaults: Sequence[str] = DEFAULT_IGNORE_PATTERNS) -> "IgnoreRules":
+        """Default exclusions followed by the rules of <project_root>/.assetkitignore, if present."""
+        rules = [parse_ignore_pattern(pattern, "default") for pattern in defaults]
+        try:
+            lines = (Path(project_root) / IGNORE_FILENAME).read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            lines = []
+        rules += cls.from_lines(lines).rules
+        return cls([rule for rule in rules if rule is not None])
+
+    def match(self, rel_path: str, is_dir: bool = False) -> Optional[IgnoreRule]:
+        """The rule that excludes rel_path, or None when it is kept."""
+        combined, candidates = (self._any_dir, self._dir_rules) if is_dir else (self._any_file, self._file_rules)
+        if combined is None or not combined.match(rel_path):
+            return None
+        for regex, rule in reversed(candidates):
+            if regex.match(rel_path):
+                return None if rule.negated else rule
+        return None
+
+    def __repr__(self):
+        return f"<IgnoreRules {len(self.rules)} rules>"
+
+
+class IgnoreStats:
+    """Files and bytes skipped per rule (pruned directories are walked only to be counted)."""
+
+    def __init__(self):
+        self.skipped: Dict[IgnoreRule, List[int]] = {}
+
+    def add_file(self, rule: IgnoreRule, path: Union[str, Path]):
+        entry = self.skipped.setdefault(rule, [0, 0])
+        entry[0] += 1
+        try:
+            entry[1] += os.lstat(path).st_size
+        except OSError:
+            pass
+
+    def add_tree(self, rule: IgnoreRule, path: Union[str, Path]):
+        entry = self.skipped.setdefault(rule, [0, 0])
+        for current, _, files in os.walk(path):
+            for name in files:
+                entry[0] += 1
+                try:
+                    entry[1] += os.lstat(os.path.join(current, name)).st_size
+                except OSError:
+                    pass
+
+    def report(self) -> List[Tuple[IgnoreRule, int, int]]:
+        """(rule, files, bytes) for every rule that skipped something, largest first."""
+        return sorted(((rule, files, size) for rule, (files, size) in self.skipped.items()),
+                      key=lambda item: (-item[2], -item[1], item[0].source))
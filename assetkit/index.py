@@ -0,0 +1,457 @@
+import collections.abc
+import json
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_SCAN_WORKERS = 8
+
+# Serialized CompactAssetIndex: magic, header length, JSON header, then 8-byte aligned tables
+COMPACT_INDEX_MAGIC = b"AKIDX\x00\x00\x01"
+_COMPACT_HEADER = struct.Struct("<8sQ")
+
+# "/" sorts directly before "0", so key + "0" is the first string after every "key/..." entry
+_AFTER_SEPARATOR = chr(ord("/") + 1)
+
+
+def key_extension(key: str) -> str:
+    """
+    Extension used by the extension index: everything from the last "." of the final path
+    segment (".yaml", ".gz", ".bashrc"), or "" when the segment has no dot.
+    """
+    name = key.rsplit("/", 1)[-1]
+    dot = name.rfind(".")
+    return name[dot:] if dot != -1 else ""
+
+
+def glob_to_regex(pattern: str) -> "re.Pattern":
+    """
+    Compile a glob pattern over "/"-separated keys. "*" and "?" never cross a "/",
+    "**" matches any number of directories, and "[...]" is a character class.
+    """
+    segments = pattern.strip("/").split("/")
+    parts = []
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:[^/]+/)*")
+            continue
+        out = []
+        j = 0
+        while j < len(segment):
+            c = segment[j]
+            if c == "*":
+                out.append("[^/]*")
+            elif c == "?":
+                out.append("[^/]")
+            elif c == "[":
+                end = segment.find("]", j + 2)
+                if end == -1:
+                    out.append(re.escape(c))
+                else:
+                    body = segment[j + 1:end].replace(chr(92), chr(92) * 2)
+                    # Like "*" and "?", a class never matches the "/" between segments
+                    if body.startswith("!"):
+                        out.append(f"[^/{body[1:]}]")
+                    else:
+                        out.append(f"(?!/)[{body}]")
+                    j = end
+            else:
+                out.append(re.escape(c))
+            j += 1
+        parts.append("".join(out) + ("" if last else "/"))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def glob_literal_prefix(pattern: str) -> str:
+    """Longest leading run of whole directory segments without wildcards (e.g. "configs/")."""
+    prefix = ""
+    for segment in pattern.strip("/").split("/")[:-1]:
+        if any(c in segment for c in "*?["):
+            break
+        prefix += segment + "/"
+    return prefix
+
+
+def scan_dir(path: str, rel: str, with_mtime: bool = False) -> Tuple[List[str], List[Tuple[str, str]], Optional[int]]:
+    """
+    List one directory: (file keys, [(subdir path, subdir key)], directory mtime_ns or None).
+    The mtime is read before listing, so a change made during the listing shows up next time.
+    """
+    mtime = os.stat(path).st_mtime_ns if with_mtime else None
+    files, subdirs = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            key = f"{rel}/{entry.name}" if rel else entry.name
+            # DirEntry.is_dir() answers from d_type; it only stats for symlinks or DT_UNKNOWN
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append((entry.path, key))
+            else:
+                files.append(key)
+    return files, subdirs, mtime
+
+
+def scan_tree(base, prefix: str = "", max_workers: int = DEFAULT_SCAN_WORKERS,
+              mtimes: Optional[Dict[str, int]] = None) -> Tuple[List[str], List[str]]:
+    """
+    Walk a filesystem directory with os.scandir and return (file keys, directory keys), both
+    relative to base and prefixed with prefix. Subdirectories are scanned concurrently on a
+    bounded thread pool, which hides per-call latency on network filesystems.
+    Produces the same keys as a recursive Path.iterdir()/is_dir() walk.
+
+    If mtimes is given, it is filled with {directory key: mtime_ns} ("" or prefix for base).
+    """
+    files, dirs = [], []
+    with_mtime = mtimes is not None
+
+    def collect(rel, result):
+        found, subdirs, mtime = result
+        files.extend(found)
+        if with_mtime:
+            mtimes[rel] = mtime
+        return subdirs
+
+    if max_workers is None or max_workers <= 1:
+        stack = [(os.fspath(base), prefix)]
+        while stack:
+            path, rel = stack.pop()
+            subdirs = collect(rel, scan_dir(path, rel, with_mtime))
+            dirs.extend(sub_rel for _, sub_rel in subdirs)
+            stack.extend(subdirs)
+        return files, dirs
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assetkit-scan") as pool:
+        pending = {pool.submit(scan_dir, os.fspath(base), prefix, with_mtime): prefix}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel = pending.pop(future)
+                for path, sub_rel in collect(rel, future.result()):
+                    dirs.append(sub_rel)
+                    pending[pool.submit(scan_dir, path, sub_rel, with_mtime)] = sub_rel
+    return files, dirs
+
+
+def _prefix_bounds(keys: Sequence[str], prefix: str):
+    lo = bisect_left(keys, prefix)
+    if not prefix:
+        return lo, len(keys)
+    return lo, bisect_left(keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo=lo)
+
+
+class _KeyQueries:
+    """
+    Query methods shared by the index layouts. Subclasses expose their keys as a sorted
+    sequence (self._keys) and per-extension sorted sequences (self._ext_keys(ext)).
+    """
+
+    _keys: Sequence[str]
+
+    def _ext_keys(self, ext: str) -> Sequence[str]:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    @staticmethod
+    def _iter_sorted(keys: Sequence[str], prefix: str, after: Optional[str]) -> Iterator[str]:
+        start = bisect_left(keys, prefix)
+        if after is not None and after >= prefix:
+            start = bisect_left(keys, after + "\0", lo=start)
+        for i in range(start, len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                return
+            yield key
+
+    def iter_prefix(self, prefix: str = "", after: Optional[str] = None) -> Iterator[str]:
+        """Yield keys starting with prefix in sorted order, resuming after the key `after` if given."""
+        return self._iter_sorted(self._keys, prefix, after)
+
+    def iter_extension(self, ext: str, prefix: str = "", after: Optional[str] = None) -> Iterator[str]:
+        return self._iter_sorted(self._ext_keys(ext), prefix, after)
+
+    def iter_suffix(self, suffix: str) -> Iterator[str]:
+        """Yield keys ending with suffix, using the extension index whenever the suffix pins one."""
+        name = suffix.rsplit("/", 1)[-1]
+        if "." not in name:
+            return (k for k in self._keys if k.endswith(suffix))
+        return (k for k in self.iter_extension(key_extension(name)) if k.endswith(suffix))
+
+    def iter_glob(self, pattern: str, after: Optional[str] = None) -> Iterator[str]:
+        """Yield keys matching a glob such as "configs/**/*.yaml" in sorted order."""
+        regex = glob_to_regex(pattern)
+        prefix = glob_literal_prefix(pattern)
+        candidates = self._iter_sorted(self._keys, prefix, after)
+
+        # The extension bucket is only exact when the final "." is literal: a "[...]" class anywhere in
+        # the last segment could supply or hide it ("file[.]yaml", "*.[yj]son")
+        last = pattern.strip("/").rsplit("/", 1)[-1]
+        ext = key_extension(last)
+        if ext and "[" not in last and not any(c in ext for c in "*?"):
+            ext_keys = self._ext_keys(ext)
+            ext_lo, ext_hi = _prefix_bounds(ext_keys, prefix)
+            lo, hi = _prefix_bounds(self._keys, prefix)
+            if ext_hi - ext_lo < hi - lo:
+                candidates = self._iter_sorted(ext_keys, prefix, after)
+        return (k for k in candidates if regex.match(k))
+
+    def listdir(self, rel_dir: str = "") -> List[str]:
+        """
+        Immediate children of rel_dir in sorted order; subdirectories carry a trailing "/".
+        Whole subtrees are skipped with one bisect each.
+        """
+        rel_dir = rel_dir.strip("/")
+        prefix = rel_dir + "/" if rel_dir else ""
+        keys = self._keys
+        names = []
+        i = bisect_left(keys, prefix)
+        while i < len(keys):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+            rest = key[len(prefix):]
+            slash = rest.find("/")
+            if slash == -1:
+                names.append(rest)
+                i += 1
+            else:
+                child = rest[:slash]
+                names.append(child + "/")
+                i = bisect_left(keys, prefix + child + _AFTER_SEPARATOR, lo=i)
+        return names
+
+
+class AssetIndex(_KeyQueries):
+    """
+    Growable asset key table kept in sorted order, plus a per-extension index.
+
+    Prefix, directory and glob queries bisect into the sorted keys, so their cost grows with
+    the number of matches rather than with the total number of assets. Values are whatever
+    the caller stores per key (AssetManager stores (size, mtime_ns) metadata or None).
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Any]] = None):
+        self._entries: Dict[str, Any] = dict(entries or {})
+        self._keys: List[str] = sorted(self._entries)
+        self._by_ext: Dict[str, List[str]] = {}
+        for key in self._keys:
+            self._by_ext.setdefault(key_extension(key), []).append(key)
+
+    def _ext_keys(self, ext: str) -> Sequence[str]:
+        return self._by_ext.get(ext, [])
+
+    def add(self, key: str, value: Any = None):
+        if key not in self._entries:
+            insort(self._keys, key)
+            insort(self._by_ext.setdefault(key_extension(key), []), key)
+        self._entries[key] = value
+
+    def update(self, entries: Dict[str, Any]):
+        new_keys = [k for k in entries if k not in self._entries]
+        self._entries.update(entries)
+        if len(new_keys) < 8:
+            for key in new_keys:
+                insort(self._keys, key)
+                insort(self._by_ext.setdefault(key_extension(key), []), key)
+            return
+        # Timsort merges the existing sorted run with the new one cheaply
+        self._keys.extend(new_keys)
+        self._keys.sort()
+        touched = set()
+        for key in new_keys:
+            ext = key_extension(key)
+            self._by_ext.setdefault(ext, []).append(key)
+            touched.add(ext)
+        for ext in touched:
+            self._by_ext[ext].sort()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((key, self._entries[key]) for key in self._keys)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._entries[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+
+class _PackedKeys(collections.abc.Sequence):
+    """Read-only sorted sequence of keys decoded on demand from a CompactAssetIndex."""
+
+    __slots__ = ("_index", "_positions")
+
+    def __init__(self, index: "CompactAssetIndex", positions: Optional[array] = None):
+        self._index = index
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._index._dir_of) if self._positions is None else len(self._positions)
+
+    def __getitem__(self, i: int) -> str:
+        if self._positions is not None:
+            i = self._positions[i]
+        elif i < 0:
+            i += len(self)
+        return self._index._key_at(i)
+
+    def __iter__(self) -> Iterator[str]:
+        key_at = self._index._key_at
+        positions = range(len(self._index._dir_of)) if self._positions is None else self._positions
+        return (key_at(i) for i in positions)
+
+
+class CompactAssetIndex(_KeyQueries):
+    """
+    Immutable, array-backed layout of an asset index for very large packages.
+
+    Directory prefixes are interned once, file names live in one packed UTF-8 string table
+    addressed by an offsets array, and sizes/mtimes sit in typed arrays (-1 when unknown).
+    Entries are sorted by key, so lookups are a binary search and no per-key Python objects
+    are kept; AssetManager creates AssetFile handles only when a key is accessed.
+    """
+
+    def __init__(self, entries: Dict[str, Optional[Sequence[int]]]):
+        dir_ids: Dict[str, int] = {}
+        self._dirs: List[str] = []
+        self._dir_of = array("I")
+        self._name_off = array("Q", [0])
+        self._sizes = array("q")
+        self._mtimes = array("q")
+        names = bytearray()
+        by_ext: Dict[str, array] = {}
+
+        for position, key in enumerate(sorted(entries)):
+            head, sep, name = key.rpartition("/")
+            prefix = head + sep
+            dir_id = dir_ids.get(prefix)
+            if dir_id is None:
+                dir_id = dir_ids[prefix] = len(self._dirs)
+                self._dirs.append(prefix)
+            self._dir_of.append(dir_id)
+            names += name.encode("utf-8")
+            self._name_off.append(len(names))
+            meta = entries[key]
+            self._sizes.append(meta[0] if meta else -1)
+            self._mtimes.append(meta[1] if meta and len(meta) > 1 else -1)
+            ext = key_extension(name)
+            if ext not in by_ext:
+                by_ext[ext] = array("I")
+            by_ext[ext].append(position)
+
+        self._names = bytes(names)
+        self._by_ext = by_ext
+        self._keys = _PackedKeys(self)
+
+    def _key_at(self, i: int) -> str:
+        return self._dirs[self._dir_of[i]] + str(self._names[self._name_off[i]:self._name_off[i + 1]], "utf-8")
+
+    def _ext_keys(self, ext: str) -> Sequence[str]:
+        positions = self._by_ext.get(ext)
+        return _PackedKeys(self, positions if positions is not None else array("I"))
+
+    def _position(self, key: str) -> int:
+        i = bisect_left(self._keys, key)
+        if i < len(self._dir_of) and self._key_at(i) == key:
+            return i
+        return -1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._position(key)
+        if i == -1:
+            return default
+        size, mtime = self._sizes[i], self._mtimes[i]
+        return None if size == -1 else (size, mtime)
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._position(key)
+        if i == -1:
+            raise KeyError(key)
+        return self.get(key)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for i in range(len(self._dir_of)):
+            size = self._sizes[i]
+            yield self._key_at(i), None if size == -1 else (size, self._mtimes[i])
+
+    def __contains__(self, key: str) -> bool:
+        return self._position(key) != -1
+
+    def _tables(self) -> List[Tuple[str, Sequence]]:
+        return [("dir_of", self._dir_of), ("name_off", self._name_off), ("sizes", self._sizes),
+                ("mtimes", self._mtimes), ("names", self._names)] + [
+            ("ext:" + ext, positions) for ext, positions in sorted(self._by_ext.items())
+        ]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the packed tables into one buffer that from_buffer() can use in place,
+        e.g. from a shared memory block or an mmap.
+        """
+        layout, chunks, offset = [], [], 0
+        for name, table in self._tables():
+            data = table if isinstance(table, (bytes, memoryview)) else table.tobytes()
+            data = memoryview(data).cast("B")
+            padding = -len(data) % 8
+            layout.append([name, getattr(table, "typecode", "B"), offset, len(data)])
+            chunks.append(bytes(data) + b"\0" * padding)
+            offset += len(data) + padding
+        header = json.dumps({"dirs": self._dirs, "tables": layout}, separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(header) + _COMPACT_HEADER.size) % 8)
+        return b"".join([_COMPACT_HEADER.pack(COMPACT_INDEX_MAGIC, len(header)), header] + chunks)
+
+    @classmethod
+    def from_buffer(cls, buffer, owner: Any = None) -> "CompactAssetIndex":
+        """
+        Attach to a buffer written by to_bytes() without copying its tables: they become typed
+        memoryviews over the buffer. owner (e.g. the SharedMemory holding the buffer) is kept alive
+        for as long as the index is.
+        """
+        view = memoryview(buffer).cast("B")
+        magic, header_len = _COMPACT_HEADER.unpack_from(view)
+        if magic != COMPACT_INDEX_MAGIC:
+            raise ValueError("CompactAssetIndex: not a serialized index")
+        start = _COMPACT_HEADER.size
+        header = json.loads(bytes(view[start:start + header_len]))
+        base = start + header_len
+
+        index = cls.__new__(cls)
+        index._dirs = header["dirs"]
+        index._by_ext = {}
+        for name, typecode, offset, length in header["tables"]:
+            table = view[base + offset:base + offset + length]
+            if typecode != "B":
+                table = table.cast(typecode)
+            if name.startswith("ext:"):
+                index._by_ext[name[4:]] = table
+            else:
+                setattr(index, "_" + name, table)
+        index._keys = _PackedKeys(index)
+        index._owner = owner
+        return index
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the packed tables."""
+        arrays = (self._dir_of, self._name_off, self._sizes, self._mtimes, *self._by_ext.values())
+        return (
+            len(self._names)
+            + sum(a.itemsize * len(a) for a in arrays)
+            + sum(len(d) + 49 for d in self._dirs)
+        )
@@ -0,0 +1,134 @@
+# assetkit/internal/cli/apply_delta.py
+
+import json
+import sys
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+from assetkit.internal.generators.generate_export_manifest import DELTA_FILENAME, DELTA_VERSION, EXPORT_STATE_FILENAME
+
+# Python versions with extraction filters get the "data" filter on top of the checks below
+_EXTRACT_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def _safe_name(name: str) -> bool:
+    path = PurePosixPath(name)
+    return bool(name) and not path.is_absolute() and ".." not in path.parts and ":" not in path.parts[0]
+
+
+def _read_delta(archive_path: Path) -> Optional[dict]:
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zf:
+            if DELTA_FILENAME not in zf.namelist():
+                return None
+            return json.loads(zf.read(DELTA_FILENAME))
+    with tarfile.open(archive_path, "r:*") as tar:
+        # The marker is written first, so only the head of the archive is read
+        member = tar.next()
+        if member is None or member.name != DELTA_FILENAME:
+            return None
+        return json.loads(tar.extractfile(member).read())
+
+
+def _extract(archive_path: Path, target: Path):
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.filename == DELTA_FILENAME or info.is_dir():
+                    continue
+                if not _safe_name(info.filename):
+                    raise ValueError(f"Unsafe path in archive: {info.filename}")
+                zf.extract(info, target)
+        return
+    with tarfile.open(archive_path, "r:*") as tar:
+        for member in tar:
+            if member.name == DELTA_FILENAME:
+                continue
+            if not _safe_name(member.name) or not (member.isfile() or member.isdir()):
+                raise ValueError(f"Unsafe member in archive: {member.name}")
+            tar.extract(member, target, **_EXTRACT_FILTER)
+
+
+def _state_path(target: Path, delta: dict) -> Path:
+    """The target's assetkit_export.json, in the project directory named by the delta marker."""
+    project = delta.get("project")
+    if not isinstance(project, str) or not _safe_name(project) or len(PurePosixPath(project).parts) != 1:
+        raise ValueError(f"Invalid project name in delta: {project!r}")
+    return target / project / EXPORT_STATE_FILENAME
+
+
+def _target_manifest_id(state_path: Path) -> Optional[str]:
+    """Id of the export manifest the target was last brought up to (from its assetkit_export.json)."""
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state.get("id") if isinstance(state, dict) else None
+
+
+def apply_archive(archive_path: Path, target: Path) -> Optional[dict]:
+    """
+    Unpack a full or delta export into target. For a delta, the files it carries replace their old
+    versions and the files in its tombstone list are deleted (with directories left empty by that).
+    A delta is refused unless target was last brought up to exactly the export it is based on.
+    Returns the delta marker, or None for a full export.
+    """
+    delta = _read_delta(archive_path)
+    if delta is not None and delta.get("version") != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version in {archive_path}: {delta.get('version')}")
+    removed = delta.get("removed", []) if delta else []
+    unsafe = [name for name in removed if not _safe_name(name)]
+    if unsafe:
+        raise ValueError(f"Unsafe tombstone paths in archive: {unsafe}")
+    if delta is not None:
+        state_path = _state_path(target, delta)
+        current = _target_manifest_id(state_path)
+        if current is None:
+            raise ValueError(f"{state_path.parent} has no {EXPORT_STATE_FILENAME}; extract the full export "
+                             f"{delta.get('base')} there first")
+        if current != delta.get("base_id"):
+            raise ValueError(f"{target} does not match the base of this delta ({delta.get('base')}); "
+                             f"apply the exports in order, starting from a full export")
+
+    target.mkdir(parents=True, exist_ok=True)
+    _extract(archive_path, target)
+    for name in removed:
+        path = target / name
+        if path.is_file() or path.is_symlink():
+            path.unlink()
+        # Prune directories the deletion left empty, up to the target
+        parent = path.parent
+        while parent != target and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+    if delta is not None:
+        state = {"version": DELTA_VERSION, "id": delta["id"]}
+        state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    return delta
+
+
+def apply_cli(args):
+    archive_path = Path(args.archive).resolve()
+    target = Path(args.target).resolve()
+    if not archive_path.is_file():
+        print(f"[AssetKit ERROR] Archive not found: {archive_path}")
+        sys.exit(1)
+    try:
+        delta = apply_archive(archive_path, target)
+    except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        print(f"[AssetKit ERROR] Failed to apply {archive_path}: {e}")
+        sys.exit(1)
+    if delta is None:
+        print(f"[AssetKit] [OK] Extracted full export into: {target}")
+        return
+    counts = ", ".join(f"{len(delta.get(kind, []))} {kind}" for kind in ("added", "changed", "removed"))
+    print(f"[AssetKit] [OK] Applied delta on top of {delta.get('base')}: {counts}")
+
+
+def register_apply_command(subparsers):
+    parser = subparsers.add_parser("apply", help="Unpack a full or delta export (from 'assetkit export --since')")
+    parser.add_argument("archive", help="Archive written by 'assetkit export'")
+    parser.add_argument("--target", default=".", help="Directory the base export was extracted into (default: .)")
+    parser.set_defaults(func=apply_cli)
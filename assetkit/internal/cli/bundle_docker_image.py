@@ -10,6 +10,9 @@ import tempfile
 
 from assetkit.cli.new import create_new_project
 from assetkit.internal.generators.generate_asset_map import generate_asset_mapping
+from assetkit.internal.generators.generate_asset_digests import generate_asset_digests
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+from assetkit.verify import VerifyCache
 
 
 def bundle_docker_image_cli(args):
@@ -64,6 +67,20 @@ def bundle_docker_image_cli(args):
         print(f"[AssetKit ERROR] Failed to save Docker image: {image_name}")
         sys.exit(1)
 
+    # Refresh the prebuilt index and digests now that image.tar is in place
+    try:
+        generate_asset_index(package_path=asset_temp_dir / package_name, resource_root="resources")
+    except Exception as e:
+        print(f"[AssetKit ERROR] Failed to generate asset index: {e}")
+
+    # Hashing image.tar reads the whole image once; the shared digest cache keeps a later
+    # 'assetkit verify' or 'assetkit export' of the unchanged file from reading it again
+    try:
+        generate_asset_digests(package_path=asset_temp_dir / package_name, resource_root="resources",
+                               cache=VerifyCache())
+    except Exception as e:
+        print(f"[AssetKit ERROR] Failed to generate asset digests: {e}")
+
     # Step 4: Generate assets.py if requested
     if gen_assets_py:
         assets_py_path = asset_temp_dir / package_name / "assets.py"
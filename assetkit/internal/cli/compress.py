@@ -0,0 +1,86 @@
+# assetkit/internal/cli/compress.py
+
+import sys
+from pathlib import Path
+
+from assetkit.compression import CODEC_SUFFIXES
+from assetkit.internal.generators.compress_assets import compress_assets, read_compressed_manifest
+from assetkit.internal.generators.generate_asset_digests import DIGESTS_FILENAME, generate_asset_digests
+from assetkit.internal.generators.generate_asset_index import INDEX_FILENAME, generate_asset_index
+from assetkit.internal.generators.generate_asset_pack import PACK_FILENAME, generate_asset_pack
+
+
+def find_package_dir(path: Path) -> Path:
+    """Accept either the package directory itself or the project root that contains it."""
+    path = path.resolve()
+    if (path / "resources").is_dir():
+        return path
+    if (path / path.name / "resources").is_dir():
+        return path / path.name
+    print(f"[AssetKit ERROR] No resources/ directory found in: {path}")
+    sys.exit(1)
+
+
+def _ratio_line(key: str, size: int, compressed_size: int) -> str:
+    ratio = compressed_size / size if size else 1.0
+    return f"  - {key}: {size:,} -> {compressed_size:,} bytes ({ratio:.1%})"
+
+
+def compress_cli(args):
+    package_dir = find_package_dir(Path(args.package))
+    resource_dir = args.resource_dir.strip("/")
+
+    if args.report:
+        assets = read_compressed_manifest(package_dir)
+        if not assets:
+            print(f"[AssetKit] No compressed assets in: {package_dir}")
+            return
+        print(f"[AssetKit] Compressed assets in {package_dir}:")
+        for key, entry in sorted(assets.items()):
+            print(_ratio_line(key, entry["size"], entry["compressed_size"]) + f" [{entry['codec']}]")
+        return
+
+    try:
+        results = compress_assets(
+            package_dir,
+            resource_dir=resource_dir,
+            codec=args.codec,
+            patterns=args.include,
+            min_size=args.min_size,
+            level=args.level,
+        )
+    except (OSError, ValueError) as e:
+        print(f"[AssetKit ERROR] Compression failed: {e}")
+        sys.exit(1)
+
+    compressed = [r for r in results if r.skipped is None]
+    for r in results:
+        if r.skipped is None:
+            print(_ratio_line(r.key, r.size, r.compressed_size))
+        elif r.skipped != "too small":
+            print(f"  - {r.key}: skipped ({r.skipped})")
+    before = sum(r.size for r in compressed)
+    after = sum(r.compressed_size for r in compressed)
+    summary = f" ({after / before:.1%} of {before:,} bytes)" if before else ""
+    print(f"[AssetKit] [OK] Compressed {len(compressed)} assets with {args.codec}{summary}")
+
+    # Keep shipped indexes in step with the renamed files
+    if (package_dir / INDEX_FILENAME).exists():
+        generate_asset_index(package_path=package_dir, resource_root="resources")
+    if (package_dir / PACK_FILENAME).exists():
+        generate_asset_pack(package_path=package_dir, resource_root="resources")
+    if (package_dir / DIGESTS_FILENAME).exists():
+        generate_asset_digests(package_path=package_dir, resource_root="resources")
+
+
+def register_compress_command(subparsers):
+    parser = subparsers.add_parser("compress", help="Compress assets at build time (decompressed transparently at runtime)")
+    parser.add_argument("package", help="Path to the asset package directory or its project root")
+    parser.add_argument("--codec", choices=sorted(CODEC_SUFFIXES), default="gzip", help="Compression codec (default: gzip)")
+    parser.add_argument("--level", type=int, default=None, help="Compression level / preset (codec default if omitted)")
+    parser.add_argument("--include", nargs="*", default=None,
+                        help="Glob patterns of asset keys to compress, e.g. 'data/**/*.csv' (default: all)")
+    parser.add_argument("--min-size", type=int, default=1024, help="Skip assets smaller than this many bytes")
+    parser.add_argument("--resource-dir", default="resources/assets", help="Assets directory inside the package")
+    parser.add_argument("--report", action="store_true", help="Only print the compression ratio of compressed assets")
+    parser.set_defaults(func=compress_cli)
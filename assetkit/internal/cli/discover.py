@@ -0,0 +1,23 @@
+# assetkit/internal/cli/discover.py
+
+from assetkit.discovery import load_discovery_registry, registry_cache_path
+
+
+def discover_cli(args):
+    registry = load_discovery_registry(group=args.group, refresh=args.refresh)
+    if args.refresh:
+        print(f"[AssetKit] Discovery cache rebuilt: {registry_cache_path()}")
+
+    if not registry:
+        print(f"[AssetKit] No asset packages registered under '{args.group}'")
+        return
+    print(f"[AssetKit] Asset packages registered under '{args.group}':")
+    for name, entry in sorted(registry.items()):
+        print(f"  - {name} -> {entry['root'] or entry['module']}")
+
+
+def register_discover_command(subparsers):
+    parser = subparsers.add_parser("discover", help="List installed asset packages (cached discovery registry)")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild the on-disk discovery cache")
+    parser.add_argument("--group", default="assetkit.assets", help="Entry point group (default: assetkit.assets)")
+    parser.set_defaults(func=discover_cli)
@@ -1,23 +1,44 @@
-import tarfile
-from pathlib import Path
+import contextlib
 import sys
-import os
+from pathlib import Path
 
-EXCLUDE_NAMES = {"__pycache__", "build", "dist"}
-EXCLUDE_EXTENSIONS = {".pyc", ".pyo"}
-EXCLUDE_DIR_SUFFIXES = {".egg-info"}
+from assetkit.export import (
+    ARCHIVE_EXTENSIONS, DEFAULT_EXPORT_FORMAT, DEFAULT_EXPORT_LEVEL, FORMAT_ALIASES, iter_export_files, write_archive,
+)
+from assetkit.ignore import IGNORE_FILENAME, IgnoreRules, IgnoreStats
+from assetkit.internal.generators.generate_asset_digests import generate_asset_digests
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+from assetkit.internal.generators.generate_asset_pack import generate_asset_pack
+from assetkit.internal.generators.generate_export_manifest import (
+    DELTA_FILENAME, build_export_manifest, delta_marker, diff_export_manifests,
+    export_manifest_path, export_state, export_state_name, load_export_manifest, prime_digest_cache,
+    write_export_manifest,
+)
+from assetkit.verify import VerifyCache
 
-def should_exclude_path(path: Path) -> bool:
-    for part in path.parts:
-        if part in EXCLUDE_NAMES:
-            return True
-        if any(part.endswith(suffix) for suffix in EXCLUDE_DIR_SUFFIXES):
-            return True
-    if path.suffix in EXCLUDE_EXTENSIONS:
-        return True
-    return False
 
 def export_package_cli(args):
+    if getattr(args, "output", None) == "-":
+        # The archive owns stdout, so progress messages go to stderr
+        stream = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            _export(args, stream)
+        stream.flush()
+    else:
+        _export(args, None)
+
+
+def _print_ignore_stats(stats: IgnoreStats):
+    report = stats.report()
+    if not report:
+        print("[AssetKit] No files skipped by ignore rules")
+        return
+    print("[AssetKit] Skipped by ignore rules:")
+    for rule, files, size in report:
+        print(f"  {rule.pattern:<24} {files:>8} files {size:>14,} bytes  ({rule.source})")
+
+
+def _export(args, stream):
     package_path = Path(args.package).resolve()
     package_name = package_path.name
 
@@ -32,36 +53,147 @@ def export_package_cli(args):
         print(f"[AssetKit ERROR] Could not determine project root from: {package_path}")
         sys.exit(1)
 
-    if hasattr(args, "output") and args.output:
+    archive_format = getattr(args, "format", None) or DEFAULT_EXPORT_FORMAT
+    archive_format = FORMAT_ALIASES.get(archive_format, archive_format)
+    if archive_format not in ARCHIVE_EXTENSIONS:
+        print(f"[AssetKit ERROR] Unknown archive format: {archive_format} (choose from {', '.join(ARCHIVE_EXTENSIONS)})")
+        sys.exit(1)
+    since = getattr(args, "since", None)
+    if stream is not None:
+        archive_path = None
+    elif hasattr(args, "output") and args.output:
         archive_path = Path(args.output).resolve()
     else:
-        archive_path = Path.cwd() / f"{project_root.name}.tar.gz"
+        # A delta must not overwrite the full archive it is based on
+        suffix = "-delta" if since else ""
+        archive_path = Path.cwd() / f"{project_root.name}{suffix}{ARCHIVE_EXTENSIONS[archive_format]}"
+    base_manifest = None
+    if since:
+        base_manifest = load_export_manifest(Path(since))
+        if base_manifest is None:
+            print(f"[AssetKit ERROR] No export manifest found for: {export_manifest_path(Path(since))}")
+            sys.exit(1)
+        if archive_path and export_manifest_path(Path(since)).resolve() == export_manifest_path(archive_path):
+            print(f"[AssetKit ERROR] The delta archive would overwrite its base: {archive_path}")
+            sys.exit(1)
 
-    print(f"[AssetKit] Exporting package '{project_root}' to archive: {archive_path}")
+    dry_run = getattr(args, "dry_run", False)
+    if dry_run:
+        print(f"[AssetKit] Dry run: nothing is regenerated or written for '{project_root}'")
+    else:
+        print(f"[AssetKit] Exporting package '{project_root}' to archive: {archive_path or '<stdout>'}")
+    manifest_path = getattr(args, "manifest", None)
+    if manifest_path:
+        manifest_path = Path(manifest_path).resolve()
+    elif archive_path:
+        manifest_path = export_manifest_path(archive_path)
 
     if not project_root.exists():
         print(f"[AssetKit ERROR] Package directory does not exist: {project_root}")
         sys.exit(1)
 
+    # Files unchanged since they were last hashed (here, by verify, or per the base manifest) are not read again
+    digest_cache = VerifyCache()
+    if base_manifest is not None:
+        prime_digest_cache(digest_cache, base_manifest, project_root.parent)
+
+    # Refresh the prebuilt asset index and digest manifest so they ship inside the archive
+    asset_package_dir = project_root / project_root.name
+    if not dry_run and (asset_package_dir / "resources").is_dir():
+        generate_asset_index(
+            package_path=asset_package_dir,
+            resource_root="resources",
+            hashes=getattr(args, "index_hashes", False),
+        )
+        generate_asset_digests(package_path=asset_package_dir, resource_root="resources", cache=digest_cache)
+    pack = getattr(args, "pack", False)
+    if pack:
+        if not (asset_package_dir / "resources").is_dir():
+            print(f"[AssetKit ERROR] No resources/ directory to pack in: {asset_package_dir}")
+            sys.exit(1)
+        if not dry_run:
+            generate_asset_pack(package_path=asset_package_dir, resource_root="resources")
+    # With --pack the loose resources are replaced by assetkit_pack.bin in the archive
+    packed_resources = asset_package_dir / "resources"
+
+    try:
+        rules = IgnoreRules.for_project(project_root)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[AssetKit ERROR] Could not read {project_root / IGNORE_FILENAME}: {e}")
+        sys.exit(1)
+    stats = IgnoreStats() if getattr(args, "stats", False) else None
+    state_name = export_state_name(project_root.name)
+    # A tree brought up to date by 'assetkit apply' carries its own state file; the export writes a fresh one
+    files = [
+        (full_path, arcname)
+        for full_path, arcname in iter_export_files(project_root, skip_dir=packed_resources if pack else None,
+                                                    rules=rules, stats=stats)
+        if arcname != state_name
+    ]
     try:
-        with tarfile.open(archive_path, "w:gz") as tar:
-            for root, dirs, files in os.walk(project_root):
-                root_path = Path(root)
-                dirs[:] = [d for d in dirs if not should_exclude_path(root_path / d)]
-                for file in files:
-                    full_path = root_path / file
-                    rel_path = full_path.relative_to(project_root.parent)
-                    if not should_exclude_path(rel_path):
-                        tar.add(full_path, arcname=rel_path)
-        print(f"[AssetKit] Archive created: {archive_path}")
+        members = {}
+        manifest = None
+        if base_manifest is not None or not dry_run:
+            # Unchanged files (same size and mtime as in the base manifest) are not hashed again
+            manifest = build_export_manifest(files, base=base_manifest, cache=digest_cache)
+        if base_manifest is not None:
+            changes = diff_export_manifests(base_manifest, manifest)
+            if not changes:
+                if stats is not None:
+                    _print_ignore_stats(stats)
+                print(f"[AssetKit] [OK] Nothing changed since {since}; no archive written")
+                return
+            print(f"[AssetKit] Delta since {since}: {len(changes.added)} added, {len(changes.changed)} changed, "
+                  f"{len(changes.removed)} removed")
+            shipped = set(changes.added) | set(changes.changed)
+            files = [(full_path, arcname) for full_path, arcname in files if arcname in shipped]
+            members[DELTA_FILENAME] = delta_marker(changes, Path(since), base_manifest, manifest,
+                                                   project=project_root.name)
+        elif manifest is not None:
+            # Lets 'assetkit apply' check that a later delta is applied on top of this export
+            members[state_name] = export_state(manifest)
+        if dry_run:
+            total = sum(full_path.stat().st_size for full_path, _ in files)
+            print(f"[AssetKit] Would export {len(files)} files, {total:,} bytes")
+            if stats is not None:
+                _print_ignore_stats(stats)
+            return
+        write_archive(stream if stream is not None else archive_path, files, archive_format,
+                      level=getattr(args, "level", DEFAULT_EXPORT_LEVEL), jobs=getattr(args, "jobs", None),
+                      members=members)
+        # The manifest always describes the full tree, so a delta can be the base of the next one
+        if manifest_path:
+            write_export_manifest(manifest_path, manifest)
+        print(f"[AssetKit] Archive created: {archive_path or '<stdout>'}")
+        if stats is not None:
+            _print_ignore_stats(stats)
     except Exception as e:
         print(f"[AssetKit ERROR] Failed to export package: {e}")
         sys.exit(1)
 
 def register_export_package_command(subparsers):
     parser = subparsers.add_parser(
-        "export", help="Export an asset package to a .tar.gz archive"
+        "export", help="Export an asset package to a .tar.gz (or .tar, .tar.xz, .zip) archive"
     )
     parser.add_argument("package", help="Name or path to the asset package directory or root project directory")
-    parser.add_argument("--output", help="Optional path to write the archive to")
+    parser.add_argument("--output", help="Optional path to write the archive to ('-' streams it to stdout)")
+    parser.add_argument("--index-hashes", action="store_true", help="Record BLAKE2b digests in the asset index")
+    parser.add_argument("--pack", action="store_true",
+                        help="Ship resources/ as a single assetkit_pack.bin instead of individual files")
+    parser.add_argument("--format", type=lambda name: FORMAT_ALIASES.get(name, name), choices=list(ARCHIVE_EXTENSIONS),
+                        default=DEFAULT_EXPORT_FORMAT,
+                        help="Archive format; zip stores already-compressed assets as-is (default: gztar)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Threads compressing a gztar archive in parallel (default: one per CPU)")
+    parser.add_argument("--level", type=int, choices=range(1, 10), default=DEFAULT_EXPORT_LEVEL, metavar="1-9",
+                        help=f"gzip/zip compression level or xz preset (default: {DEFAULT_EXPORT_LEVEL})")
+    parser.add_argument("--since", metavar="ARCHIVE",
+                        help="Previous export (archive or its .manifest.json): write only what changed since, "
+                             "with a tombstone list for deleted files (see 'assetkit apply')")
+    parser.add_argument("--manifest", help="Where to write the export manifest (default: <archive>.manifest.json; "
+                                           "not written for --output - unless given)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report what would be exported without regenerating anything or writing an archive")
+    parser.add_argument("--stats", action="store_true",
+                        help=f"Report the files and bytes each ignore rule (defaults and {IGNORE_FILENAME}) skipped")
     parser.set_defaults(func=export_package_cli)
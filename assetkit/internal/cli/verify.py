@@ -0,0 +1,42 @@
+# assetkit/internal/cli/verify.py
+
+import sys
+from pathlib import Path
+
+from assetkit.asset_manager import AssetManager
+
+
+def verify_cli(args):
+    package = args.package
+    # A filesystem path may point at the project root rather than the package directory
+    path = Path(package)
+    if path.is_dir() and not (path / args.resource_dir).is_dir() and (path / path.name / args.resource_dir).is_dir():
+        package = path / path.name
+
+    try:
+        manager = AssetManager(package_root=package, resource_dir=args.resource_dir)
+        result = manager.verify(max_workers=args.jobs, use_cache=not args.no_cache)
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"[AssetKit ERROR] {e}")
+        sys.exit(2)
+
+    for key in result.missing:
+        print(f"  - missing: {key}")
+    for key in result.mismatched:
+        print(f"  - mismatched: {key}")
+    for key in result.unexpected:
+        print(f"  - not in manifest: {key}")
+    if not result.ok:
+        print(f"[AssetKit ERROR] Verification failed: {len(result.mismatched)} mismatched, "
+              f"{len(result.missing)} missing of {result.checked} assets")
+        sys.exit(1)
+    print(f"[AssetKit] [OK] Verified {result.checked} assets")
+
+
+def register_verify_command(subparsers):
+    parser = subparsers.add_parser("verify", help="Check an asset package against its digest manifest")
+    parser.add_argument("package", help="Installed package name, or path to the package directory / project root")
+    parser.add_argument("--resource-dir", default="resources", help="Resource directory to verify (default: resources)")
+    parser.add_argument("--jobs", type=int, default=8, help="Files hashed concurrently (default: 8)")
+    parser.add_argument("--no-cache", action="store_true", help="Rehash every file instead of reusing cached results")
+    parser.set_defaults(func=verify_cli)
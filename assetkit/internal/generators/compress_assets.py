@@ -0,0 +1,125 @@
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from assetkit.compression import (
+    CODEC_SUFFIXES, COMPRESSED_MANIFEST, COMPRESSED_MANIFEST_VERSION, is_compressed_format, open_compressor,
+)
+from assetkit.index import glob_to_regex, scan_tree
+
+
+class CompressionResult(NamedTuple):
+    key: str
+    size: int
+    compressed_size: Optional[int]
+    skipped: Optional[str] = None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Compressed size as a fraction of the original (None when the asset was not compressed)."""
+        if self.compressed_size is None:
+            return None
+        return self.compressed_size / self.size if self.size else 1.0
+
+
+def _write_manifest(package_path: Path, assets: Dict[str, dict]):
+    manifest = {"version": COMPRESSED_MANIFEST_VERSION, "assets": assets}
+    (package_path / COMPRESSED_MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def read_compressed_manifest(package_path: Path) -> Dict[str, dict]:
+    path = Path(package_path) / COMPRESSED_MANIFEST
+    if not path.is_file():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != COMPRESSED_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported compressed manifest version in {path}")
+    return data["assets"]
+
+
+def compress_assets(package_path: Path, resource_dir: str = "resources/assets", codec: str = "gzip",
+                    patterns: Optional[Sequence[str]] = None, min_size: int = 1024, level: Optional[int] = None,
+                    min_saving: float = 0.05) -> List[CompressionResult]:
+    """
+    Compress assets in place at build time and record them in assetkit_compressed.json.
+
+    Each chosen file is replaced by "<name><codec suffix>" (e.g. data.csv -> data.csv.gz); AssetManager
+    keeps serving it under its original key and decompresses it on read. Already-compressed formats
+    (by suffix or magic bytes) and files that would shrink by less than min_saving are left alone.
+
+    Parameters:
+    - package_path: Path to the Python package directory (e.g., Path("my_package/my_package"))
+    - resource_dir: Relative path of the assets directory; patterns are matched against keys below it
+    - codec: "gzip", "lzma" or "zlib"
+    - patterns: Glob patterns of keys to compress (e.g. "data/**/*.csv"); all keys when omitted
+    - min_size: Skip files smaller than this many bytes
+    - level: Codec compression level / preset (codec default when omitted)
+    - min_saving: Minimum fraction of the size that compression must save to be kept
+    """
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(f"Unknown compression codec: {codec} (choose from {', '.join(CODEC_SUFFIXES)})")
+    package_path = Path(package_path).resolve()
+    resource_dir = resource_dir.replace("\\", "/").strip("/")
+    base = package_path / resource_dir
+    if not base.is_dir():
+        raise FileNotFoundError(f"Resource directory '{base}' does not exist.")
+
+    assets = read_compressed_manifest(package_path)
+    stored_names = {entry["stored"] for entry in assets.values()}
+    matchers = [re.compile(glob_to_regex(p)) for p in patterns or []]
+    suffix = CODEC_SUFFIXES[codec]
+    results = []
+
+    files, _ = scan_tree(base)
+    existing = set(files)
+    for key in sorted(files):
+        pkg_key = f"{resource_dir}/{key}"
+        if pkg_key in stored_names:
+            continue
+        if matchers and not any(m.match(key) for m in matchers):
+            continue
+        full_path = base / key
+        st = os.stat(full_path)
+        if st.st_size < min_size:
+            results.append(CompressionResult(key, st.st_size, None, "too small"))
+            continue
+        with open(full_path, "rb") as f:
+            head = f.read(8)
+        if is_compressed_format(key, head):
+            results.append(CompressionResult(key, st.st_size, None, "already compressed"))
+            continue
+        if key + suffix in existing:
+            results.append(CompressionResult(key, st.st_size, None, f"{key + suffix} exists"))
+            continue
+
+        fd, tmp_name = tempfile.mkstemp(dir=full_path.parent, prefix=".tmp-compress-")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                with open(full_path, "rb") as src, open_compressor(dst, codec, level) as out:
+                    for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                        out.write(chunk)
+                compressed_size = dst.tell()
+            if compressed_size > st.st_size * (1 - min_saving):
+                os.unlink(tmp_name)
+                results.append(CompressionResult(key, st.st_size, None, "no gain"))
+                continue
+            os.replace(tmp_name, f"{full_path}{suffix}")
+            os.unlink(full_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        assets[pkg_key] = {
+            "codec": codec,
+            "stored": pkg_key + suffix,
+            "size": st.st_size,
+            "compressed_size": compressed_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        results.append(CompressionResult(key, st.st_size, compressed_size))
+
+    _write_manifest(package_path, assets)
+    return results
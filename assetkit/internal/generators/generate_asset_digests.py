@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, IO, Optional
+
+from assetkit.compression import load_compressed_manifest, open_decompressed
+
+DIGESTS_FILENAME = "assetkit_digests.json"
+DIGESTS_VERSION = 1
+DIGEST_ALGORITHM = "blake2b-256"
+
+
+def hash_stream(open_stream: Callable[[], IO[bytes]], chunk_size: int = 1024 * 1024) -> str:
+    """
+    BLAKE2b-256 hex digest of a binary stream, read in chunks. hashlib releases the GIL on large
+    updates, so several streams can be hashed in parallel on threads.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open_stream() as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generate_asset_digests(package_path: Path, resource_root: str = "resources", max_workers: int = 8,
+                           output_filename: str = DIGESTS_FILENAME, cache=None) -> Path:
+    """
+    Generate a digest manifest (assetkit_digests.json) at the root of a package.
+
+    Records {key: [size, BLAKE2b-256 hex digest]} of every asset's contents, keyed by path relative
+    to the package. Build-time compressed assets are recorded under their original key with the
+    digest of their decompressed contents, so it always matches AssetFile.bytes(). With a cache,
+    files whose (device, inode, size, mtime) are unchanged since they were last hashed are not read.
+
+    Parameters:
+    - package_path: Path to the Python package directory (e.g., Path("my_package/my_package"))
+    - resource_root: Relative path of the directory to hash (default: "resources")
+    - max_workers: Files hashed concurrently
+    - output_filename: Filename of the manifest, written inside package_path
+    - cache: Optional assetkit.verify.VerifyCache to reuse and record digests in (saved afterwards)
+    """
+    package_path = Path(package_path).resolve()
+    root = package_path / resource_root
+    if not root.is_dir():
+        raise FileNotFoundError(f"Resource directory '{root}' does not exist.")
+
+    root_rel = resource_root.replace("\\", "/").strip("/")
+    compressed = {entry.stored: (key, entry) for key, entry in load_compressed_manifest(package_path).items()}
+    jobs = {}
+    for current, subdirs, filenames in os.walk(root):
+        rel_current = Path(current).relative_to(package_path).as_posix()
+        for name in filenames:
+            jobs[f"{rel_current}/{name}"] = os.path.join(current, name)
+
+    def cached_hash(full_path, codec=None):
+        st = os.stat(full_path)
+        digest = cache.get(st, codec) if cache is not None else None
+        if digest is None:
+            if codec is None:
+                digest = hash_stream(lambda: open(full_path, "rb"))
+            else:
+                digest = hash_stream(lambda: open_decompressed(open(full_path, "rb"), codec))
+            if cache is not None:
+                cache.put(st, digest, codec)
+        return st.st_size, digest
+
+    def digest_one(item):
+        rel, full_path = item
+        if rel in compressed:
+            key, entry = compressed[rel]
+            return key, [entry.size, cached_hash(full_path, entry.codec)[1]]
+        return rel, list(cached_hash(full_path))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="assetkit-hash") as pool:
+        files = dict(sorted(pool.map(digest_one, jobs.items())))
+    if cache is not None:
+        cache.save()
+
+    manifest = {
+        "version": DIGESTS_VERSION,
+        "algorithm": DIGEST_ALGORITHM,
+        "root": root_rel,
+        "files": files,
+    }
+    output_path = package_path / output_filename
+    text = json.dumps(manifest, separators=(",", ":"))
+    # Rewritten only when something changed, so exports see an unchanged file as unchanged
+    if not output_path.is_file() or output_path.read_text(encoding="utf-8") != text:
+        output_path.write_text(text, encoding="utf-8")
+    print(f"[AssetKit] [OK] Generated asset digests: {output_path} ({len(files)} files)")
+    return output_path
+
+
+def load_asset_digests(package_root) -> Optional[Dict[str, list]]:
+    """
+    Load {key: [size, digest]} from a package root (Path or importlib.resources Traversable).
+    Returns None when the manifest is missing, unreadable or from another format version.
+    """
+    manifest = package_root / DIGESTS_FILENAME
+    try:
+        if not manifest.is_file():
+            return None
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != DIGESTS_VERSION:
+        return None
+    if data.get("algorithm") != DIGEST_ALGORITHM:
+        return None
+    return data["files"]
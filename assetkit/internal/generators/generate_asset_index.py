@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+
+from assetkit.internal.generators.generate_asset_digests import hash_stream
+
+INDEX_FILENAME = "assetkit_index.json"
+INDEX_VERSION = 1
+
+
+def generate_asset_index(package_path: Path, resource_root: str = "resources", hashes: bool = False,
+                         output_filename: str = INDEX_FILENAME) -> Path:
+    """
+    Generate a prebuilt asset index (assetkit_index.json) at the root of a package.
+
+    The index lists every file below resource_root with its size and mtime, keyed by its
+    path relative to the package, so AssetManager can load it in one read instead of walking.
+
+    Parameters:
+    - package_path: Path to the Python package directory (e.g., Path("my_package/my_package"))
+    - resource_root: Relative path of the directory to index (default: "resources")
+    - hashes: Also record the BLAKE2b-256 digest of each file (as hashed by generate_asset_digests)
+    - output_filename: Filename of the index, written inside package_path
+    """
+    package_path = Path(package_path).resolve()
+    root = package_path / resource_root
+    if not root.is_dir():
+        raise FileNotFoundError(f"Resource directory '{root}' does not exist.")
+
+    root_rel = resource_root.replace("\\", "/").strip("/")
+    dirs = [root_rel]
+    files = {}
+    for current, subdirs, filenames in os.walk(root):
+        subdirs.sort()
+        rel_current = Path(current).relative_to(package_path).as_posix()
+        for name in subdirs:
+            dirs.append(f"{rel_current}/{name}")
+        for name in sorted(filenames):
+            full_path = os.path.join(current, name)
+            st = os.stat(full_path)
+            entry = [st.st_size, st.st_mtime_ns]
+            if hashes:
+                entry.append(hash_stream(lambda: open(full_path, "rb")))
+            files[f"{rel_current}/{name}"] = entry
+
+    index = {
+        "version": INDEX_VERSION,
+        "root": root_rel,
+        "dirs": dirs,
+        "files": files,
+    }
+    output_path = package_path / output_filename
+    text = json.dumps(index, separators=(",", ":"))
+    # Rewritten only when something changed, so exports see an unchanged file as unchanged
+    if not output_path.is_file() or output_path.read_text(encoding="utf-8") != text:
+        output_path.write_text(text, encoding="utf-8")
+    print(f"[AssetKit] [OK] Generated asset index: {output_path} ({len(files)} files)")
+    return output_path
+
+
+def load_asset_index(package_root) -> dict:
+    """
+    Load a prebuilt index from a package root (Path or importlib.resources Traversable).
+    Returns None when the index is missing, unreadable or from another format version.
+    """
+    index_file = package_root / INDEX_FILENAME
+    try:
+        if not index_file.is_file():
+            return None
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
@@ -44,7 +44,7 @@ def generate_asset_mapping(package_path: Path, resource_dir: str = "resources/as
     content = (
         f"from pathlib import Path\n"
         f"from assetkit import AssetManager\n\n"
-        f"_assets = AssetManager(package_root=Path(__file__).parent, resource_dir={repr(resource_dir)})\n\n"
+        f"_assets = AssetManager.get(Path(__file__).parent, resource_dir={repr(resource_dir)})\n\n"
         f"class AssetsProxy:\n"
         f"    def __init__(self, manager):\n"
         f"        self._manager = manager\n\n"
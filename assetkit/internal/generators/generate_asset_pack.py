@@ -0,0 +1,74 @@
+import json
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+
+PACK_FILENAME = "assetkit_pack.bin"
+PACK_MAGIC = b"AKPACK\x00\x01"
+PACK_VERSION = 1
+# magic, table offset, table length
+PACK_HEADER = struct.Struct("<8sQQ")
+PACK_ALIGNMENT = 8
+
+
+def generate_asset_pack(package_path: Path, resource_root: str = "resources",
+                        output_filename: str = PACK_FILENAME) -> Path:
+    """
+    Generate a single-file asset pack (assetkit_pack.bin) at the root of a package.
+
+    All files below resource_root are concatenated into one blob, followed by a JSON table of
+    {key: [offset, size, mtime_ns]} keyed by path relative to the package (as in assetkit_index.json).
+    AssetManager maps the pack once and serves each asset as a slice of that map.
+
+    Parameters:
+    - package_path: Path to the Python package directory (e.g., Path("my_package/my_package"))
+    - resource_root: Relative path of the directory to pack (default: "resources")
+    - output_filename: Filename of the pack, written inside package_path
+    """
+    package_path = Path(package_path).resolve()
+    root = package_path / resource_root
+    if not root.is_dir():
+        raise FileNotFoundError(f"Resource directory '{root}' does not exist.")
+
+    root_rel = resource_root.replace("\\", "/").strip("/")
+    dirs = [root_rel]
+    files = {}
+    output_path = package_path / output_filename
+    fd, tmp_name = tempfile.mkstemp(dir=package_path, prefix=".tmp-pack-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(PACK_HEADER.pack(PACK_MAGIC, 0, 0))
+            for current, subdirs, filenames in os.walk(root):
+                subdirs.sort()
+                rel_current = Path(current).relative_to(package_path).as_posix()
+                for name in subdirs:
+                    dirs.append(f"{rel_current}/{name}")
+                for name in sorted(filenames):
+                    full_path = os.path.join(current, name)
+                    # Aligned offsets keep slices friendly to numpy.frombuffer and friends
+                    offset = out.tell()
+                    padding = -offset % PACK_ALIGNMENT
+                    out.write(b"\0" * padding)
+                    offset += padding
+                    with open(full_path, "rb") as src:
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                    st = os.stat(full_path)
+                    files[f"{rel_current}/{name}"] = [offset, out.tell() - offset, st.st_mtime_ns]
+
+            table = json.dumps(
+                {"version": PACK_VERSION, "root": root_rel, "dirs": dirs, "files": files},
+                separators=(",", ":"),
+            ).encode("utf-8")
+            table_offset = out.tell()
+            out.write(table)
+            out.seek(0)
+            out.write(PACK_HEADER.pack(PACK_MAGIC, table_offset, len(table)))
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    print(f"[AssetKit] [OK] Generated asset pack: {output_path} ({len(files)} files)")
+    return output_path
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from assetkit.internal.generators.generate_asset_digests import DIGEST_ALGORITHM, hash_stream
+
+EXPORT_MANIFEST_SUFFIX = ".manifest.json"
+EXPORT_MANIFEST_VERSION = 1
+# Written at the top of a delta archive: what the delta changes relative to its base export
+DELTA_FILENAME = "assetkit_delta.json"
+DELTA_VERSION = 2
+# Written into the project directory of a full archive (so the archive keeps a single top-level
+# directory) and kept up to date in the target by 'assetkit apply': the id of the export manifest
+# the extracted tree matches
+EXPORT_STATE_FILENAME = "assetkit_export.json"
+
+
+class ExportChanges(NamedTuple):
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+def export_manifest_path(archive_path: Path) -> Path:
+    """Sidecar manifest of an archive: <archive>.manifest.json. A manifest path is returned unchanged."""
+    archive_path = Path(archive_path)
+    if archive_path.name.endswith(EXPORT_MANIFEST_SUFFIX):
+        return archive_path
+    return archive_path.with_name(archive_path.name + EXPORT_MANIFEST_SUFFIX)
+
+
+def build_export_manifest(files: Iterable[Tuple[Path, str]], base: Optional[Dict[str, list]] = None,
+                          max_workers: int = 8, cache=None) -> Dict[str, list]:
+    """
+    Return {archive name: [size, mtime_ns, BLAKE2b-256 digest]} for (path, archive name) pairs.
+
+    Files whose size and mtime match their entry in base (a previous manifest) keep its digest
+    without being read, and so do files found in cache, so only new and touched files are hashed,
+    on a thread pool.
+
+    Parameters:
+    - files: (path on disk, name inside the archive) pairs, e.g. from iter_export_files()
+    - base: files of a previous export manifest to reuse digests from
+    - max_workers: Files hashed concurrently
+    - cache: Optional assetkit.verify.VerifyCache to reuse and record digests in (saved afterwards)
+    """
+    base = base or {}
+
+    def entry(item):
+        full_path, arcname = item
+        st = os.stat(full_path)
+        previous = base.get(arcname)
+        if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+            return arcname, [st.st_size, st.st_mtime_ns, previous[2]]
+        digest = cache.get(st) if cache is not None else None
+        if digest is None:
+            digest = hash_stream(lambda: open(full_path, "rb"))
+            if cache is not None:
+                cache.put(st, digest)
+        return arcname, [st.st_size, st.st_mtime_ns, digest]
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="assetkit-hash") as pool:
+        manifest = dict(sorted(pool.map(entry, files)))
+    if cache is not None:
+        cache.save()
+    return manifest
+
+
+def prime_digest_cache(cache, files: Dict[str, list], root: Path):
+    """
+    Record the digests of a manifest's files that still have their recorded size and mtime in a
+    VerifyCache, so regenerating the package's digest manifest does not read them again.
+    root is the directory archive names are relative to (the project's parent).
+    """
+    for arcname, (size, mtime_ns, digest) in files.items():
+        try:
+            st = os.stat(Path(root) / arcname)
+        except OSError:
+            continue
+        if st.st_size == size and st.st_mtime_ns == mtime_ns:
+            cache.put(st, digest)
+
+
+def manifest_id(files: Dict[str, list]) -> str:
+    """Identifier of an export manifest: the BLAKE2b-128 digest of its files, serialized canonically."""
+    data = json.dumps(files, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def export_state_name(project: str) -> str:
+    """Archive name of the assetkit_export.json member: inside the project directory."""
+    return f"{project}/{EXPORT_STATE_FILENAME}"
+
+
+def export_state(files: Dict[str, list]) -> bytes:
+    """Contents of the assetkit_export.json member of a full archive."""
+    return json.dumps({"version": DELTA_VERSION, "id": manifest_id(files)}, indent=2).encode("utf-8")
+
+
+def diff_export_manifests(base: Dict[str, list], current: Dict[str, list]) -> ExportChanges:
+    """Archive names added, changed (different digest) and removed between two manifests."""
+    added = [name for name in current if name not in base]
+    changed = [name for name in current if name in base and base[name][2] != current[name][2]]
+    removed = [name for name in base if name not in current]
+    return ExportChanges(sorted(added), sorted(changed), sorted(removed))
+
+
+def write_export_manifest(path: Path, files: Dict[str, list]) -> Path:
+    manifest = {"version": EXPORT_MANIFEST_VERSION, "algorithm": DIGEST_ALGORITHM, "files": files}
+    path = Path(path)
+    path.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+    return path
+
+
+def load_export_manifest(path: Path) -> Optional[Dict[str, list]]:
+    """
+    Load the files of an export manifest (or of the sidecar manifest of an archive path).
+    Returns None when it is missing, unreadable or from another format version.
+    """
+    try:
+        data = json.loads(export_manifest_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != EXPORT_MANIFEST_VERSION:
+        return None
+    if data.get("algorithm") != DIGEST_ALGORITHM:
+        return None
+    return data["files"]
+
+
+def delta_marker(changes: ExportChanges, base_path: Path, base_files: Dict[str, list],
+                 files: Dict[str, list], project: str) -> bytes:
+    """
+    Contents of the assetkit_delta.json member of a delta archive: the tombstone list, the ids of
+    the manifests it goes from and to, so it is only ever applied on top of its base, and the
+    project directory holding the target's assetkit_export.json.
+    """
+    return json.dumps({
+        "version": DELTA_VERSION,
+        "project": project,
+        "base": Path(base_path).name,
+        "base_id": manifest_id(base_files),
+        "id": manifest_id(files),
+        "added": changes.added,
+        "changed": changes.changed,
+        "removed": changes.removed,
+    }, indent=2).encode("utf-8")
@@ -0,0 +1,175 @@
+import io
+import json
+import mmap as _mmap
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from assetkit.internal.generators.generate_asset_pack import PACK_FILENAME, PACK_HEADER, PACK_MAGIC, PACK_VERSION
+
+
+class AssetPack:
+    """
+    Read-only view of an assetkit_pack.bin: one buffer (normally a single mmap of the file)
+    plus the {key: (offset, size, mtime_ns)} table. Member contents are zero-copy slices.
+    """
+
+    def __init__(self, buffer, name: str = "<pack>"):
+        view = memoryview(buffer)
+        if len(view) < PACK_HEADER.size:
+            raise ValueError(f"AssetPack: truncated pack: {name}")
+        magic, table_offset, table_length = PACK_HEADER.unpack_from(view)
+        if magic != PACK_MAGIC or table_offset + table_length > len(view):
+            raise ValueError(f"AssetPack: not an asset pack: {name}")
+        table = json.loads(view[table_offset:table_offset + table_length].tobytes())
+        if table.get("version") != PACK_VERSION:
+            raise ValueError(f"AssetPack: unsupported pack version {table.get('version')}: {name}")
+
+        self.name = name
+        self.root: str = table["root"]
+        self.dirs: List[str] = table["dirs"]
+        self.files: Dict[str, Tuple[int, int, int]] = {key: tuple(entry) for key, entry in table["files"].items()}
+        self._buffer = buffer
+        self._view = view
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "AssetPack":
+        """Map a pack file into memory; pages are loaded by the OS as members are touched."""
+        with open(path, "rb") as f:
+            mm = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        try:
+            return cls(mm, name=str(path))
+        except BaseException:
+            mm.close()
+            raise
+
+    @classmethod
+    def load(cls, package_root) -> Optional["AssetPack"]:
+        """
+        Load the pack shipped at a package root (Path or importlib.resources Traversable).
+        Filesystem packs are memory-mapped; packs inside zips are read into memory once.
+        Returns None when the package has no valid pack.
+        """
+        pack_file = package_root / PACK_FILENAME
+        try:
+            if not pack_file.is_file():
+                return None
+            if isinstance(pack_file, Path):
+                return cls.open(pack_file)
+            return cls(pack_file.read_bytes(), name=str(pack_file))
+        except (OSError, ValueError):
+            return None
+
+    def index(self, prefix: str) -> Dict[str, Tuple[int, int]]:
+        """{key relative to prefix: (size, mtime_ns)} for every member below prefix."""
+        start = prefix + "/" if prefix else ""
+        return {key[len(start):]: (size, mtime) for key, (_, size, mtime) in self.files.items()
+                if key.startswith(start)}
+
+    def view(self, key: str) -> memoryview:
+        offset, size, _ = self.files[key]
+        return self._view[offset:offset + size]
+
+    def member(self, key: str) -> "PackMember":
+        if key not in self.files:
+            raise KeyError(f"Asset not found in pack: {key}")
+        return PackMember(self, key)
+
+    def close(self):
+        self._view.release()
+        if isinstance(self._buffer, _mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # Member views are still exported; the map is released with the last of them
+                pass
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __repr__(self):
+        return f"<AssetPack '{self.name}' {len(self.files)} files>"
+
+
+class _ViewReader(io.RawIOBase):
+    """Seekable raw stream over a memoryview, so open() on a pack member never copies the whole member."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class PackMember:
+    """
+    One asset inside an AssetPack, exposing the subset of the importlib.resources Traversable
+    interface that AssetFile uses, plus view() for zero-copy access.
+    """
+
+    __slots__ = ("_pack", "_key", "name")
+
+    def __init__(self, pack: AssetPack, key: str):
+        self._pack = pack
+        self._key = key
+        self.name = key.rpartition("/")[2]
+
+    def view(self) -> memoryview:
+        return self._pack.view(self._key)
+
+    def read_bytes(self) -> bytes:
+        return self.view().tobytes()
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return str(self.view(), encoding)
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        return self.view()[offset:offset + length].tobytes()
+
+    def open(self, mode: str = "rb", encoding: str = "utf-8"):
+        stream = io.BufferedReader(_ViewReader(self.view()))
+        if mode == "rb":
+            return stream
+        return io.TextIOWrapper(stream, encoding=encoding)
+
+    def is_file(self) -> bool:
+        return True
+
+    def is_dir(self) -> bool:
+        return False
+
+    def exists(self) -> bool:
+        return True
+
+    def __str__(self):
+        return f"{self._pack.name}!/{self._key}"
+
+    def __repr__(self):
+        return f"<PackMember {self}>"
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import tempfile
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from assetkit.asset_manager import AssetFile, AssetManager
+from assetkit.cache import default_cache_dir
+from assetkit.discovery import discover_asset_managers, environment_fingerprint, resource_tree_fingerprint
+from assetkit.index import AssetIndex
+
+REGISTRY_INDEX_VERSION = 1
+
+
+class AssetRegistry:
+    """
+    Federated view over many asset packages, backed by one merged index.
+
+    Assets are addressed as "pkg:key" for a specific package, or as a plain "key", which resolves
+    to the highest-precedence package that provides it. Queries (glob/prefix/listdir) run once over
+    the merged index instead of once per package.
+    """
+
+    SEPARATOR = ":"
+
+    def __init__(self, managers: Mapping[str, AssetManager], precedence: Optional[Sequence[str]] = None,
+                 providers: Optional[Dict[str, Sequence[str]]] = None):
+        """
+        :param managers: Mapping of package name -> AssetManager (e.g. from discover_asset_managers())
+        :param precedence: Package names that win duplicate keys, highest first; the remaining
+                           packages follow in name order
+        :param providers: Prebuilt {key: [package, ...]} table (see load()); built from the managers if omitted
+        """
+        self._managers = managers
+        self._precedence = list(precedence or [])
+        if providers is None:
+            providers = self._collect_providers()
+        self._packages = self._ordered_packages(set(p for names in providers.values() for p in names))
+        rank = {name: i for i, name in enumerate(self._packages)}
+        self._index = AssetIndex({
+            key: tuple(sorted(names, key=rank.__getitem__)) for key, names in providers.items()
+        })
+
+    def _collect_providers(self) -> Dict[str, List[str]]:
+        warm = getattr(self._managers, "warm", None)
+        if warm is not None:
+            warm()
+        providers: Dict[str, List[str]] = {}
+        for package, manager in self._managers.items():
+            for key in manager.list():
+                providers.setdefault(key, []).append(package)
+        return providers
+
+    def _ordered_packages(self, packages: Iterable[str]) -> List[str]:
+        packages = set(packages)
+        ordered = [p for p in self._precedence if p in packages]
+        return ordered + sorted(packages - set(ordered))
+
+    def resolve(self, address: str) -> Tuple[str, str]:
+        """
+        Return (package, key) for an address, applying precedence to unqualified keys.
+        """
+        package, sep, key = address.partition(self.SEPARATOR)
+        if sep and package in self._packages:
+            providers = self._index.get(key, ())
+            if package not in providers:
+                raise KeyError(f"Asset not found: {address}")
+            return package, key
+        providers = self._index.get(address)
+        if not providers:
+            raise KeyError(f"Asset not found: {address}")
+        return providers[0], address
+
+    def __getitem__(self, address: str) -> AssetFile:
+        package, key = self.resolve(address)
+        return self._managers[package][key]
+
+    def __contains__(self, address: str) -> bool:
+        try:
+            self.resolve(address)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def providers(self, key: str) -> List[str]:
+        """Packages that provide key, in precedence order."""
+        return list(self._index.get(key, ()))
+
+    def packages(self) -> List[str]:
+        """Packages contributing at least one key, in precedence order."""
+        return list(self._packages)
+
+    def _format(self, keys: Iterable[str], qualified: bool) -> Iterable[str]:
+        if not qualified:
+            return keys
+        return (f"{self._index[key][0]}{self.SEPARATOR}{key}" for key in keys)
+
+    def list(self, qualified: bool = False) -> List[str]:
+        """All keys in sorted order; qualified=True returns "pkg:key" of the winning package."""
+        return list(self._format(self._index.keys(), qualified))
+
+    def glob(self, pattern: str, limit: Optional[int] = None, after: Optional[str] = None,
+             qualified: bool = False) -> List[str]:
+        return list(self._format(islice(self._index.iter_glob(pattern, after=after), limit), qualified))
+
+    def prefix(self, prefix: str, limit: Optional[int] = None, after: Optional[str] = None,
+               qualified: bool = False) -> List[str]:
+        return list(self._format(islice(self._index.iter_prefix(prefix, after=after), limit), qualified))
+
+    def listdir(self, rel_dir: str = "") -> List[str]:
+        return self._index.listdir(rel_dir)
+
+    def save(self, path: Union[str, Path], fingerprint: Optional[str] = None):
+        """
+        Persist the merged index (keys and their providers) as JSON, written atomically.
+        """
+        packages = sorted(self._packages)
+        ids = {name: i for i, name in enumerate(packages)}
+        data = {
+            "version": REGISTRY_INDEX_VERSION,
+            "fingerprint": fingerprint,
+            "packages": packages,
+            "keys": {key: [ids[p] for p in self._index[key]] for key in self._index},
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-registry-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path], managers: Mapping[str, AssetManager],
+             precedence: Optional[Sequence[str]] = None, fingerprint: Optional[str] = None) -> Optional["AssetRegistry"]:
+        """
+        Load a merged index written by save(). Returns None when the file is missing, unreadable,
+        from another version, or was saved under a different fingerprint.
+        Managers are not built until an asset is actually accessed.
+        """
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != REGISTRY_INDEX_VERSION:
+            return None
+        if fingerprint is not None and data.get("fingerprint") != fingerprint:
+            return None
+        packages = data["packages"]
+        # Names only: looking packages up (or iterating DiscoveredManagers) would build every manager
+        names = getattr(managers, "names", None)
+        available = set(names() if names is not None else managers)
+        if any(p not in available for p in packages):
+            return None
+        providers = {key: [packages[i] for i in ids] for key, ids in data["keys"].items()}
+        return cls(managers, precedence=precedence, providers=providers)
+
+    @classmethod
+    def from_discovery(cls, group: str = "assetkit.assets", precedence: Optional[Sequence[str]] = None,
+                       persist: bool = True, refresh: bool = False, **manager_kwargs) -> "AssetRegistry":
+        """
+        Build a registry over every installed asset package.
+
+        With persist=True the merged index is cached under the AssetKit cache dir and reused while
+        the installed distributions and the packages' resource directories are unchanged, so startup
+        does not re-index every package (assets added to an editable install still invalidate it).
+        """
+        managers = discover_asset_managers(group=group, **manager_kwargs)
+        if not persist:
+            return cls(managers, precedence=precedence)
+
+        fingerprint = f"{environment_fingerprint()}:{resource_tree_fingerprint(managers)}"
+        name = hashlib.blake2b(group.encode(), digest_size=8).hexdigest()
+        path = default_cache_dir() / f"registry-{name}.json"
+        registry = None if refresh else cls.load(path, managers, precedence=precedence, fingerprint=fingerprint)
+        if registry is None:
+            registry = cls(managers, precedence=precedence)
+            try:
+                registry.save(path, fingerprint=fingerprint)
+            except OSError:
+                pass
+        return registry
+
+    def __repr__(self):
+        return f"<AssetRegistry {len(self._index)} keys>"
@@ -0,0 +1,82 @@
+import mmap
+import os
+import sys
+from multiprocessing import shared_memory
+from typing import Optional
+
+from assetkit.index import CompactAssetIndex
+
+
+def _map_shared_memory(name: str) -> mmap.mmap:
+    """
+    Map an existing block read-only. The mapping is our own mmap rather than the SharedMemory object,
+    so index views over it can outlive the handle (which is closed right away).
+    """
+    if sys.version_info >= (3, 13):
+        block = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        from multiprocessing import resource_tracker
+        # Pool workers share the parent's tracker; only a tracker of our own would unlink the
+        # parent's block when this process exits, so only then is the registration dropped
+        own_tracker = getattr(resource_tracker._resource_tracker, "_fd", None) is None
+        block = shared_memory.SharedMemory(name=name)
+        if own_tracker:
+            resource_tracker.unregister(block._name, "shared_memory")
+    try:
+        if os.name == "nt":
+            return mmap.mmap(-1, block.size, tagname=name, access=mmap.ACCESS_READ)
+        return mmap.mmap(block._fd, block.size, access=mmap.ACCESS_READ)
+    finally:
+        block.close()
+
+
+class SharedIndex:
+    """
+    An asset index exported to a multiprocessing.shared_memory block in the CompactAssetIndex layout.
+
+    Processes attach by name with SharedIndex.attach() and read the tables in place, so N workers share
+    one copy of the index. The creating process owns the block and must unlink() it when done.
+    """
+
+    def __init__(self, index):
+        """
+        :param index: AssetIndex or CompactAssetIndex to export (an AssetIndex is packed first)
+        """
+        self.index = index
+        if not isinstance(index, CompactAssetIndex):
+            index = CompactAssetIndex(dict(index.items()))
+        data = index.to_bytes()
+        self._block: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(create=True, size=len(data))
+        self._block.buf[:len(data)] = data
+        self.name = self._block.name
+        self.size = len(data)
+
+    @staticmethod
+    def attach(name: str) -> CompactAssetIndex:
+        """Map the block named name and return a CompactAssetIndex over it (no copy is made)."""
+        mapping = _map_shared_memory(name)
+        return CompactAssetIndex.from_buffer(mapping, owner=mapping)
+
+    @property
+    def closed(self) -> bool:
+        return self._block is None
+
+    def close(self):
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+
+    def unlink(self):
+        """Free the block; processes already attached keep their mapping until they exit."""
+        if self._block is not None:
+            self._block.unlink()
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.unlink()
+
+    def __repr__(self):
+        return f"<SharedIndex {self.name} {self.size} bytes>"
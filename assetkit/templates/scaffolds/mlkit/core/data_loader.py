@@ -1,7 +1,7 @@
 from assetkit import AssetManager
 import pandas as pd
 
-assets = AssetManager(package_root="mlkit_resources", resource_dir="resources/assets")
+assets = AssetManager.get("mlkit_resources", resource_dir="resources/assets")
 
 def load_dataset():
     csv_path = assets["data/sample.csv"].path()
@@ -6,7 +6,7 @@ import joblib
 from assetkit import AssetManager
 from pathlib import Path
 
-assets = AssetManager(package_root="mlkit_resources", resource_dir="resources/assets")
+assets = AssetManager.get("mlkit_resources", resource_dir="resources/assets")
 
 def train():
     df = load_dataset()
@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from assetkit.cache import default_cache_dir
+from assetkit.internal.generators.generate_asset_digests import hash_stream
+
+VERIFY_CACHE_FILENAME = "verify-cache.json"
+VERIFY_CACHE_VERSION = 1
+
+
+class VerifyResult(NamedTuple):
+    checked: int
+    mismatched: List[str]
+    missing: List[str]
+    unexpected: List[str]
+
+    @property
+    def ok(self) -> bool:
+        return not (self.mismatched or self.missing)
+
+    def __bool__(self):
+        return self.ok
+
+
+class VerifyCache:
+    """
+    Digests of files already hashed, keyed on (device, inode, size, mtime_ns). Any write to a file
+    changes its mtime (and usually size), so a hit means the contents were hashed as they are now.
+    Digests of build-time compressed files taken over their decompressed contents are kept under
+    the codec name, apart from digests of the stored bytes.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else default_cache_dir() / VERIFY_CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == VERIFY_CACHE_VERSION:
+            self._entries: Dict[str, str] = data["entries"]
+        else:
+            self._entries = {}
+
+    @staticmethod
+    def _key(st: os.stat_result, codec: Optional[str] = None) -> str:
+        key = f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+        return f"{key}:{codec}" if codec else key
+
+    def get(self, st: os.stat_result, codec: Optional[str] = None) -> Optional[str]:
+        return self._entries.get(self._key(st, codec))
+
+    def put(self, st: os.stat_result, digest: str, codec: Optional[str] = None):
+        with self._lock:
+            self._entries[self._key(st, codec)] = digest
+            self._dirty = True
+
+    def save(self):
+        """Write the cache atomically; a read-only cache dir only costs the speedup."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-verify-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": VERIFY_CACHE_VERSION, "entries": self._entries}, f, separators=(",", ":"))
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            return
+        self._dirty = False
+
+
+def verify_assets(manager, expected: Dict[str, list], max_workers: int = 8,
+                  cache: Optional[VerifyCache] = None) -> VerifyResult:
+    """
+    Hash every asset listed in expected ({key: [size, digest]}) on a thread pool and compare.
+    Size mismatches are reported without hashing; unchanged filesystem files are answered from cache.
+    """
+    mismatched, missing = [], []
+
+    def check(item):
+        key, (size, digest) = item
+        asset = manager._resolve(key)
+        if asset is None:
+            return key, "missing"
+        st = None
+        if asset._codec is None and isinstance(asset._path, Path):
+            # A fresh stat: sizes from a prebuilt index may predate an edit
+            try:
+                st = os.stat(asset._path)
+            except OSError:
+                return key, "missing"
+            if st.st_size != size:
+                return key, "mismatched"
+            cached = cache.get(st) if cache is not None else None
+            if cached is not None:
+                return key, None if cached == digest else "mismatched"
+        elif asset.size != size:
+            return key, "mismatched"
+        actual = hash_stream(lambda: asset.open("rb"))
+        if st is not None and cache is not None:
+            cache.put(st, actual)
+        return key, None if actual == digest else "mismatched"
+
+    items = sorted(expected.items())
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="assetkit-verify") as pool:
+        for key, problem in pool.map(check, items):
+            if problem == "missing":
+                missing.append(key)
+            elif problem == "mismatched":
+                mismatched.append(key)
+    if cache is not None:
+        cache.save()
+
+    unexpected = [key for key in manager.list() if key not in expected]
+    return VerifyResult(checked=len(items), mismatched=mismatched, missing=missing, unexpected=unexpected)
@@ -0,0 +1,228 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+from assetkit.asset_manager import AssetManager, IndexChanges
+
+# inotify(7) event masks: files written, and entries created, deleted or renamed inside a watched directory
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_ONLYDIR = 0x01000000
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+_WATCH_MASK = (_IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+               | _IN_MOVE_SELF | _IN_ONLYDIR)
+# struct inotify_event header: wd, mask, cookie, len (followed by len bytes of NUL-padded name)
+_EVENT = struct.Struct("iIII")
+# Callback exceptions kept on AssetWatcher.errors
+_MAX_ERRORS = 100
+
+
+class _Inotify:
+    """Minimal ctypes binding: one inotify instance watching a set of directories."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[str, int] = {}
+        self._paths: Dict[int, str] = {}
+
+    def sync(self, paths) -> int:
+        """Watch exactly the given directories (adds new ones, drops vanished ones); return how many were added."""
+        paths = set(paths)
+        for path in set(self._watches) - paths:
+            wd = self._watches.pop(path)
+            self._paths.pop(wd, None)
+            self._rm_watch(self.fd, wd)
+        added = 0
+        for path in paths - set(self._watches):
+            wd = self._add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+            if wd >= 0:
+                self._watches[path] = wd
+                self._paths[wd] = path
+                added += 1
+        return added
+
+    def wait(self, timeout: float) -> Optional[List[str]]:
+        """
+        Block up to timeout seconds. Return None if no event arrived, else (after draining the queue)
+        the paths of the files closed after writing.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return None
+        written = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            # The kernel only returns whole events
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                if mask & _IN_CLOSE_WRITE and name and wd in self._paths:
+                    written.append(os.path.join(self._paths[wd], os.fsdecode(name)))
+        return written
+
+    def close(self):
+        os.close(self.fd)
+
+
+class AssetWatcher:
+    """
+    Background thread that keeps a filesystem-mode AssetManager's index current.
+
+    On Linux, inotify wakes the thread as soon as an entry is created, deleted or renamed in a
+    watched directory, or a file in one is written and closed; elsewhere (or with use_inotify=False)
+    it polls refresh() every interval seconds, which costs one stat per directory plus, with
+    stat_files, one per file. Either way the index is updated through AssetManager.refresh(), and
+    callback(changes) runs on the watcher thread after each refresh that added, removed or
+    modified keys.
+    """
+
+    def __init__(self, manager: AssetManager, callback: Optional[Callable[[IndexChanges], None]] = None,
+                 interval: float = 1.0, use_inotify: Optional[bool] = None, debounce: float = 0.05,
+                 stat_files: bool = True):
+        """
+        :param manager: Filesystem-mode AssetManager to keep current
+        :param callback: Called with the IndexChanges of every refresh that changed the index; exceptions
+                         it raises are kept in .errors instead of stopping the watcher
+        :param interval: Polling period in seconds (also the inotify wake-up timeout)
+        :param use_inotify: Force inotify on/off; by default it is used when available
+        :param debounce: Seconds to wait after an inotify event so bursts coalesce into one refresh
+        :param stat_files: When polling, stat every file on each poll so in-place edits are reported
+                           (inotify reports them without)
+        """
+        if not manager._filesystem or manager._archive is not None:
+            raise ValueError("AssetWatcher: only filesystem-mode managers without an asset pack can be watched")
+        self.manager = manager
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.stat_files = stat_files
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith("linux")
+        self._use_inotify = use_inotify
+        self._inotify: Optional[_Inotify] = None
+        # Watched directory path -> its key relative to the manager's resource dir
+        self._watched_dirs: Dict[str, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._errors = deque(maxlen=_MAX_ERRORS)
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def start(self) -> "AssetWatcher":
+        if self._thread is not None:
+            return self
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                # No libc inotify (non-Linux, sandboxed, or out of instances): fall back to polling
+                self._inotify = None
+        # Establish the mtime and file stat baselines (and the watch list) before the first event can arrive
+        self.manager.refresh(stat_files=True)
+        self._sync_watches()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="assetkit-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> "AssetWatcher":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _sync_watches(self) -> int:
+        if self._inotify is None:
+            return 0
+        self._watched_dirs = {os.fspath(self.manager._dir_path(d)): d for d in self.manager._dir_mtimes}
+        return self._inotify.sync(self._watched_dirs)
+
+    def _keys(self, paths: Iterable[str]) -> List[str]:
+        keys = []
+        for path in paths:
+            directory, name = os.path.split(path)
+            rel_dir = self._watched_dirs.get(directory)
+            if rel_dir is not None:
+                keys.append(f"{rel_dir}/{name}" if rel_dir else name)
+        return keys
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._inotify is not None:
+                written = self._inotify.wait(self.interval)
+                if written is None:
+                    continue
+                if self._stop.wait(self.debounce):
+                    break
+                self.poll(touched=self._keys(written))
+                continue
+            if self._stop.wait(self.interval):
+                break
+            self.poll(stat_files=self.stat_files)
+
+    def poll(self, stat_files: bool = False, touched: Iterable[str] = ()) -> IndexChanges:
+        """
+        Refresh the manager once and notify the callback; safe to call from any thread.
+        See AssetManager.refresh() for stat_files and touched.
+        """
+        changes = self.manager.refresh(stat_files=stat_files, touched=touched)
+        # Entries created in a new directory before its watch was added raise no event: rescan until stable
+        while changes and self._sync_watches():
+            more = self.manager.refresh()
+            if not more:
+                break
+            changes = IndexChanges(sorted(set(changes.added + more.added) - set(more.removed)),
+                                   sorted(set(changes.removed + more.removed) - set(more.added)),
+                                   sorted(set(changes.modified + more.modified) - set(more.removed)))
+        if changes and self.callback is not None:
+            try:
+                self.callback(changes)
+            except Exception as e:
+                self._errors.append(e)
+        return changes
+
+    @property
+    def errors(self) -> List[Exception]:
+        """Exceptions raised by the callback, oldest first (only the most recent 100 are kept)."""
+        return list(self._errors)
+
+    def __repr__(self):
+        state = "running" if self._thread is not None else "stopped"
+        return f"<AssetWatcher {self.backend}, {state}>"
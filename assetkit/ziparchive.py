@@ -0,0 +1,181 @@
+import io
+import os
+import struct
+import threading
+import time
+import zipfile
+from typing import Dict, Optional, Tuple
+
+# Local file header: signature, versions, flags, method, time, date, crc, sizes, name/extra lengths
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+
+_ARCHIVES: Dict[Tuple[str, int], "ZipArchive"] = {}
+_ARCHIVES_LOCK = threading.Lock()
+
+
+class ZipArchive:
+    """
+    Index of a zip (wheel, egg or zipapp) built from one read of its central directory.
+
+    Stored members are read with positional reads at their data offset; compressed members
+    go through zipfile. Open archives are shared per (path, mtime), so several packages in
+    one zipapp parse the central directory once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mtime_ns = os.stat(path).st_mtime_ns
+        self._zip = zipfile.ZipFile(path)
+        self._infos: Dict[str, zipfile.ZipInfo] = {}
+        self._dirs = {""}
+        for info in self._zip.infolist():
+            name = info.filename.rstrip("/")
+            if not info.is_dir():
+                self._infos[name] = info
+            # Zips are not required to list directories, so derive them from member names
+            parent = name if info.is_dir() else name.rpartition("/")[0]
+            while parent and parent not in self._dirs:
+                self._dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0)) if hasattr(os, "pread") else None
+        self._data_offsets: Dict[str, int] = {}
+
+    @classmethod
+    def open(cls, path: str) -> "ZipArchive":
+        path = os.path.abspath(path)
+        key = (path, os.stat(path).st_mtime_ns)
+        with _ARCHIVES_LOCK:
+            archive = _ARCHIVES.get(key)
+            if archive is None:
+                archive = _ARCHIVES[key] = cls(path)
+            return archive
+
+    @classmethod
+    def from_traversable(cls, path_obj) -> Optional[Tuple["ZipArchive", str]]:
+        """
+        Return (archive, member prefix) for a zipfile.Path as returned by importlib.resources
+        for zip-imported packages, or None for anything else.
+        """
+        filename = getattr(getattr(path_obj, "root", None), "filename", None)
+        at = getattr(path_obj, "at", None)
+        if not isinstance(filename, str) or not isinstance(at, str):
+            return None
+        try:
+            return cls.open(filename), at.rstrip("/")
+        except (OSError, zipfile.BadZipFile):
+            return None
+
+    def is_dir(self, name: str) -> bool:
+        return name.rstrip("/") in self._dirs
+
+    def index(self, prefix: str) -> Dict[str, Tuple[int, int]]:
+        """{key relative to prefix: (size, mtime_ns)} for every member below prefix."""
+        start = prefix + "/" if prefix else ""
+        return {
+            name[len(start):]: (info.file_size, _zip_mtime_ns(info))
+            for name, info in self._infos.items()
+            if name.startswith(start)
+        }
+
+    def member(self, name: str) -> "ZipMember":
+        info = self._infos.get(name)
+        if info is None:
+            raise KeyError(f"Asset not found in archive: {name}")
+        return ZipMember(self, info)
+
+    def _data_offset(self, info: zipfile.ZipInfo) -> int:
+        offset = self._data_offsets.get(info.filename)
+        if offset is None:
+            # The local header's extra field may differ from the central directory's, so read it
+            header = os.pread(self._fd, _LOCAL_HEADER.size, info.header_offset)
+            fields = _LOCAL_HEADER.unpack(header)
+            if fields[0] != _LOCAL_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad local header for member {info.filename} in {self.path}")
+            offset = info.header_offset + _LOCAL_HEADER.size + fields[-2] + fields[-1]
+            self._data_offsets[info.filename] = offset
+        return offset
+
+    def _is_ranged(self, info: zipfile.ZipInfo) -> bool:
+        return self._fd is not None and info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1
+
+    def read_range(self, info: zipfile.ZipInfo, offset: int, length: int) -> bytes:
+        length = max(0, min(length, info.file_size - offset))
+        if not length:
+            return b""
+        if self._is_ranged(info):
+            start = self._data_offset(info) + offset
+            parts = []
+            while length > 0:
+                chunk = os.pread(self._fd, length, start)
+                if not chunk:
+                    break
+                parts.append(chunk)
+                start += len(chunk)
+                length -= len(chunk)
+            return b"".join(parts)
+        with self._zip.open(info) as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def read(self, info: zipfile.ZipInfo) -> bytes:
+        if self._is_ranged(info):
+            return self.read_range(info, 0, info.file_size)
+        return self._zip.read(info)
+
+    def __repr__(self):
+        return f"<ZipArchive '{self.path}' {len(self._infos)} files>"
+
+
+def _zip_mtime_ns(info: zipfile.ZipInfo) -> int:
+    # Zip timestamps are naive local times with two-second resolution
+    return int(time.mktime(info.date_time + (0, 0, -1))) * 1_000_000_000
+
+
+class ZipMember:
+    """
+    One file inside a ZipArchive, exposing the subset of the importlib.resources Traversable
+    interface that AssetFile uses, plus read_range() for partial reads.
+    """
+
+    __slots__ = ("_archive", "_info", "name")
+
+    def __init__(self, archive: ZipArchive, info: zipfile.ZipInfo):
+        self._archive = archive
+        self._info = info
+        self.name = info.filename.rpartition("/")[2]
+
+    def identity(self) -> tuple:
+        """(archive path, archive mtime_ns, member name, CRC-32, size): changes whenever the contents can."""
+        info = self._info
+        return self._archive.path, self._archive.mtime_ns, info.filename, info.CRC, info.file_size
+
+    def read_bytes(self) -> bytes:
+        return self._archive.read(self._info)
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        return self._archive.read_range(self._info, offset, length)
+
+    def open(self, mode: str = "rb", encoding: str = "utf-8"):
+        stream = self._archive._zip.open(self._info)
+        if mode == "rb":
+            return stream
+        return io.TextIOWrapper(stream, encoding=encoding)
+
+    def is_file(self) -> bool:
+        return True
+
+    def is_dir(self) -> bool:
+        return False
+
+    def exists(self) -> bool:
+        return True
+
+    def __str__(self):
+        return f"{self._archive.path}!/{self._info.filename}"
+
+    def __repr__(self):
+        return f"<ZipMember {self}>"
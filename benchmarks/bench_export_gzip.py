@@ -0,0 +1,85 @@
+"""
+Export compression benchmark: tarfile "w:gz" (single-threaded, the previous export path) vs
+ParallelGzipWriter with several thread counts, on a synthetic asset tree.
+
+Usage:
+    python benchmarks/bench_export_gzip.py [--mb 256] [--jobs 1 2 4 8] [--level 6]
+"""
+import argparse
+import os
+import random
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from assetkit.compression import ParallelGzipWriter
+
+
+def make_tree(root: Path, total_mb: int):
+    """Half text-like (compressible) CSV files, half random (incompressible) binaries, 8 MiB each."""
+    rng = random.Random(0)
+    file_size = 8 * 1024 * 1024
+    for i in range(max(1, total_mb // 8)):
+        path = root / f"dir_{i % 4}" / (f"table_{i}.csv" if i % 2 == 0 else f"blob_{i}.bin")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if i % 2 == 0:
+            rows, size = [], 0
+            while size < file_size:
+                row = f"{rng.randrange(10**6)},{rng.random():.6f},label_{rng.randrange(50)}\n"
+                rows.append(row)
+                size += len(row)
+            path.write_text("".join(rows))
+        else:
+            path.write_bytes(os.urandom(file_size))
+
+
+def add_tree(tar: tarfile.TarFile, root: Path):
+    for current, _, files in os.walk(root):
+        for name in sorted(files):
+            full_path = Path(current) / name
+            tar.add(full_path, arcname=full_path.relative_to(root.parent))
+
+
+def timed(label, func, input_bytes, baseline=None):
+    start = time.perf_counter()
+    output_bytes = func()
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:6.1f}x" if baseline else "      -"
+    print(f"{label:<32} {elapsed:8.2f} s  {input_bytes / elapsed / 2**20:8.1f} MiB/s  {speedup}"
+          f"  ({output_bytes / input_bytes:.1%} of input)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mb", type=int, default=256, help="Approximate size of the asset tree")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--level", type=int, default=6)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "assets"
+        make_tree(root, args.mb)
+        input_bytes = sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+        archive = Path(tmpdir) / "out.tar.gz"
+
+        def tarfile_gz():
+            with tarfile.open(archive, "w:gz", compresslevel=args.level) as tar:
+                add_tree(tar, root)
+            return archive.stat().st_size
+
+        def parallel(jobs):
+            with open(archive, "wb") as raw, ParallelGzipWriter(raw, level=args.level, jobs=jobs) as gz, \
+                    tarfile.open(fileobj=gz, mode="w|") as tar:
+                add_tree(tar, root)
+            return archive.stat().st_size
+
+        print(f"{input_bytes / 2**20:.0f} MiB, level {args.level}, {os.cpu_count()} CPUs")
+        base = timed('tarfile "w:gz"', tarfile_gz, input_bytes)
+        for jobs in dict.fromkeys(args.jobs):
+            timed(f"ParallelGzipWriter ({jobs} jobs)", lambda: parallel(jobs), input_bytes, base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Index build benchmark: legacy Path.iterdir()/is_dir() walker vs scan_tree (sequential and threaded).
+
+--latency-ms adds a sleep to every listdir/scandir/stat call to mimic NFS/EFS round-trips.
+
+Usage:
+    python benchmarks/bench_index_build.py [--depth 4] [--fanout 5] [--files 20] [--latency-ms 0.5]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from assetkit import index as index_module
+from assetkit.index import scan_tree
+
+
+def legacy_walk(path_obj, prefix=""):
+    keys = []
+    for item in path_obj.iterdir():
+        rel = os.path.join(prefix, item.name).replace("\\", "/")
+        if item.is_dir():
+            keys.extend(legacy_walk(item, rel))
+        else:
+            keys.append(rel)
+    return keys
+
+
+def make_tree(root: Path, depth: int, fanout: int, files: int):
+    dirs = [root]
+    for _ in range(depth):
+        dirs = [d / f"dir_{i}" for d in dirs for i in range(fanout)]
+    for leaf in dirs:
+        leaf.mkdir(parents=True, exist_ok=True)
+        for i in range(files):
+            (leaf / f"asset_{i}.bin").touch()
+
+
+def with_latency(func, seconds):
+    def slow(*args, **kwargs):
+        time.sleep(seconds)
+        return func(*args, **kwargs)
+    return slow
+
+
+def timed(label, func, baseline=None):
+    start = time.perf_counter()
+    keys = func()
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:6.1f}x" if baseline else "      -"
+    print(f"{label:<28} {elapsed:8.3f} s  {speedup}  ({len(keys)} keys)")
+    return elapsed, sorted(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_tree(root, args.depth, args.fanout, args.files)
+
+        if args.latency_ms:
+            delay = args.latency_ms / 1000
+            os.listdir = with_latency(os.listdir, delay)
+            os.stat = with_latency(os.stat, delay)
+            index_module.os.scandir = with_latency(os.scandir, delay)
+
+        base, legacy_keys = timed("legacy iterdir + is_dir", lambda: legacy_walk(root))
+        _, seq_keys = timed("scan_tree (1 worker)", lambda: scan_tree(root, max_workers=1)[0], base)
+        _, par_keys = timed(f"scan_tree ({args.workers} workers)", lambda: scan_tree(root, max_workers=args.workers)[0], base)
+        assert legacy_keys == seq_keys == par_keys, "walkers disagree on keys"
+
+
+if __name__ == "__main__":
+    main()
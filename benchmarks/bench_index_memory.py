@@ -0,0 +1,64 @@
+"""
+Memory benchmark: legacy dict index ({key: AssetFile(Path)}) vs AssetIndex vs CompactAssetIndex.
+
+Usage:
+    python benchmarks/bench_index_memory.py [--sizes 100000,1000000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from assetkit.asset_manager import AssetFile
+from assetkit.index import AssetIndex, CompactAssetIndex
+
+BASE = Path("/site-packages/bench_assets/resources/assets")
+
+
+def synthetic_entries(count: int):
+    # ~1000 files per leaf directory, three levels deep, mixed extensions
+    exts = (".yaml", ".json", ".csv", ".png", ".bin")
+    return {
+        f"group_{i // 100000:02d}/shard_{i // 1000:04d}/item_{i:07d}{exts[i % len(exts)]}": (i % 4096, 1_700_000_000 * 10**9)
+        for i in range(count)
+    }
+
+
+def build_legacy(entries):
+    return {key: AssetFile(BASE.joinpath(*key.split("/"))) for key in entries}
+
+
+def measure(builder, count):
+    # Keys are generated inside the traced region, so layouts that keep per-key strings pay for them
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = builder(synthetic_entries(count))
+    gc.collect()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated key counts")
+    args = parser.parse_args()
+
+    layouts = [
+        ("dict[str, AssetFile]", build_legacy),
+        ("AssetIndex", AssetIndex),
+        ("CompactAssetIndex", CompactAssetIndex),
+    ]
+    print(f"{'keys':>10}  {'layout':<22} {'MiB':>9} {'bytes/key':>10} {'build s':>8}")
+    for count in (int(n) for n in args.sizes.split(",")):
+        for name, builder in layouts:
+            used, elapsed = measure(builder, count)
+            print(f"{count:>10}  {name:<22} {used / 2**20:>9.1f} {used / count:>10.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
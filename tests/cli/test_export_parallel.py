@@ -0,0 +1,35 @@
+# tests/cli/test_export_parallel.py
+
+import gzip
+import subprocess
+import tarfile
+import tempfile
+from pathlib import Path
+
+
+def test_export_with_jobs_and_level_writes_standard_tar_gz():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        project_name = "export_parallel_test"
+
+        result = subprocess.run(["assetkit", "new", project_name], cwd=tmp_path, capture_output=True, text=True)
+        assert result.returncode == 0, f"Creation failed:\n{result.stderr}\n{result.stdout}"
+
+        data_dir = tmp_path / project_name / project_name / "resources" / "assets" / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "big.csv").write_text("".join(f"{i},{i * 2}\n" for i in range(200000)))
+
+        result = subprocess.run(
+            ["assetkit", "export", project_name, "--jobs", "4", "--level", "9"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"Export failed:\n{result.stderr}\n{result.stdout}"
+
+        archive_path = tmp_path / f"{project_name}.tar.gz"
+        with gzip.open(archive_path) as f:
+            f.read()
+        with tarfile.open(archive_path, "r:gz") as tar:
+            member = f"{project_name}/{project_name}/resources/assets/data/big.csv"
+            assert tar.extractfile(member).read() == (data_dir / "big.csv").read_bytes()
@@ -0,0 +1,32 @@
+import subprocess
+import tempfile
+from pathlib import Path
+
+from assetkit.asset_manager import AssetManager
+
+
+def test_assetkit_new_pack_ships_single_pack_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        project_name = "test_packed_assets"
+        result = subprocess.run(
+            ["assetkit", "new", project_name, "--pack"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        target_path = tmp_path / project_name
+        package_dir = target_path / project_name
+        assert (package_dir / "assetkit_pack.bin").exists()
+
+        # Package data lists the pack instead of the individual resource files
+        setup_cfg = (target_path / "setup.cfg").read_text()
+        assert "assetkit_pack.bin" in setup_cfg
+        assert "resources/assets/**" not in setup_cfg
+        assert '"resources/**/*"' not in (target_path / "pyproject.toml").read_text()
+        assert "resources" not in (target_path / "MANIFEST.in").read_text()
+
+        assets = AssetManager(package_root=package_dir, resource_dir="resources/assets", use_pack=True)
+        assert "config/model.yaml" in assets.list()
@@ -13,10 +13,12 @@ class TestBundleDockerImageCLI(unittest.TestCase):
     @patch("assetkit.internal.cli.bundle_docker_image.tempfile.TemporaryDirectory")
     @patch("assetkit.internal.cli.bundle_docker_image.create_new_project")
     @patch("assetkit.internal.cli.bundle_docker_image.Path.exists")
+    @patch("assetkit.internal.cli.bundle_docker_image.generate_asset_digests")
+    @patch("assetkit.internal.cli.bundle_docker_image.generate_asset_index")
     @patch("shutil.copytree")
     def test_bundle_docker_image_success(
-        self, mock_copytree, mock_path_exists, mock_create_new_project,
-        mock_temp_dir, mock_subprocess_run
+        self, mock_copytree, mock_generate_asset_index, mock_generate_asset_digests, mock_path_exists,
+        mock_create_new_project, mock_temp_dir, mock_subprocess_run
     ):
         args = MagicMock()
         args.image = "ubuntu:22.04"
@@ -42,6 +44,8 @@ class TestBundleDockerImageCLI(unittest.TestCase):
             ["docker", "save", "-o", ANY, "ubuntu:22.04"],
             check=True
         )
+        mock_generate_asset_index.assert_called_once()
+        mock_generate_asset_digests.assert_called_once()
         mock_temp_dir_instance.cleanup.assert_called_once()
 
     @patch("assetkit.internal.cli.bundle_docker_image.subprocess.run")
@@ -75,9 +79,12 @@ class TestBundleDockerImageCLI(unittest.TestCase):
     @patch("assetkit.internal.cli.bundle_docker_image.subprocess.run")
     @patch("assetkit.internal.cli.bundle_docker_image.generate_asset_mapping")
     @patch("assetkit.internal.cli.bundle_docker_image.Path.exists")
+    @patch("assetkit.internal.cli.bundle_docker_image.generate_asset_digests")
+    @patch("assetkit.internal.cli.bundle_docker_image.generate_asset_index")
     @patch("shutil.copytree")
     def test_generate_assets_py(
-        self, mock_copytree, mock_path_exists, mock_generate_asset_mapping, mock_subprocess_run
+        self, mock_copytree, mock_generate_asset_index, mock_generate_asset_digests, mock_path_exists,
+        mock_generate_asset_mapping, mock_subprocess_run
     ):
         args = MagicMock()
         args.image = "ubuntu:22.04"
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+
+def _make_tree(root: Path) -> Path:
+    assets = root / "resources" / "assets"
+    (assets / "config").mkdir(parents=True)
+    (assets / "data" / "nested").mkdir(parents=True)
+    (assets / "config" / "model.yaml").write_text("model: {}")
+    (assets / "data" / "sample.csv").write_text("a,b\n1,2\n")
+    (assets / "data" / "nested" / "deep.csv").write_text("x\n")
+    (assets / "readme.txt").write_text("hello")
+    return assets
+
+
+@pytest.fixture
+def make_tree():
+    """Factory writing the sample resources/assets tree under a root; returns the assets directory."""
+    return _make_tree
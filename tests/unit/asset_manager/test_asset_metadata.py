@@ -0,0 +1,44 @@
+import tempfile
+from pathlib import Path
+
+from assetkit.asset_manager import AssetFile, AssetManager
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+
+
+def make_package(root: Path) -> Path:
+    assets = root / "resources" / "assets"
+    assets.mkdir(parents=True)
+    (assets / "model.yaml").write_text("model: {}")
+    (assets / "image.tar").write_bytes(b"\0" * 4096)
+    return root
+
+
+def test_metadata_comes_from_stat_without_reading_contents(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = make_package(Path(tmpdir))
+        assets = AssetManager(package_root=pkg, resource_dir="resources/assets", use_index=False)
+
+        def fail_read(self):
+            raise AssertionError("contents should not be read")
+
+        monkeypatch.setattr(AssetFile, "bytes", fail_read)
+        image = assets["image.tar"]
+        assert image.size == 4096
+        assert image.suffix == ".tar"
+        assert image.mime_type == "application/x-tar"
+        assert image.mtime == (pkg / "resources" / "assets" / "image.tar").stat().st_mtime
+        assert "size=4096 bytes" in repr(image)
+
+
+def test_metadata_with_prebuilt_index_reflects_in_place_edits():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = make_package(Path(tmpdir))
+        generate_asset_index(pkg)
+        (pkg / "resources" / "assets" / "model.yaml").write_text("model: {layers: [64, 64, 10]}")
+        assets = AssetManager(package_root=pkg, resource_dir="resources/assets")
+
+        # The keys come from the index, but a development tree's sizes come from a stat
+        model = assets["model.yaml"]
+        assert model._meta is None
+        assert model.size == len("model: {layers: [64, 64, 10]}")
+        assert sorted(assets.list(), key=lambda k: assets[k].size) == ["model.yaml", "image.tar"]
@@ -0,0 +1,47 @@
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetFile, AssetManager
+
+
+def test_mmap_and_memoryview_are_read_only_and_close_cleanly():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets_dir = Path(tmpdir) / "resources" / "assets"
+        assets_dir.mkdir(parents=True)
+        (assets_dir / "weights.bin").write_bytes(bytes(range(256)) * 4)
+        (assets_dir / "empty.bin").write_bytes(b"")
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+
+        with assets["weights.bin"].mmap() as mm:
+            assert len(mm) == 1024
+            assert mm[1:4] == b"\x01\x02\x03"
+            with pytest.raises(TypeError):
+                mm[0] = 1
+        assert mm.closed
+
+        with assets["weights.bin"].memoryview() as view:
+            assert view.readonly
+            assert view[255] == 255
+        with pytest.raises(ValueError):
+            view[0]
+
+        with assets["empty.bin"].memoryview() as view:
+            assert view.nbytes == 0
+
+
+def test_mmap_extracts_zip_members_to_cache_dir(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        archive = Path(tmpdir) / "pkg.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("pkg/resources/assets/model.npy", b"NUMPY" * 10)
+
+        asset = AssetFile(zipfile.Path(archive, "pkg/resources/assets/model.npy"))
+        with asset.memoryview() as view:
+            assert bytes(view[:5]) == b"NUMPY"
+        extracted = asset._local_path()
+        assert extracted.parent == Path(tmpdir) / "cache" / "extracted"
+        assert extracted.suffix == ".npy"
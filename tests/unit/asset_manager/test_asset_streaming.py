@@ -0,0 +1,43 @@
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetFile, AssetManager
+
+PAYLOAD = bytes(range(256)) * 40
+
+
+def test_streaming_reads_on_filesystem_assets():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets_dir = Path(tmpdir) / "resources" / "assets"
+        assets_dir.mkdir(parents=True)
+        (assets_dir / "image.tar").write_bytes(PAYLOAD)
+        (assets_dir / "notes.txt").write_text("line one\nline two\n")
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+
+        chunks = list(assets["image.tar"].iter_chunks(4096))
+        assert [len(c) for c in chunks] == [4096, 4096, 2048]
+        assert b"".join(chunks) == PAYLOAD
+        assert assets["image.tar"].read_range(250, 10) == PAYLOAD[250:260]
+        assert assets["image.tar"].read_range(len(PAYLOAD) - 2, 100) == PAYLOAD[-2:]
+
+        with assets["notes.txt"].open("r") as f:
+            assert f.readline() == "line one\n"
+        with pytest.raises(ValueError):
+            assets["notes.txt"].open("w")
+
+
+def test_streaming_reads_on_traversable_assets():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "pkg.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("assets/image.tar", PAYLOAD)
+            zf.writestr("assets/notes.txt", "héllo\n")
+
+        image = AssetFile(zipfile.Path(archive, "assets/image.tar"))
+        assert b"".join(image.iter_chunks(1000)) == PAYLOAD
+        assert image.read_range(1000, 5) == PAYLOAD[1000:1005]
+        with AssetFile(zipfile.Path(archive, "assets/notes.txt")).open("r") as f:
+            assert f.read() == "héllo\n"
@@ -0,0 +1,42 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+
+
+def make_manager(tmpdir):
+    base = Path(tmpdir) / "resources" / "assets"
+    (base / "templates").mkdir(parents=True)
+    for i in range(12):
+        (base / "templates" / f"t{i}.html").write_text(f"<p>{i}</p>")
+    return AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+
+
+def test_read_many_returns_contents_for_every_key():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets = make_manager(tmpdir)
+        keys = assets.glob("templates/*.html")
+
+        contents = assets.read_many(keys, max_workers=4)
+        assert list(contents) == keys
+        assert contents["templates/t3.html"] == b"<p>3</p>"
+        assert assets.read_many(["templates/t0.html"], text=True) == {"templates/t0.html": "<p>0</p>"}
+        with pytest.raises(KeyError):
+            assets.read_many(["templates/t0.html", "missing.html"])
+
+
+def test_async_reads_do_not_block_the_event_loop():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets = make_manager(tmpdir)
+
+        async def main():
+            single = await assets.aread("templates/t1.html", text=True)
+            many = await assets.aread_many(assets.glob("templates/*.html"))
+            return single, many
+
+        single, many = asyncio.run(main())
+        assert single == "<p>1</p>"
+        assert len(many) == 12 and many["templates/t11.html"] == b"<p>11</p>"
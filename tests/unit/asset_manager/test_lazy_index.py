@@ -0,0 +1,43 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+
+
+def test_lazy_manager_resolves_single_key_without_walking(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True)
+
+        assert "config/model.yaml" in assets
+        assert assets["config/model.yaml"].text() == "model: {}"
+        assert assets._walked == set()
+        assert "config/missing.yaml" not in assets
+        assert "config" not in assets
+        assert "../resources/assets/readme.txt" not in assets
+        with pytest.raises(KeyError):
+            assets["nope.txt"]
+
+
+def test_lazy_manager_walks_only_listed_subdirectories(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True)
+
+        assert sorted(assets.list("data")) == ["data/nested/deep.csv", "data/sample.csv"]
+        assert "data" in assets._walked
+        assert "" not in assets._walked
+        assert assets.find(".csv", "data/nested") == ["data/nested/deep.csv"]
+
+
+def test_lazy_and_eager_managers_agree_on_full_listing(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        eager = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        lazy = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True)
+
+        lazy["readme.txt"]
+        assert sorted(lazy.list()) == sorted(eager.list())
+        assert sorted(lazy.find(".csv")) == sorted(eager.find(".csv"))
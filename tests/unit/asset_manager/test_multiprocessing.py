@@ -0,0 +1,99 @@
+import gc
+import multiprocessing
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from operator import methodcaller
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.index import CompactAssetIndex
+from assetkit.internal.generators.generate_asset_pack import generate_asset_pack
+from assetkit.shared_index import SharedIndex
+
+
+KEYS = ["config/model.yaml", "data/nested/deep.csv", "data/sample.csv", "readme.txt"]
+
+
+def test_compact_index_round_trips_through_a_buffer():
+    entries = {"a/b.txt": (3, 4), "a/c.yaml": None, "a/d/é.txt": (5, 6), "z": (1, 2)}
+    index = CompactAssetIndex.from_buffer(bytearray(CompactAssetIndex(entries).to_bytes()))
+
+    assert list(index.items()) == sorted(entries.items())
+    assert list(index.iter_glob("a/*.txt")) == ["a/b.txt"]
+    assert index.listdir("a") == ["b.txt", "c.yaml", "d/"]
+    assert "a/d/é.txt" in index and "a/d" not in index
+    assert list(CompactAssetIndex.from_buffer(CompactAssetIndex({}).to_bytes()).items()) == []
+    with pytest.raises(ValueError):
+        CompactAssetIndex.from_buffer(bytes(64))
+
+
+def test_pickled_manager_reuses_index_without_walking(monkeypatch, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, cache=1024)
+        data = pickle.dumps(assets)
+
+        monkeypatch.setattr(AssetManager, "_build_index", lambda self: pytest.fail("index rebuilt"))
+        restored = pickle.loads(data)
+        assert restored.list() == KEYS
+        assert restored["data/sample.csv"].text() == "a,b\n1,2\n"
+        assert restored.cache is not None and restored.cache.max_bytes == 1024
+
+        lazy = AssetManager(package_root=tmpdir, lazy=True)
+        assert lazy.list("data") == ["data/nested/deep.csv", "data/sample.csv"]
+        restored = pickle.loads(pickle.dumps(lazy))
+        assert restored._walked == {"data", "data/nested"}
+        assert restored["readme.txt"].text() == "hello"
+
+
+def test_pickled_pack_manager_reopens_pack(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        generate_asset_pack(tmpdir, resource_root="resources")
+        restored = pickle.loads(pickle.dumps(AssetManager(package_root=tmpdir, use_pack=True)))
+        assert repr(restored).endswith("packed>")
+        assert restored["config/model.yaml"].text() == "model: {}"
+
+
+def test_workers_attach_to_shared_index(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir)
+        with assets.share_index() as shared:
+            assert isinstance(shared, SharedIndex)
+            assert assets.share_index() is shared
+            # Only the block name travels with the manager
+            assert shared.name in pickle.dumps(assets).decode("latin-1")
+            assert list(SharedIndex.attach(shared.name).items()) == list(assets._index.items())
+
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                assert pool.submit(methodcaller("list"), assets).result() == KEYS
+                assert pool.submit(methodcaller("read_many", ["readme.txt"], text=True), assets).result() == {
+                    "readme.txt": "hello"
+                }
+        assert shared.closed
+
+        lazy = AssetManager(package_root=tmpdir, lazy=True)
+        with pytest.raises(RuntimeError):
+            lazy.share_index()
+
+
+def test_preload_fills_cache(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir)
+        frozen = gc.get_freeze_count()
+        assert assets.preload(["readme.txt"], pattern="data/**") == 5 + 8 + 2
+        assert assets.cache.stats().entries == 3
+
+        stats = assets.cache.stats()
+        assert assets["data/sample.csv"].bytes() == b"a,b\n1,2\n"
+        assert assets.cache.stats().hits == stats.hits + 1
+
+        assets.preload(["config/model.yaml"], text=True)
+        # Freezing the collector is a process-wide side effect, so it is opt-in
+        assert gc.get_freeze_count() == frozen
@@ -0,0 +1,62 @@
+import json
+import tempfile
+from pathlib import Path
+
+from assetkit.asset_manager import AssetManager
+from assetkit.internal.generators.generate_asset_index import INDEX_FILENAME, generate_asset_index
+
+
+def test_generate_asset_index_records_sizes_and_hashes(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = make_tree(Path(tmpdir)).parents[1]
+        generate_asset_index(pkg, hashes=True)
+
+        data = json.loads((pkg / INDEX_FILENAME).read_text())
+        entry = data["files"]["resources/assets/config/model.yaml"]
+        assert entry[0] == len("model: {}")
+        assert len(entry[2]) == 64
+        assert "resources/assets/config" in data["dirs"]
+
+
+def test_manager_loads_prebuilt_index_without_walking(monkeypatch, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = make_tree(Path(tmpdir)).parents[1]
+        generate_asset_index(pkg)
+
+        def fail_walk(self):
+            raise AssertionError("index should have been loaded from disk")
+
+        monkeypatch.setattr(AssetManager, "_build_index", fail_walk)
+        assets = AssetManager(package_root=pkg, resource_dir="resources/assets")
+        assert sorted(assets.list()) == ["config/model.yaml", "data/nested/deep.csv", "data/sample.csv", "readme.txt"]
+        assert assets["config/model.yaml"].text() == "model: {}"
+
+        # The same index also serves managers rooted at "resources"
+        assert "assets/data/sample.csv" in AssetManager(package_root=pkg, resource_dir="resources")
+
+
+def test_manager_falls_back_to_walking_when_index_is_stale(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = make_tree(Path(tmpdir)).parents[1]
+        generate_asset_index(pkg)
+        (pkg / "resources" / "assets" / "config" / "extra.yaml").write_text("x: 1")
+
+        assets = AssetManager(package_root=pkg, resource_dir="resources/assets")
+        assert "config/extra.yaml" in assets.list()
+
+
+def test_package_opened_by_name_falls_back_to_walking_when_index_is_stale(monkeypatch, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        site = Path(tmpdir) / "site"
+        pkg = make_tree(site / "assetkit_stale_index_pkg").parents[1]
+        (pkg / "__init__.py").write_text("")
+        generate_asset_index(pkg)
+        (pkg / "resources" / "assets" / "data" / "sample.csv").write_text("a,b\n1,2\n3,4\n")
+        (pkg / "resources" / "assets" / "extra.txt").write_text("x")
+        monkeypatch.syspath_prepend(str(site))
+
+        assets = AssetManager(package_root="assetkit_stale_index_pkg", resource_dir="resources/assets")
+        assert sorted(assets.list()) == [
+            "config/model.yaml", "data/nested/deep.csv", "data/sample.csv", "extra.txt", "readme.txt",
+        ]
+        assert assets["data/sample.csv"].size == len("a,b\n1,2\n3,4\n")
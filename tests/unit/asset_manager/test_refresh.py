@@ -0,0 +1,158 @@
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+from assetkit.watch import AssetWatcher
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_refresh_picks_up_added_and_removed_entries(compact, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", compact=compact)
+        assert not assets.refresh()
+
+        (base / "config" / "extra.yaml").write_text("x: 1")
+        (base / "data" / "sample.csv").unlink()
+        (base / "new" / "deeper").mkdir(parents=True)
+        (base / "new" / "deeper" / "a.txt").write_text("a")
+        shutil.rmtree(base / "data" / "nested")
+
+        changes = assets.refresh()
+        assert changes.added == ["config/extra.yaml", "new/deeper/a.txt"]
+        assert changes.removed == ["data/nested/deep.csv", "data/sample.csv"]
+        assert assets.list() == ["config/extra.yaml", "config/model.yaml", "new/deeper/a.txt", "readme.txt"]
+        assert assets["new/deeper/a.txt"].text() == "a"
+        assert not assets.refresh()
+
+        # The newly scanned directory is tracked too
+        (base / "new" / "deeper" / "b.txt").write_text("b")
+        assert assets.refresh().added == ["new/deeper/b.txt"]
+
+
+def test_refresh_after_prebuilt_index_rescans_once(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        generate_asset_index(tmpdir, resource_root="resources")
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        assert assets["readme.txt"].size == 5
+
+        (base / "later.txt").write_text("later")
+        (base / "readme.txt").write_text("hello, edited in place")
+        changes = assets.refresh()
+        assert changes.added == ["later.txt"]
+        assert changes.modified == ["readme.txt"]
+        assert assets["readme.txt"].size == len("hello, edited in place")
+        assert not assets.refresh()
+
+
+def test_refresh_reports_in_place_edits(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        assert not assets.refresh(stat_files=True)
+
+        (base / "data" / "sample.csv").write_text("a,b\n1,2\n3,4\n")
+        # The directory is untouched, so only a stat of the file (or an inotify event) tells
+        assert not assets.refresh()
+        assert assets.refresh(stat_files=True).modified == ["data/sample.csv"]
+        (base / "readme.txt").write_text("hello again")
+        assert assets.refresh(touched=["readme.txt"]) == ([], [], ["readme.txt"])
+        assert assets["readme.txt"].text() == "hello again"
+
+
+def test_refresh_swaps_index_for_concurrent_readers(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        stop = threading.Event()
+        errors = []
+
+        def reader():
+            while not stop.is_set():
+                keys = assets.list()
+                if "readme.txt" not in keys or keys != sorted(keys):
+                    errors.append(keys)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        try:
+            for i in range(20):
+                (base / f"file{i}.txt").write_text("x")
+                assets.refresh()
+        finally:
+            stop.set()
+            thread.join()
+        assert errors == []
+        assert len(assets.list()) == 24
+
+
+def test_lazy_refresh_forgets_memoized_walks(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True)
+        assert assets.list("data") == ["data/nested/deep.csv", "data/sample.csv"]
+
+        (base / "data" / "more.csv").write_text("m")
+        assets.refresh()
+        assert "data/more.csv" in assets.list("data")
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_watcher_invokes_callback_on_changes(use_inotify, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        seen = []
+        changed = threading.Event()
+
+        def on_change(changes):
+            seen.append(changes)
+            changed.set()
+
+        with AssetWatcher(assets, callback=on_change, interval=0.05, use_inotify=use_inotify):
+            (base / "config" / "watched.yaml").write_text("w")
+            assert changed.wait(5)
+
+        assert "config/watched.yaml" in assets
+        assert seen[0].added == ["config/watched.yaml"]
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_watcher_reports_modified_files(use_inotify, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        seen = []
+        changed = threading.Event()
+
+        def on_change(changes):
+            seen.append(changes)
+            changed.set()
+
+        with AssetWatcher(assets, callback=on_change, interval=0.05, use_inotify=use_inotify):
+            with open(base / "config" / "model.yaml", "a") as f:
+                f.write("layers: 2\n")
+            assert changed.wait(5)
+
+        assert seen[0] == ([], [], ["config/model.yaml"])
+
+
+def test_watcher_keeps_callback_errors_instead_of_printing(capsys, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_tree(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+
+        def on_change(changes):
+            raise RuntimeError("callback broke")
+
+        watcher = AssetWatcher(assets, callback=on_change, use_inotify=False)
+        (base / "config" / "watched.yaml").write_text("w")
+        assert watcher.poll().added == ["config/watched.yaml"]
+        assert [str(e) for e in watcher.errors] == ["callback broke"]
+        assert capsys.readouterr().out == ""
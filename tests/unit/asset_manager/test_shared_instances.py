@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.internal.generators.generate_asset_map import generate_asset_mapping
+
+
+@pytest.fixture(autouse=True)
+def clear_instances():
+    AssetManager.clear_instances()
+    yield
+    AssetManager.clear_instances()
+
+
+def test_get_returns_one_instance_per_package_resource_dir_and_options(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        assets = AssetManager.get(tmpdir, resource_dir="resources/assets")
+
+        assert AssetManager.get(Path(tmpdir), resource_dir="resources/assets/") is assets
+        assert AssetManager.get(os.path.join(tmpdir, "."), resource_dir="resources/assets") is assets
+        assert AssetManager.get(tmpdir, resource_dir="resources") is not assets
+        assert AssetManager.get(tmpdir, resource_dir="resources/assets", lazy=True) is not assets
+        assert assets["config/model.yaml"].text() == "model: {}"
+
+        AssetManager.clear_instances()
+        assert AssetManager.get(tmpdir, resource_dir="resources/assets") is not assets
+
+
+def test_get_builds_once_under_concurrent_callers(monkeypatch, make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        built = []
+        real_build_index = AssetManager._build_index
+
+        def counting_build_index(self):
+            built.append(1)
+            return real_build_index(self)
+
+        monkeypatch.setattr(AssetManager, "_build_index", counting_build_index)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(AssetManager.get(tmpdir, resource_dir="resources/assets"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(built) == 1
+        assert all(manager is results[0] for manager in results)
+
+
+def test_get_does_not_cache_failures(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(FileNotFoundError):
+            AssetManager.get(tmpdir, resource_dir="resources/assets")
+        make_tree(Path(tmpdir))
+        assert AssetManager.get(tmpdir, resource_dir="resources/assets").list() == [
+            "config/model.yaml", "data/nested/deep.csv", "data/sample.csv", "readme.txt",
+        ]
+
+
+def test_generated_mapping_uses_shared_instance(make_tree):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_tree(Path(tmpdir))
+        generate_asset_mapping(Path(tmpdir), resource_dir="resources/assets")
+        namespace = {"__file__": os.path.join(tmpdir, "assets.py")}
+        exec((Path(tmpdir) / "assets.py").read_text(), namespace)
+
+        assert namespace["_assets"] is AssetManager.get(tmpdir, resource_dir="resources/assets")
+        assert namespace["assets"].config_model_yaml.text() == "model: {}"
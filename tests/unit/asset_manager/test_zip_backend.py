@@ -0,0 +1,98 @@
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.ziparchive import ZipArchive, ZipMember
+
+PAYLOAD = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def zipped_package(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        archive = Path(tmpdir) / "app.pyz"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("zipped_assets_pkg/__init__.py", "")
+            zf.writestr("zipped_assets_pkg/resources/assets/config/model.yaml", "model: {}")
+            zf.writestr("zipped_assets_pkg/resources/assets/weights.bin", PAYLOAD)
+            zf.writestr("zipped_assets_pkg/resources/assets/data/big.csv", "a,b\n" * 1000,
+                        compress_type=zipfile.ZIP_DEFLATED)
+        monkeypatch.syspath_prepend(str(archive))
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        yield archive, Path(cache_dir)
+        sys.modules.pop("zipped_assets_pkg", None)
+
+
+def test_zip_backend_indexes_central_directory(zipped_package):
+    assets = AssetManager(package_root="zipped_assets_pkg", resource_dir="resources/assets")
+
+    assert "zipped" in repr(assets)
+    assert assets.list() == ["config/model.yaml", "data/big.csv", "weights.bin"]
+    assert assets.listdir() == ["config/", "data/", "weights.bin"]
+    assert isinstance(assets["weights.bin"]._path, ZipMember)
+    assert assets["weights.bin"].size == len(PAYLOAD)
+    assert "missing.txt" not in assets
+
+
+def test_zip_backend_reads_stored_and_deflated_members(zipped_package):
+    assets = AssetManager(package_root="zipped_assets_pkg", resource_dir="resources/assets")
+
+    weights = assets["weights.bin"]
+    assert weights.bytes() == PAYLOAD
+    assert weights.read_range(250, 10) == PAYLOAD[250:260]
+    assert weights.read_range(len(PAYLOAD) - 2, 10) == PAYLOAD[-2:]
+    with weights.open("rb") as f:
+        f.seek(256)
+        assert f.read(4) == b"\x00\x01\x02\x03"
+
+    big = assets["data/big.csv"]
+    assert big.text() == "a,b\n" * 1000
+    assert big.read_range(4, 4) == b"a,b\n"
+    with assets["config/model.yaml"].open("r") as f:
+        assert f.read() == "model: {}"
+
+
+def test_zip_backend_extracts_only_for_real_paths(zipped_package):
+    archive, cache_dir = zipped_package
+    assets = AssetManager(package_root="zipped_assets_pkg", resource_dir="resources/assets")
+
+    asset = assets["config/model.yaml"]
+    repr(asset)
+    assert not (cache_dir / "extracted").exists()
+    path = Path(asset.path())
+    assert path.parent == cache_dir / "extracted"
+    assert path.read_text() == "model: {}"
+    with asset.memoryview() as view:
+        assert view.tobytes() == b"model: {}"
+
+
+def test_zip_archive_is_shared_per_file(zipped_package):
+    archive, _ = zipped_package
+    assert ZipArchive.open(str(archive)) is ZipArchive.open(str(archive))
+    assert ZipArchive.open(str(archive)).is_dir("zipped_assets_pkg/resources")
+
+
+def test_zip_backend_extracts_each_member_once(zipped_package, monkeypatch):
+    archive, cache_dir = zipped_package
+    assets = AssetManager(package_root="zipped_assets_pkg", resource_dir="resources/assets")
+    opened = []
+    real_open = ZipMember.open
+
+    def counting_open(self, *args, **kwargs):
+        opened.append(self.name)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(ZipMember, "open", counting_open)
+    paths = {assets["weights.bin"].path() for _ in range(5)}
+    assert len(paths) == 1
+    assert opened == ["weights.bin"]
+
+    # A new manager finds the extracted copy by the member's identity without reading it
+    other = AssetManager(package_root="zipped_assets_pkg", resource_dir="resources/assets")
+    assert other["weights.bin"].path() in paths
+    assert opened == ["weights.bin"]
+    assert Path(paths.pop()).read_bytes() == PAYLOAD
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from pathlib import Path
+
+from assetkit.asset_manager import AssetManager
+from assetkit.cache import ContentCache
+
+
+def test_content_cache_evicts_least_recently_used_by_size():
+    cache = ContentCache(max_bytes=10)
+    cache.put("a", b"aaaa", 4)
+    cache.put("b", b"bbbb", 4)
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.current_bytes == 8
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_content_cache_skips_oversized_values_and_stale_versions():
+    cache = ContentCache(max_bytes=4)
+    cache.put("big", b"12345", 5)
+    assert cache.get("big") is None
+
+    cache.put("k", b"v1", 2, version=(2, 1))
+    assert cache.get("k", version=(2, 1)) == b"v1"
+    assert cache.get("k", version=(2, 2)) is None
+    assert cache.stats().entries == 0
+
+
+def test_manager_cache_serves_repeated_reads_and_revalidates():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets_dir = Path(tmpdir) / "resources" / "assets"
+        assets_dir.mkdir(parents=True)
+        template = assets_dir / "page.html"
+        template.write_text("<p>v1</p>")
+
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", cache=1024)
+        for _ in range(3):
+            assert assets["page.html"].text() == "<p>v1</p>"
+            assert assets["page.html"].bytes() == b"<p>v1</p>"
+        stats = assets.cache.stats()
+        assert (stats.hits, stats.misses) == (4, 2)
+
+        template.write_text("<p>v2!</p>")
+        os.utime(template, ns=(0, 10**9))
+        assert assets["page.html"].text() == "<p>v2!</p>"
+
+
+def test_cached_text_is_sized_in_encoded_bytes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets_dir = Path(tmpdir) / "resources" / "assets"
+        assets_dir.mkdir(parents=True)
+        (assets_dir / "greek.txt").write_text("\u03b1\u03b2\u03b3\u03b4", encoding="utf-8")
+
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", cache=1024)
+        assert assets["greek.txt"].text() == "\u03b1\u03b2\u03b3\u03b4"
+        assert assets.cache.stats().current_bytes == 8
+
+        # 4 characters, but 8 bytes: too big for a 6-byte budget
+        small = AssetManager(package_root=tmpdir, resource_dir="resources/assets", cache=6)
+        small["greek.txt"].text()
+        assert small.cache.stats().entries == 0
@@ -0,0 +1,155 @@
+import filecmp
+import io
+import json
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from assetkit.internal.cli.apply_delta import apply_archive
+from assetkit.internal.cli.export_package import export_package_cli
+from assetkit.internal.generators import generate_asset_digests, generate_export_manifest
+from assetkit.internal.generators.generate_export_manifest import (
+    DELTA_FILENAME, DELTA_VERSION, EXPORT_STATE_FILENAME, load_export_manifest,
+)
+
+
+def make_project(root: Path) -> Path:
+    project = root / "demo"
+    assets = project / "demo" / "resources" / "assets"
+    (assets / "data").mkdir(parents=True)
+    (project / "setup.cfg").write_text("[metadata]\nname = demo\n")
+    (project / "demo" / "__init__.py").write_text("")
+    (assets / "config.yaml").write_text("model: {}")
+    (assets / "data" / "table.csv").write_text("a,b\n" * 1000)
+    (assets / "data" / "old.csv").write_text("x\n")
+    return project
+
+
+def export(**kwargs):
+    export_package_cli(SimpleNamespace(package="demo", **kwargs))
+
+
+def assert_same_tree(left: Path, right: Path):
+    # The target also holds the state file 'assetkit apply' keeps up to date
+    cmp = filecmp.dircmp(left, right, ignore=filecmp.DEFAULT_IGNORES + [EXPORT_STATE_FILENAME])
+    assert not (cmp.left_only or cmp.right_only or cmp.diff_files), (cmp.left_only, cmp.right_only, cmp.diff_files)
+    for sub in cmp.common_dirs:
+        assert_same_tree(left / sub, right / sub)
+
+
+def count_hashing(monkeypatch) -> list:
+    hashed = []
+    real_hash_stream = generate_export_manifest.hash_stream
+
+    def counting_hash_stream(open_stream):
+        hashed.append(1)
+        return real_hash_stream(open_stream)
+
+    monkeypatch.setattr(generate_export_manifest, "hash_stream", counting_hash_stream)
+    monkeypatch.setattr(generate_asset_digests, "hash_stream", counting_hash_stream)
+    return hashed
+
+
+def test_delta_export_round_trips_through_apply(tmp_path, monkeypatch, capsys):
+    project = make_project(tmp_path)
+    assets = project / "demo" / "resources" / "assets"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(tmp_path / "cache"))
+    export()
+    manifest = load_export_manifest(tmp_path / "demo.tar.gz")
+    assert "demo/demo/resources/assets/config.yaml" in manifest
+    site = tmp_path / "site"
+    assert apply_archive(tmp_path / "demo.tar.gz", site) is None
+    # The state file sits inside the project directory, so the archive keeps a single top-level directory
+    with tarfile.open(tmp_path / "demo.tar.gz", "r:gz") as tar:
+        assert {name.split("/")[0] for name in tar.getnames()} == {"demo"}
+    assert (site / "demo" / EXPORT_STATE_FILENAME).is_file()
+
+    # Nothing changed: no archive, and nothing is hashed again, even with a cold digest cache
+    monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(tmp_path / "cold-cache"))
+    hashed = count_hashing(monkeypatch)
+    export(since="demo.tar.gz")
+    assert "Nothing changed" in capsys.readouterr().out
+    assert not (tmp_path / "demo-delta.tar.gz").exists()
+    assert hashed == []
+
+    (assets / "config.yaml").write_text("model: {layers: 2}")
+    (assets / "data" / "old.csv").unlink()
+    (assets / "data" / "new.csv").write_text("y\n")
+    export(since="demo.tar.gz")
+
+    with tarfile.open(tmp_path / "demo-delta.tar.gz", "r:gz") as tar:
+        names = tar.getnames()
+        delta = json.loads(tar.extractfile(DELTA_FILENAME).read())
+    assert names[0] == DELTA_FILENAME
+    assert "demo/demo/resources/assets/data/table.csv" not in names
+    assert delta["added"] == ["demo/demo/resources/assets/data/new.csv"]
+    assert "demo/demo/resources/assets/config.yaml" in delta["changed"]
+    assert delta["removed"] == ["demo/demo/resources/assets/data/old.csv"]
+
+    assert apply_archive(tmp_path / "demo-delta.tar.gz", site)["base"] == "demo.tar.gz"
+    assert_same_tree(project, site / "demo")
+
+    # The delta's manifest describes the full tree, so deltas chain
+    (assets / "data" / "new.csv").unlink()
+    (assets / "data" / "table.csv").unlink()
+    (assets / "data").rmdir()
+    export(since="demo-delta.tar.gz", output="second.zip", format="zip")
+    apply_archive(tmp_path / "second.zip", site)
+    assert_same_tree(project, site / "demo")
+    assert not (site / "demo" / "demo" / "resources" / "assets" / "data").exists()
+
+
+def test_delta_export_requires_base_manifest_and_keeps_base(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        export(since="missing.tar.gz")
+    export()
+    with pytest.raises(SystemExit):
+        export(since="demo.tar.gz", output="demo.tar.gz")
+
+
+def test_apply_rejects_unsafe_tombstones(tmp_path):
+    archive = tmp_path / "evil.tar"
+    marker = json.dumps({"version": DELTA_VERSION, "removed": ["../outside.txt"]}).encode()
+    with tarfile.open(archive, "w") as tar:
+        info = tarfile.TarInfo(DELTA_FILENAME)
+        info.size = len(marker)
+        tar.addfile(info, io.BytesIO(marker))
+    (tmp_path / "outside.txt").write_text("keep")
+    with pytest.raises(ValueError, match="Unsafe tombstone"):
+        apply_archive(archive, tmp_path / "site")
+    assert (tmp_path / "outside.txt").exists()
+
+
+def test_apply_refuses_delta_on_wrong_base(tmp_path, monkeypatch):
+    project = make_project(tmp_path)
+    assets = project / "demo" / "resources" / "assets"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(tmp_path / "cache"))
+    export()
+    (assets / "config.yaml").write_text("model: {layers: 2}")
+    export(since="demo.tar.gz", output="first.tar.gz")
+    (assets / "config.yaml").write_text("model: {layers: 3}")
+    export(since="first.tar.gz", output="second.tar.gz")
+
+    # Never extracted the base
+    with pytest.raises(ValueError, match=EXPORT_STATE_FILENAME):
+        apply_archive(tmp_path / "first.tar.gz", tmp_path / "empty")
+
+    site = tmp_path / "site"
+    apply_archive(tmp_path / "demo.tar.gz", site)
+    # Skipping the first delta
+    with pytest.raises(ValueError, match="does not match the base"):
+        apply_archive(tmp_path / "second.tar.gz", site)
+    assert (site / "demo" / "demo" / "resources" / "assets" / "config.yaml").read_text() == "model: {}"
+
+    apply_archive(tmp_path / "first.tar.gz", site)
+    apply_archive(tmp_path / "second.tar.gz", site)
+    assert (site / "demo" / "demo" / "resources" / "assets" / "config.yaml").read_text() == "model: {layers: 3}"
+    # Applying the same delta twice is refused too
+    with pytest.raises(ValueError, match="does not match the base"):
+        apply_archive(tmp_path / "second.tar.gz", site)
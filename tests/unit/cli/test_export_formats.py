@@ -0,0 +1,65 @@
+import gzip
+import tarfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from assetkit.internal.cli.export_package import export_package_cli
+
+CSV = "".join(f"{i},{i * 2}\n" for i in range(20000))
+
+
+def make_project(root: Path) -> Path:
+    project = root / "demo"
+    assets = project / "demo" / "resources" / "assets"
+    assets.mkdir(parents=True)
+    (project / "setup.cfg").write_text("[metadata]\nname = demo\n")
+    (project / "demo" / "__init__.py").write_text("")
+    (assets / "table.csv").write_text(CSV)
+    (assets / "photo.png").write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(4096))
+    (assets / "blob.dat").write_bytes(gzip.compress(CSV.encode()))
+    (project / "demo" / "__pycache__").mkdir()
+    (project / "demo" / "__pycache__" / "x.pyc").write_bytes(b"")
+    return project
+
+
+@pytest.mark.parametrize("archive_format, extension, mode", [
+    ("tar", ".tar", "r:"),
+    ("gztar", ".tar.gz", "r:gz"),
+    ("xz", ".tar.xz", "r:xz"),
+])
+def test_export_writes_requested_tar_format(archive_format, extension, mode, tmp_path, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    export_package_cli(SimpleNamespace(package="demo", format=archive_format, level=3))
+
+    with tarfile.open(tmp_path / f"demo{extension}", mode) as tar:
+        names = tar.getnames()
+        assert tar.extractfile("demo/demo/resources/assets/table.csv").read() == CSV.encode()
+    assert "demo/setup.cfg" in names
+    assert not any("__pycache__" in name for name in names)
+
+
+def test_zip_export_stores_already_compressed_members(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    export_package_cli(SimpleNamespace(package="demo", format="zip"))
+
+    with zipfile.ZipFile(tmp_path / "demo.zip") as zf:
+        assert zf.testzip() is None
+        types = {info.filename.rsplit("/", 1)[-1]: info.compress_type for info in zf.infolist()}
+        assert zf.read("demo/demo/resources/assets/table.csv") == CSV.encode()
+    assert types["table.csv"] == zipfile.ZIP_DEFLATED
+    assert types["photo.png"] == zipfile.ZIP_STORED
+    # No telling suffix, but gzip magic bytes
+    assert types["blob.dat"] == zipfile.ZIP_STORED
+
+
+def test_unknown_format_is_rejected(tmp_path, monkeypatch, capsys):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        export_package_cli(SimpleNamespace(package="demo", format="rar"))
+    assert "Unknown archive format" in capsys.readouterr().out
@@ -0,0 +1,87 @@
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.compression import COMPRESSED_MANIFEST
+from assetkit.internal.generators.compress_assets import compress_assets
+from assetkit.internal.generators.generate_asset_index import generate_asset_index
+from assetkit.internal.generators.generate_asset_pack import generate_asset_pack
+
+CSV = "id,name,value\n" + "".join(f"{i},row{i},{i * 3}\n" for i in range(5000))
+
+
+def make_package(root: Path) -> Path:
+    assets = root / "resources" / "assets"
+    (assets / "data").mkdir(parents=True)
+    (assets / "data" / "table.csv").write_text(CSV)
+    (assets / "data" / "small.json").write_text("{}")
+    (assets / "data" / "archive.json.gz").write_bytes(gzip.compress(CSV.encode()))
+    (assets / "image.png").write_bytes(b"\x89PNG" + bytes(4096))
+    return assets
+
+
+@pytest.mark.parametrize("codec", ["gzip", "lzma", "zlib"])
+def test_compressed_assets_read_transparently(codec, monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        base = make_package(Path(tmpdir))
+        results = {r.key: r for r in compress_assets(tmpdir, codec=codec)}
+
+        assert results["data/table.csv"].skipped is None
+        assert results["data/table.csv"].ratio < 0.5
+        assert results["data/small.json"].skipped == "too small"
+        assert results["data/archive.json.gz"].skipped == "already compressed"
+        assert results["image.png"].skipped == "already compressed"
+        assert not (base / "data" / "table.csv").exists()
+
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        assert assets.list() == ["data/archive.json.gz", "data/small.json", "data/table.csv", "image.png"]
+        table = assets["data/table.csv"]
+        assert table.name == "table.csv"
+        assert table.suffix == ".csv"
+        assert table.size == len(CSV)
+        assert table.text() == CSV
+        assert table.bytes() == CSV.encode()
+        with table.open("r") as f:
+            assert f.readline() == "id,name,value\n"
+        assert b"".join(table.iter_chunks(4096)) == CSV.encode()
+        assert table.read_range(14, 10) == CSV.encode()[14:24]
+
+        # path() goes through the decompressed on-disk cache
+        path = Path(table.path())
+        assert path.parent == Path(cache_dir) / "decompressed"
+        assert path.read_text() == CSV
+        assert Path(table.path()) == path
+        with table.memoryview() as view:
+            assert view[:2].tobytes() == b"id"
+
+
+def test_compressed_keys_survive_index_pack_lazy_and_refresh():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_package(Path(tmpdir))
+        compress_assets(tmpdir, codec="gzip", patterns=["data/*.csv"])
+        manifest = json.loads((Path(tmpdir) / COMPRESSED_MANIFEST).read_text())
+        assert list(manifest["assets"]) == ["resources/assets/data/table.csv"]
+
+        generate_asset_index(tmpdir, resource_root="resources")
+        assert AssetManager(package_root=tmpdir)["data/table.csv"].text() == CSV
+
+        lazy = AssetManager(package_root=tmpdir, lazy=True, use_index=False)
+        assert lazy["data/table.csv"].text() == CSV
+        assert "data/table.csv.gz" not in lazy
+        assert lazy.list("data") == ["data/archive.json.gz", "data/small.json", "data/table.csv"]
+
+        generate_asset_pack(tmpdir, resource_root="resources")
+        assert AssetManager(package_root=tmpdir, use_pack=True)["data/table.csv"].bytes() == CSV.encode()
+
+        assets = AssetManager(package_root=tmpdir, use_index=False)
+        (base / "data" / "more.csv").write_text(CSV)
+        compress_assets(tmpdir, codec="zlib", patterns=["data/more.csv"])
+        changes = assets.refresh()
+        assert changes.added == ["data/more.csv"]
+        assert changes.removed == []
+        assert assets["data/more.csv"].text() == CSV
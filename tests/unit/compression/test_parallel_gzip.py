@@ -0,0 +1,57 @@
+import gzip
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+
+import pytest
+
+from assetkit.compression import ParallelGzipWriter
+
+DATA = b"".join(f"{i},row{i},{i * 3}\n".encode() for i in range(60000)) + os.urandom(50000)
+
+
+def compress(data: bytes, chunk: int = 7777, **kwargs) -> bytes:
+    out = io.BytesIO()
+    with ParallelGzipWriter(out, **kwargs) as writer:
+        for start in range(0, len(data), chunk):
+            writer.write(data[start:start + chunk])
+    assert not out.closed
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_output_is_a_single_standard_gzip_member(jobs):
+    compressed = compress(DATA, jobs=jobs, block_size=64 * 1024)
+    assert gzip.decompress(compressed) == DATA
+    # Priming each block with the previous window keeps the ratio close to plain gzip
+    assert len(compressed) < len(gzip.compress(DATA, 6)) * 1.01
+    if shutil.which("gzip"):
+        result = subprocess.run(["gzip", "-dc"], input=compressed, capture_output=True)
+        assert result.returncode == 0 and result.stdout == DATA
+
+
+def test_output_is_independent_of_thread_count_and_reproducible():
+    assert compress(DATA, jobs=1, block_size=32 * 1024) == compress(DATA, jobs=3, block_size=32 * 1024, chunk=100)
+    assert gzip.decompress(compress(b"")) == b""
+
+
+def test_tar_stream_through_writer_reads_back():
+    out = io.BytesIO()
+    with ParallelGzipWriter(out, level=1, jobs=2, block_size=16 * 1024) as writer, \
+            tarfile.open(fileobj=writer, mode="w|") as tar:
+        info = tarfile.TarInfo("pkg/data.csv")
+        info.size = len(DATA)
+        tar.addfile(info, io.BytesIO(DATA))
+    with tarfile.open(fileobj=io.BytesIO(out.getvalue()), mode="r:gz") as tar:
+        assert tar.extractfile("pkg/data.csv").read() == DATA
+
+
+def test_rejects_invalid_level_and_closed_writes():
+    with pytest.raises(ValueError):
+        ParallelGzipWriter(io.BytesIO(), level=10)
+    writer = ParallelGzipWriter(io.BytesIO())
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(b"x")
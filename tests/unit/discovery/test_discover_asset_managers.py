@@ -0,0 +1,106 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from assetkit import discovery
+from assetkit.discovery import DiscoveredManagers, discover_asset_managers
+
+
+class FakeEntryPoints(list):
+    def select(self, group):
+        return [ep for ep in self if ep.group == group]
+
+
+def make_asset_package(root: Path, name: str) -> str:
+    pkg = root / name
+    (pkg / "resources").mkdir(parents=True)
+    (pkg / "resources" / f"{name}.txt").write_text(name)
+    return str(pkg)
+
+
+def fake_entry_points(tmpdir):
+    root = Path(tmpdir)
+    eps = [
+        SimpleNamespace(group="assetkit.assets", name=name, value=make_asset_package(root, name))
+        for name in ("alpha", "beta")
+    ]
+    eps.append(SimpleNamespace(group="assetkit.assets", name="broken", value="not_an_installed_package_xyz"))
+    eps.append(SimpleNamespace(group="other.group", name="ignored", value="ignored"))
+    return FakeEntryPoints(eps)
+
+
+def test_discovery_builds_managers_on_first_access(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        monkeypatch.setattr(discovery, "entry_points", lambda: fake_entry_points(tmpdir))
+
+        managers = discover_asset_managers()
+        assert isinstance(managers, DiscoveredManagers)
+        assert sorted(managers.names()) == ["alpha", "beta", "broken"]
+        assert managers.loaded() == []
+
+        assert managers["alpha"].list() == ["alpha.txt"]
+        assert managers.loaded() == ["alpha"]
+        assert managers["alpha"] is managers["alpha"]
+
+
+def test_discovery_reports_failures_as_structured_results(monkeypatch, capsys):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        monkeypatch.setattr(discovery, "entry_points", lambda: fake_entry_points(tmpdir))
+
+        managers = discover_asset_managers(warm=True, max_workers=3)
+        assert sorted(managers.loaded()) == ["alpha", "beta"]
+        assert [(f.package, f.module) for f in managers.errors] == [("broken", "not_an_installed_package_xyz")]
+        assert isinstance(managers.errors[0].error, RuntimeError)
+        assert sorted(name for name, _ in managers.items()) == ["alpha", "beta"]
+        with pytest.raises(KeyError):
+            managers["broken"]
+        assert capsys.readouterr().out == ""
+
+
+def test_iteration_and_len_leave_out_failed_packages(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        monkeypatch.setattr(discovery, "entry_points", lambda: fake_entry_points(tmpdir))
+
+        managers = discover_asset_managers()
+        assert len(managers) == 2
+        assert sorted(managers) == ["alpha", "beta"]
+        assert sorted(dict(managers)) == ["alpha", "beta"]
+        assert "broken" not in managers
+        assert [f.package for f in managers.errors] == ["broken"]
+
+
+def test_cached_roots_are_hints_and_managers_use_the_module_name(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        site = Path(tmpdir) / "site"
+        make_asset_package(site, "assetkit_hint_pkg")
+        (site / "assetkit_hint_pkg" / "__init__.py").write_text("")
+        monkeypatch.syspath_prepend(str(site))
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        eps = FakeEntryPoints([SimpleNamespace(group="assetkit.assets", name="hint", value="assetkit_hint_pkg")])
+        monkeypatch.setattr(discovery, "entry_points", lambda: eps)
+
+        managers = discover_asset_managers()
+        # Built through importlib.resources, not as a filesystem path
+        assert managers["hint"]._package == "assetkit_hint_pkg"
+        assert not managers["hint"]._filesystem
+        assert managers.root("hint") == str(site / "assetkit_hint_pkg")
+
+        # A cached root is used as is while it exists, without a find_spec() call
+        real_resource_root = discovery._resource_root
+
+        def fail_resolve(module):
+            raise AssertionError("the cached root should have been used")
+
+        monkeypatch.setattr(discovery, "_resource_root", fail_resolve)
+        assert discover_asset_managers().root("hint") == str(site / "assetkit_hint_pkg")
+        monkeypatch.setattr(discovery, "_resource_root", real_resource_root)
+
+        # A stale one (e.g. after an upgrade) is resolved again
+        stale = DiscoveredManagers({"hint": "assetkit_hint_pkg"}, roots={"hint": str(Path(tmpdir) / "old")})
+        assert stale.root("hint") == str(site / "assetkit_hint_pkg")
+        assert stale["hint"].list() == ["assetkit_hint_pkg.txt"]
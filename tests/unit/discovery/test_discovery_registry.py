@@ -0,0 +1,51 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from assetkit import discovery
+from assetkit.discovery import environment_fingerprint, load_discovery_registry
+
+
+class FakeEntryPoints(list):
+    def select(self, group):
+        return [ep for ep in self if ep.group == group]
+
+
+def test_registry_is_cached_until_the_environment_changes(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        site = Path(tmpdir) / "site-packages"
+        (site / "alpha_assets").mkdir(parents=True)
+        (site / "alpha_assets" / "__init__.py").write_text("")
+        (site / "alpha_assets-0.1.0.dist-info").mkdir()
+        monkeypatch.setattr(discovery.sys, "path", [str(site)])
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+
+        scans = []
+
+        def fake_entry_points():
+            scans.append(1)
+            return FakeEntryPoints([SimpleNamespace(group="assetkit.assets", name="alpha", value="alpha_assets")])
+
+        monkeypatch.setattr(discovery, "entry_points", fake_entry_points)
+        monkeypatch.setattr(discovery, "_resource_root", lambda module: str(site / module))
+
+        first = load_discovery_registry()
+        assert first == {"alpha": {"module": "alpha_assets", "root": str(site / "alpha_assets")}}
+        assert load_discovery_registry() == first
+        assert len(scans) == 1
+
+        (site / "beta_assets-0.2.0.dist-info").mkdir()
+        load_discovery_registry()
+        assert len(scans) == 2
+
+        load_discovery_registry(refresh=True)
+        assert len(scans) == 3
+
+
+def test_fingerprint_tracks_dist_info_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        before = environment_fingerprint([tmpdir])
+        (Path(tmpdir) / "pkg-1.0.dist-info").mkdir()
+        after = environment_fingerprint([tmpdir])
+        assert before != after
+        assert environment_fingerprint([tmpdir]) == after
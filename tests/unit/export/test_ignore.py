@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+
+from assetkit.export import iter_export_files
+from assetkit.ignore import IGNORE_FILENAME, IgnoreRules, IgnoreStats, parse_ignore_pattern
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# comment", "/", "!"])
+def test_blank_and_comment_lines_are_skipped(line):
+    assert parse_ignore_pattern(line, "test") is None
+
+
+@pytest.mark.parametrize("path,is_dir,ignored", [
+    ("__pycache__", True, True),
+    ("pkg/__pycache__", True, True),
+    ("pkg/module.pyc", False, True),
+    ("my_pkg.egg-info", True, True),
+    ("pkg/build", True, True),
+    ("pkg/builder.py", False, False),
+    ("pkg/module.py", False, False),
+])
+def test_default_rules(tmp_path, path, is_dir, ignored):
+    rules = IgnoreRules.for_project(tmp_path)
+    assert (rules.match(path, is_dir) is not None) == ignored
+
+
+def test_gitignore_semantics():
+    rules = IgnoreRules.from_lines([
+        ".git/",
+        "/data/*.tmp",
+        "*.log",
+        "!keep.log",
+        "docs/**",
+        "a/**/b",
+        r"\#literal",
+    ])
+    # Directory-only rules do not match files of the same name
+    assert rules.match("sub/.git", is_dir=True).pattern == ".git/"
+    assert rules.match(".git", is_dir=False) is None
+    # A pattern containing "/" is anchored at the project root
+    assert rules.match("data/x.tmp") is not None
+    assert rules.match("sub/data/x.tmp") is None
+    # The last matching rule wins
+    assert rules.match("logs/run.log").source == ".assetkitignore:3"
+    assert rules.match("logs/keep.log") is None
+    assert rules.match("docs/api/index.md") is not None
+    assert rules.match("docs", is_dir=True) is None
+    assert rules.match("a/b", is_dir=True) is not None
+    assert rules.match("a/x/y/b") is not None
+    assert rules.match("#literal") is not None
+
+
+def test_project_rules_can_reinclude_defaults(tmp_path):
+    (tmp_path / IGNORE_FILENAME).write_text("!build\n")
+    rules = IgnoreRules.for_project(tmp_path)
+    assert rules.match("build", is_dir=True) is None
+    assert rules.match("dist", is_dir=True).source == "default"
+
+
+def make_project(root: Path) -> Path:
+    project = root / "demo"
+    (project / "demo" / "resources").mkdir(parents=True)
+    (project / "demo" / "resources" / "a.txt").write_text("a")
+    (project / "demo" / "resources" / "scratch.tmp").write_text("12345")
+    (project / "checkpoints" / "run1").mkdir(parents=True)
+    (project / "checkpoints" / "run1" / "model.pt").write_bytes(b"x" * 100)
+    (project / "checkpoints" / "last.pt").write_bytes(b"x" * 10)
+    (project / "demo" / "__pycache__").mkdir()
+    (project / "demo" / "__pycache__" / "m.pyc").write_bytes(b"xy")
+    (project / IGNORE_FILENAME).write_text("# local files\ncheckpoints/\n*.tmp\n")
+    return project
+
+
+def test_iter_export_files_prunes_ignored_directories(tmp_path, monkeypatch):
+    project = make_project(tmp_path)
+    names = sorted(arcname for _, arcname in iter_export_files(project))
+    assert names == ["demo/.assetkitignore", "demo/demo/resources/a.txt"]
+
+    # Pruned directories are not descended into when no stats are collected
+    walked = []
+    real_match = IgnoreRules.match
+
+    def spy(self, rel_path, is_dir=False):
+        walked.append(rel_path)
+        return real_match(self, rel_path, is_dir)
+
+    monkeypatch.setattr(IgnoreRules, "match", spy)
+    list(iter_export_files(project))
+    assert not any(path.startswith(("checkpoints/", "demo/__pycache__/")) for path in walked)
+
+
+def test_stats_count_skipped_files_and_bytes_per_rule(tmp_path):
+    project = make_project(tmp_path)
+    stats = IgnoreStats()
+    list(iter_export_files(project, stats=stats))
+    report = {rule.pattern: (files, size) for rule, files, size in stats.report()}
+    assert report == {"checkpoints/": (2, 110), "*.tmp": (1, 5), "__pycache__": (1, 2)}
+    assert [rule.pattern for rule, _, _ in stats.report()] == ["checkpoints/", "*.tmp", "__pycache__"]
@@ -0,0 +1,93 @@
+import io
+import os
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from assetkit import export as export_module
+from assetkit.export import read_ahead, stream_archive, stream_export, write_archive
+
+
+def make_project(root: Path) -> Path:
+    project = root / "demo"
+    assets = project / "demo" / "resources" / "assets"
+    assets.mkdir(parents=True)
+    (project / "setup.cfg").write_text("[metadata]\nname = demo\n")
+    (project / "demo" / "__pycache__").mkdir()
+    (project / "demo" / "__pycache__" / "x.pyc").write_bytes(b"")
+    for i in range(20):
+        (assets / f"small_{i}.txt").write_text(f"asset {i}\n" * 50)
+    (assets / "large.bin").write_bytes(os.urandom(3 * 1024 * 1024))
+    return project
+
+
+class PipeWriter(io.RawIOBase):
+    """Write-only, unseekable sink, like a pipe."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+def test_read_ahead_keeps_order_and_leaves_large_files_to_the_writer(tmp_path):
+    project = make_project(tmp_path)
+    files = sorted((p, p.name) for p in project.rglob("*.*") if p.is_file())
+    items = list(read_ahead(files, jobs=3, max_file_bytes=1024 * 1024, max_bytes=4 * 1024 * 1024))
+
+    assert [(item.path, item.arcname) for item in items] == files
+    for item in items:
+        if item.path.name == "large.bin":
+            assert item.data is None
+        else:
+            assert item.data == item.path.read_bytes()
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "gztar", "xztar"])
+def test_stream_export_yields_a_complete_tar(archive_format, tmp_path):
+    project = make_project(tmp_path)
+    chunks = list(stream_export(project, archive_format=archive_format, chunk_size=64 * 1024))
+    assert len(chunks) > 1
+
+    with tarfile.open(fileobj=io.BytesIO(b"".join(chunks)), mode="r:*") as tar:
+        names = tar.getnames()
+        large = tar.extractfile("demo/demo/resources/assets/large.bin").read()
+        small = tar.extractfile("demo/demo/resources/assets/small_3.txt").read()
+    assert len(names) == 22
+    assert not any("__pycache__" in name for name in names)
+    assert large == (project / "demo" / "resources" / "assets" / "large.bin").read_bytes()
+    assert small == b"asset 3\n" * 50
+
+
+def test_zip_is_written_to_an_unseekable_stream(tmp_path):
+    project = make_project(tmp_path)
+    sink = PipeWriter()
+    write_archive(sink, export_module.iter_export_files(project), "zip", members={"note.txt": b"hi"})
+
+    with zipfile.ZipFile(io.BytesIO(bytes(sink.data))) as zf:
+        assert zf.testzip() is None
+        assert zf.read("note.txt") == b"hi"
+        assert zf.read("demo/demo/resources/assets/small_0.txt") == b"asset 0\n" * 50
+        assert zf.getinfo("demo/demo/resources/assets/large.bin").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_closing_the_stream_early_stops_the_writer(tmp_path):
+    project = make_project(tmp_path)
+    stream = stream_export(project, archive_format="tar", chunk_size=16 * 1024)
+    next(stream)
+    stream.close()
+    assert not [t for t in threading.enumerate() if t.name == "assetkit-export"]
+
+
+def test_stream_errors_reach_the_consumer(tmp_path):
+    missing = [(tmp_path / "missing.txt", "missing.txt")]
+    with pytest.raises(FileNotFoundError):
+        list(stream_archive(missing, "tar"))
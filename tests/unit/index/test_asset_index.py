@@ -0,0 +1,120 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.index import AssetIndex, CompactAssetIndex, glob_to_regex
+
+KEYS = [
+    "configs/app.yaml",
+    "configs/prod/db.yaml",
+    "configs/prod/db.json",
+    "configs/prod.yaml",
+    "data/sample.csv",
+    "data/raw/2024/a.csv",
+    "models/base.pt",
+    "models/large.pt",
+    "readme.txt",
+]
+
+
+LAYOUTS = [AssetIndex, CompactAssetIndex]
+
+
+def make_index(layout=AssetIndex):
+    return layout({key: (len(key), 0) for key in KEYS})
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_glob_prefix_and_extension_queries(layout):
+    index = make_index(layout)
+    assert list(index.iter_glob("configs/**/*.yaml")) == [
+        "configs/app.yaml",
+        "configs/prod.yaml",
+        "configs/prod/db.yaml",
+    ]
+    assert list(index.iter_glob("configs/*.yaml")) == ["configs/app.yaml", "configs/prod.yaml"]
+    assert list(index.iter_glob("**/?.csv")) == ["data/raw/2024/a.csv"]
+    assert list(index.iter_glob("models/[!l]*")) == ["models/base.pt"]
+    assert list(index.iter_prefix("models/")) == ["models/base.pt", "models/large.pt"]
+    assert list(index.iter_suffix(".csv")) == ["data/raw/2024/a.csv", "data/sample.csv"]
+    assert list(index.iter_suffix("db.json")) == ["configs/prod/db.json"]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_glob_with_character_class_in_last_segment_skips_extension_bucket(layout):
+    index = layout({key: 0 for key in ["a/file.yaml", "a/other.json", "a/x.bin", "a/y.bin"]})
+    assert list(index.iter_glob("a/file[.]yaml")) == ["a/file.yaml"]
+    assert list(index.iter_glob("a/*.[jy]son")) == ["a/other.json"]
+    assert list(index.iter_glob("a/fil[e].yaml")) == ["a/file.yaml"]
+    assert list(index.iter_glob("a[!b]file.yaml")) == []
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_listdir_skips_whole_subtrees(layout):
+    index = make_index(layout)
+    assert index.listdir("") == ["configs/", "data/", "models/", "readme.txt"]
+    assert sorted(index.listdir("configs")) == ["app.yaml", "prod.yaml", "prod/"]
+    assert index.listdir("missing") == []
+
+
+def test_incremental_adds_keep_queries_sorted():
+    index = AssetIndex()
+    for key in reversed(KEYS):
+        index.add(key, key)
+    index.update({f"bulk/{i:02d}.yaml": i for i in range(10)})
+    assert index.keys() == sorted(KEYS + [f"bulk/{i:02d}.yaml" for i in range(10)])
+    assert len(list(index.iter_glob("**/*.yaml"))) == 13
+
+
+def test_glob_regex_does_not_cross_directories():
+    assert glob_to_regex("*.yaml").match("app.yaml")
+    assert not glob_to_regex("*.yaml").match("configs/app.yaml")
+    assert not glob_to_regex("a[!b]c").match("a/c")
+    assert not glob_to_regex("a[/x]c").match("a/c")
+    assert glob_to_regex("a[!b-]c").match("axc")
+    assert not glob_to_regex("a[!b-]c").match("a-c")
+
+
+def test_manager_queries_paginate_and_walk_lazily():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir) / "resources" / "assets"
+        for key in KEYS:
+            (base / key).parent.mkdir(parents=True, exist_ok=True)
+            (base / key).write_text(key)
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True)
+
+        first = assets.glob("configs/**/*.yaml", limit=2)
+        assert first == ["configs/app.yaml", "configs/prod.yaml"]
+        assert assets.glob("configs/**/*.yaml", limit=2, after=first[-1]) == ["configs/prod/db.yaml"]
+        assert "configs" in assets._walked and "data" not in assets._walked
+
+        assert assets.prefix("models/", limit=1) == ["models/base.pt"]
+        assert assets.listdir("data") == ["raw/", "sample.csv"]
+        assert assets.find(".csv") == ["data/raw/2024/a.csv", "data/sample.csv"]
+
+
+def test_compact_index_lookups_and_metadata():
+    index = make_index(CompactAssetIndex)
+    assert len(index) == len(KEYS)
+    assert index.keys() == sorted(KEYS)
+    assert "models/base.pt" in index
+    assert "models/missing.pt" not in index
+    assert index.get("data/sample.csv") == (len("data/sample.csv"), 0)
+    assert index.get("nope", "default") == "default"
+    assert CompactAssetIndex({"a/b.txt": None}).get("a/b.txt") is None
+
+
+def test_manager_with_compact_index_creates_handles_on_access():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir) / "resources" / "assets"
+        for key in KEYS:
+            (base / key).parent.mkdir(parents=True, exist_ok=True)
+            (base / key).write_text(key)
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", compact=True)
+
+        assert isinstance(assets._index, CompactAssetIndex)
+        assert assets.list() == sorted(KEYS)
+        assert assets["configs/prod/db.yaml"].text() == "configs/prod/db.yaml"
+        assert assets.glob("**/*.pt") == ["models/base.pt", "models/large.pt"]
@@ -0,0 +1,57 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.index import scan_tree
+
+
+def legacy_walk(path_obj, prefix=""):
+    keys = []
+    for item in path_obj.iterdir():
+        rel = os.path.join(prefix, item.name).replace("\\", "/")
+        if item.is_dir():
+            keys.extend(legacy_walk(item, rel))
+        else:
+            keys.append(rel)
+    return keys
+
+
+def make_tree(root: Path):
+    for d in range(3):
+        for s in range(4):
+            leaf = root / f"d{d}" / f"s{s}"
+            leaf.mkdir(parents=True)
+            for f in range(5):
+                (leaf / f"f{f}.txt").write_text(f"{d}{s}{f}")
+    (root / "empty" / "deeper").mkdir(parents=True)
+    (root / ".hidden").write_text("x")
+    if hasattr(os, "symlink"):
+        os.symlink(root / "d0", root / "linked_dir")
+        os.symlink(root / ".hidden", root / "linked_file")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_tree_matches_legacy_walker(workers):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_tree(root)
+
+        files, dirs = scan_tree(root, max_workers=workers)
+        assert sorted(files) == sorted(legacy_walk(root))
+        assert "empty/deeper" in dirs
+        assert len(files) == len(set(files))
+
+
+def test_manager_lazy_subtree_walk_uses_scan_tree():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir) / "resources" / "assets"
+        base.mkdir(parents=True)
+        make_tree(base)
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets", lazy=True, scan_workers=4)
+
+        assert len(assets.list("d1")) == 20
+        assert {"d1", "d1/s0", "d1/s3"} <= assets._walked
+        assert "d1/s2/f4.txt" in assets
@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.internal.generators.generate_asset_pack import PACK_FILENAME, generate_asset_pack
+from assetkit.pack import AssetPack
+
+
+def make_package(root: Path) -> Path:
+    assets = root / "resources" / "assets"
+    (assets / "config").mkdir(parents=True)
+    (assets / "data").mkdir()
+    (assets / "config" / "model.yaml").write_text("model: {}")
+    (assets / "data" / "sample.csv").write_text("a,b\n1,2\n")
+    (assets / "data" / "empty.bin").write_bytes(b"")
+    (assets / "weights.bin").write_bytes(bytes(range(256)) * 4)
+    return assets
+
+
+def test_pack_table_and_slices():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_package(Path(tmpdir))
+        pack_path = generate_asset_pack(tmpdir, resource_root="resources")
+        assert pack_path.name == PACK_FILENAME
+
+        pack = AssetPack.open(pack_path)
+        assert pack.root == "resources"
+        assert sorted(pack.files) == [
+            "resources/assets/config/model.yaml",
+            "resources/assets/data/empty.bin",
+            "resources/assets/data/sample.csv",
+            "resources/assets/weights.bin",
+        ]
+        assert all(offset % 8 == 0 for offset, _, _ in pack.files.values())
+        assert pack.view("resources/assets/config/model.yaml").tobytes() == b"model: {}"
+        assert pack.view("resources/assets/data/empty.bin").tobytes() == b""
+
+
+def test_manager_serves_assets_from_pack_when_resources_are_absent(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        make_package(Path(tmpdir))
+        generate_asset_pack(tmpdir, resource_root="resources")
+        shutil.rmtree(Path(tmpdir) / "resources")
+
+        assets = AssetManager(package_root=tmpdir, resource_dir="resources/assets")
+        assert "packed" in repr(assets)
+        assert assets.list() == ["config/model.yaml", "data/empty.bin", "data/sample.csv", "weights.bin"]
+        assert assets.listdir("data") == ["empty.bin", "sample.csv"]
+        assert assets["config/model.yaml"].text() == "model: {}"
+        assert assets["data/sample.csv"].size == 8
+
+        weights = assets["weights.bin"]
+        assert weights.bytes() == bytes(range(256)) * 4
+        assert weights.read_range(250, 10) == bytes([250, 251, 252, 253, 254, 255, 0, 1, 2, 3])
+        with weights.memoryview() as view:
+            assert view.readonly
+            assert view[:4].tobytes() == b"\x00\x01\x02\x03"
+        with weights.open("rb") as f:
+            f.seek(1020)
+            assert f.read() == bytes([252, 253, 254, 255])
+        assert b"".join(weights.iter_chunks(100)) == weights.bytes()
+        with assets["config/model.yaml"].open("r") as f:
+            assert f.read() == "model: {}"
+        assert assets.refresh() == ([], [], [])
+
+        # A real path is only produced on request, by extracting to the cache dir
+        extracted = Path(assets["config/model.yaml"].path())
+        assert extracted.parent == Path(cache_dir) / "extracted"
+        assert extracted.read_text() == "model: {}"
+
+
+def test_loose_tree_wins_over_pack_unless_requested():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = make_package(Path(tmpdir))
+        generate_asset_pack(tmpdir, resource_root="resources")
+        (base / "config" / "model.yaml").write_text("edited: true")
+
+        assert AssetManager(package_root=tmpdir)["config/model.yaml"].text() == "edited: true"
+        packed = AssetManager(package_root=tmpdir, use_pack=True)
+        assert packed["config/model.yaml"].text() == "model: {}"
+        with pytest.raises(FileNotFoundError):
+            AssetManager(package_root=tmpdir, resource_dir="other", use_pack=True)
+
+
+def test_package_opened_by_name_prefers_its_loose_tree(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        site = Path(tmpdir) / "site"
+        base = make_package(site / "assetkit_loose_pack_pkg")
+        (site / "assetkit_loose_pack_pkg" / "__init__.py").write_text("")
+        generate_asset_pack(site / "assetkit_loose_pack_pkg", resource_root="resources")
+        (base / "c.txt").write_text("new")
+        monkeypatch.syspath_prepend(str(site))
+
+        assets = AssetManager(package_root="assetkit_loose_pack_pkg")
+        assert "packed" not in repr(assets)
+        assert assets["c.txt"].text() == "new"
@@ -0,0 +1,82 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from assetkit import discovery
+from assetkit.asset_manager import AssetManager
+from assetkit.discovery import DiscoveredManagers
+from assetkit.registry import AssetRegistry
+
+
+def make_package(root: Path, name: str, files: dict) -> str:
+    base = root / name / "resources"
+    for key, content in files.items():
+        (base / key).parent.mkdir(parents=True, exist_ok=True)
+        (base / key).write_text(content)
+    return str(root / name)
+
+
+def make_targets(tmpdir):
+    root = Path(tmpdir)
+    return {
+        "base": make_package(root, "base", {"configs/app.yaml": "base", "configs/db.yaml": "base-db"}),
+        "override": make_package(root, "override", {"configs/app.yaml": "override", "models/m.pt": "m"}),
+    }
+
+
+def test_registry_merges_packages_with_precedence():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        targets = make_targets(tmpdir)
+        managers = {name: AssetManager(path, resource_dir="resources") for name, path in targets.items()}
+
+        registry = AssetRegistry(managers)
+        assert registry["configs/app.yaml"].text() == "base"
+        assert registry.providers("configs/app.yaml") == ["base", "override"]
+
+        registry = AssetRegistry(managers, precedence=["override"])
+        assert registry["configs/app.yaml"].text() == "override"
+        assert registry["base:configs/app.yaml"].text() == "base"
+        assert "override:configs/db.yaml" not in registry
+        with pytest.raises(KeyError):
+            registry["missing.txt"]
+
+        assert registry.glob("configs/*.yaml") == ["configs/app.yaml", "configs/db.yaml"]
+        assert registry.glob("**/*.yaml", qualified=True) == ["override:configs/app.yaml", "base:configs/db.yaml"]
+        assert registry.prefix("models/") == ["models/m.pt"]
+        assert registry.listdir() == ["configs/", "models/"]
+
+
+def test_persisted_registry_loads_without_building_managers():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        targets = make_targets(tmpdir)
+        index_path = Path(tmpdir) / "registry.json"
+        AssetRegistry(DiscoveredManagers(targets)).save(index_path, fingerprint="abc")
+
+        managers = DiscoveredManagers(targets)
+        assert AssetRegistry.load(index_path, managers, fingerprint="other") is None
+
+        registry = AssetRegistry.load(index_path, managers, precedence=["override"], fingerprint="abc")
+        assert managers.loaded() == []
+        assert registry.list() == ["configs/app.yaml", "configs/db.yaml", "models/m.pt"]
+        assert registry["configs/app.yaml"].text() == "override"
+        assert managers.loaded() == ["override"]
+
+
+def test_persisted_registry_is_rebuilt_when_an_editable_package_gains_assets(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        targets = make_targets(tmpdir)
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", str(Path(tmpdir) / "cache"))
+        eps = [SimpleNamespace(group="assetkit.assets", name=name, value=path) for name, path in targets.items()]
+        monkeypatch.setattr(discovery, "entry_points", lambda: SimpleNamespace(select=lambda group: eps))
+
+        assert AssetRegistry.from_discovery().list() == ["configs/app.yaml", "configs/db.yaml", "models/m.pt"]
+        reused = AssetRegistry.from_discovery()
+        assert reused._managers.loaded() == []
+
+        # A nested addition only changes the mtime of its own directory
+        new_asset = Path(targets["base"]) / "resources" / "configs" / "extra" / "new.yaml"
+        new_asset.parent.mkdir()
+        new_asset.write_text("new")
+        assert "configs/extra/new.yaml" in AssetRegistry.from_discovery().list()
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from assetkit.asset_manager import AssetManager
+from assetkit.internal.generators.compress_assets import compress_assets
+from assetkit.internal.generators import generate_asset_digests as digests_module
+from assetkit.internal.generators.generate_asset_digests import generate_asset_digests
+from assetkit.internal.generators.generate_asset_pack import generate_asset_pack
+from assetkit import verify as verify_module
+
+
+def make_package(root: Path) -> Path:
+    assets = root / "resources" / "assets"
+    (assets / "data").mkdir(parents=True)
+    (assets / "data" / "table.csv").write_text("a,b\n" * 2000)
+    (assets / "config.yaml").write_text("model: {}")
+    (assets / "weights.bin").write_bytes(os.urandom(100_000))
+    return assets
+
+
+def blake2(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def test_verify_detects_mismatched_missing_and_unexpected(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        base = make_package(Path(tmpdir))
+        generate_asset_digests(tmpdir, resource_root="resources")
+
+        result = AssetManager(package_root=tmpdir).verify()
+        assert result.ok and result.checked == 3
+        assert result.unexpected == []
+
+        (base / "config.yaml").write_text("model: {changed: true}")
+        (base / "data" / "table.csv").unlink()
+        (base / "extra.txt").write_text("new")
+        result = AssetManager(package_root=tmpdir).verify()
+        assert not result
+        assert result.mismatched == ["config.yaml"]
+        assert result.missing == ["data/table.csv"]
+        assert result.unexpected == ["extra.txt"]
+
+
+def test_verify_reuses_cached_results_for_unchanged_files(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        base = make_package(Path(tmpdir))
+        generate_asset_digests(tmpdir, resource_root="resources")
+        assert AssetManager(package_root=tmpdir).verify()
+        assert (Path(cache_dir) / verify_module.VERIFY_CACHE_FILENAME).exists()
+
+        hashed = []
+        real_hash_stream = verify_module.hash_stream
+
+        def counting_hash_stream(open_stream):
+            hashed.append(1)
+            return real_hash_stream(open_stream)
+
+        monkeypatch.setattr(verify_module, "hash_stream", counting_hash_stream)
+        assert AssetManager(package_root=tmpdir).verify()
+        assert hashed == []
+
+        # Same size, new contents: the mtime changes, so the file is hashed again
+        data = (base / "weights.bin").read_bytes()
+        (base / "weights.bin").write_bytes(bytes(reversed(data)))
+        os.utime(base / "weights.bin", ns=(0, os.stat(base / "weights.bin").st_mtime_ns + 1_000_000))
+        result = AssetManager(package_root=tmpdir).verify()
+        assert result.mismatched == ["weights.bin"]
+        assert len(hashed) == 1
+
+
+def test_generate_asset_digests_reuses_cache_for_unchanged_files(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        base = make_package(Path(tmpdir))
+        compress_assets(tmpdir, patterns=["data/*.csv"])
+        cache_path = Path(cache_dir) / verify_module.VERIFY_CACHE_FILENAME
+        first = generate_asset_digests(tmpdir, resource_root="resources", cache=verify_module.VerifyCache(cache_path))
+        recorded = first.read_text()
+
+        hashed = []
+        real_hash_stream = digests_module.hash_stream
+
+        def counting_hash_stream(open_stream):
+            hashed.append(1)
+            return real_hash_stream(open_stream)
+
+        monkeypatch.setattr(digests_module, "hash_stream", counting_hash_stream)
+        generate_asset_digests(tmpdir, resource_root="resources", cache=verify_module.VerifyCache(cache_path))
+        assert hashed == []
+        assert first.read_text() == recorded
+
+        (base / "config.yaml").write_text("model: {changed: true}")
+        generate_asset_digests(tmpdir, resource_root="resources", cache=verify_module.VerifyCache(cache_path))
+        assert len(hashed) == 1
+        assert AssetManager(package_root=tmpdir).verify(use_cache=False)
+
+
+def test_digest_reads_manifest_and_covers_compressed_and_packed_assets(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv("ASSETKIT_CACHE_DIR", cache_dir)
+        base = make_package(Path(tmpdir))
+        weights = (base / "weights.bin").read_bytes()
+        compress_assets(tmpdir, patterns=["data/*.csv"])
+        generate_asset_digests(tmpdir, resource_root="resources")
+
+        assets = AssetManager(package_root=tmpdir)
+        assert assets["data/table.csv"].digest() == blake2(("a,b\n" * 2000).encode())
+        assert assets["weights.bin"].digest() == blake2(weights)
+        assert assets.verify(use_cache=False)
+
+        # The recorded digest is returned without reading the file
+        (base / "weights.bin").write_bytes(b"tampered")
+        assert AssetManager(package_root=tmpdir)["weights.bin"].digest() == blake2(weights)
+        (base / "weights.bin").write_bytes(weights)
+
+        generate_asset_pack(tmpdir, resource_root="resources")
+        packed = AssetManager(package_root=tmpdir, use_pack=True)
+        assert packed.verify(use_cache=False)
+
+
+def test_verify_requires_digest_manifest():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_package(Path(tmpdir))
+        assets = AssetManager(package_root=tmpdir)
+        with pytest.raises(FileNotFoundError):
+            assets.verify()
+        assert assets["config.yaml"].digest() == blake2(b"model: {}")